@@ -0,0 +1,370 @@
+"""
+API Load Benchmark
+Starts the mock LLM server and the API (in-memory session store, LLM cache
+off), then drives each endpoint at a fixed concurrency and reports p50/p95/p99
+latency and requests/s per scenario. Each run is saved under
+benchmarks/results/ tagged with the git commit and compared with the
+previous saved run, so regressions between commits show up as deltas.
+
+Usage (from backend/):
+    python -m benchmarks.bench_api [--scenarios upload,analyze-jd,generate-bullets,batch,history]
+        [--requests 200] [--concurrency 20]
+        [--llm-latency 0.3] [--llm-tokens-per-second 400] [--llm-malformed-rate 0.0]
+        [--llm-rpm-limit 0] [--llm-tpm-limit 0]
+        [--target http://127.0.0.1:8000]  # benchmark an API that is already running
+"""
+
+import argparse
+import asyncio
+import glob
+import json
+import math
+import os
+import socket
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Optional
+
+import httpx
+
+from benchmarks.corpus import jd_corpus, pdf_corpus
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(BACKEND_DIR, "benchmarks", "results")
+
+SCENARIOS = ["upload", "analyze-jd", "generate-bullets", "batch", "history"]
+
+
+# ────────────────────────────────────────────
+# Servers
+# ────────────────────────────────────────────
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _wait_until_up(url: str, process: subprocess.Popen, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Server for {url} exited with code {process.returncode}")
+        try:
+            httpx.get(url, timeout=1.0)
+            return
+        except httpx.TransportError:
+            time.sleep(0.2)
+    raise RuntimeError(f"Server for {url} did not start within {timeout:g}s")
+
+
+def start_servers(args) -> tuple[str, list[subprocess.Popen]]:
+    """Launch the mock LLM and the API as subprocesses; return the API URL."""
+    llm_port, api_port = _free_port(), _free_port()
+    llm = subprocess.Popen(
+        [
+            sys.executable, "-m", "benchmarks.mock_llm",
+            "--port", str(llm_port),
+            "--latency", str(args.llm_latency),
+            "--tokens-per-second", str(args.llm_tokens_per_second),
+            "--malformed-rate", str(args.llm_malformed_rate),
+            "--rpm-limit", str(args.llm_rpm_limit),
+            "--tpm-limit", str(args.llm_tpm_limit),
+        ],
+        cwd=BACKEND_DIR,
+    )
+    env = {
+        **os.environ,
+        "GROQ_BASE_URL": f"http://127.0.0.1:{llm_port}/v1",
+        "GROQ_API_KEY": "bench",
+        "SESSION_STORE_BACKEND": "memory",
+        # Every request should reach the (mock) LLM
+        "LLM_CACHE_ENABLED": "false",
+        # The client-side limiter mirrors the mock's limits, or stays out of the way
+        "LLM_RATE_LIMIT_ENABLED": "true" if args.llm_rpm_limit or args.llm_tpm_limit else "false",
+        "LLM_RPM_LIMIT": str(args.llm_rpm_limit or 1_000_000),
+        "LLM_TPM_LIMIT": str(args.llm_tpm_limit or 1_000_000_000),
+    }
+    api = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "main:app",
+            "--port", str(api_port),
+            "--workers", str(args.workers),
+            "--log-level", "warning",
+        ],
+        cwd=BACKEND_DIR,
+        env=env,
+    )
+    processes = [llm, api]
+    try:
+        _wait_until_up(f"http://127.0.0.1:{llm_port}/stats", llm)
+        _wait_until_up(f"http://127.0.0.1:{api_port}/", api)
+    except Exception:
+        stop_servers(processes)
+        raise
+    return f"http://127.0.0.1:{api_port}", processes
+
+
+def stop_servers(processes: list[subprocess.Popen]) -> None:
+    for process in processes:
+        process.terminate()
+    for process in processes:
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+# ────────────────────────────────────────────
+# Scenarios
+# ────────────────────────────────────────────
+
+Request = Callable[[httpx.AsyncClient, int], Awaitable[httpx.Response]]
+
+
+async def build_scenarios(client: httpx.AsyncClient, names: list[str]) -> dict[str, Request]:
+    """Prepare payloads (untimed) and return one request function per scenario."""
+    pdfs = pdf_corpus(20)
+    jds = jd_corpus(200)
+    parsed_resumes = []
+    if set(names) & {"generate-bullets", "batch"}:
+        for i, pdf in enumerate(pdfs):
+            response = await client.post(
+                "/api/upload-resume",
+                files={"file": (f"resume-{i}.pdf", pdf, "application/pdf")},
+            )
+            response.raise_for_status()
+            parsed_resumes.append(response.json()["parsed_resume"])
+
+    async def upload(c: httpx.AsyncClient, i: int) -> httpx.Response:
+        return await c.post(
+            "/api/upload-resume",
+            files={"file": (f"resume-{i}.pdf", pdfs[i % len(pdfs)], "application/pdf")},
+        )
+
+    async def analyze_jd(c: httpx.AsyncClient, i: int) -> httpx.Response:
+        return await c.post("/api/analyze-jd", json={"jd_text": jds[i % len(jds)]})
+
+    async def generate_bullets(c: httpx.AsyncClient, i: int) -> httpx.Response:
+        return await c.post("/api/generate-bullets", json={
+            "parsed_resume": parsed_resumes[i % len(parsed_resumes)],
+            "jd_text": jds[i % len(jds)],
+        })
+
+    async def batch(c: httpx.AsyncClient, i: int) -> httpx.Response:
+        return await c.post("/api/generate-bullets/batch", json={
+            "parsed_resume": parsed_resumes[i % len(parsed_resumes)],
+            "jd_texts": [jds[(i + k) % len(jds)] for k in range(3)],
+        })
+
+    async def history(c: httpx.AsyncClient, i: int) -> httpx.Response:
+        # One save for every three list reads, spread over 50 users
+        user_id = f"bench-user-{i % 50}"
+        if i % 4 == 0:
+            return await c.post("/api/history", json={
+                "user_id": user_id,
+                "jd_text": jds[i % len(jds)],
+                "bullets": [{"rewritten": "Built a placement portal using React."}],
+                "ats_scores": {"before_score": 40, "after_score": 60, "missing_keywords": ["docker"]},
+                "jd_keywords": ["react", "docker"],
+            })
+        return await c.get("/api/history", params={"user_id": user_id, "summary": "true"})
+
+    available = {
+        "upload": upload,
+        "analyze-jd": analyze_jd,
+        "generate-bullets": generate_bullets,
+        "batch": batch,
+        "history": history,
+    }
+    return {name: available[name] for name in names}
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    request: Request,
+    total: int,
+    concurrency: int,
+) -> dict:
+    """Issue total requests with at most concurrency in flight; summarize latencies."""
+    latencies: list[float] = []
+    errors = 0
+    next_index = 0
+
+    async def worker() -> None:
+        nonlocal errors, next_index
+        while next_index < total:
+            i = next_index
+            next_index += 1
+            started = time.perf_counter()
+            try:
+                response = await request(client, i)
+                failed = response.status_code >= 400
+            except httpx.HTTPError:
+                failed = True
+            latencies.append(time.perf_counter() - started)
+            errors += failed
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    return summarize(latencies, errors, elapsed)
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def summarize(latencies: list[float], errors: int, elapsed: float) -> dict:
+    values = sorted(latencies)
+    return {
+        "requests": len(values),
+        "errors": errors,
+        "p50_ms": round(percentile(values, 50) * 1000, 1),
+        "p95_ms": round(percentile(values, 95) * 1000, 1),
+        "p99_ms": round(percentile(values, 99) * 1000, 1),
+        "mean_ms": round(sum(values) / len(values) * 1000, 1) if values else 0.0,
+        "requests_per_second": round(len(values) / elapsed, 2) if elapsed else 0.0,
+    }
+
+
+# ────────────────────────────────────────────
+# Results
+# ────────────────────────────────────────────
+
+def _git_commit() -> tuple[str, bool]:
+    """(short commit hash, working tree dirty) or ("unknown", False)."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=BACKEND_DIR, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+        dirty = bool(subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            cwd=BACKEND_DIR, capture_output=True, text=True, check=True,
+        ).stdout.strip())
+        return commit, dirty
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown", False
+
+
+def latest_result() -> Optional[dict]:
+    paths = sorted(glob.glob(os.path.join(RESULTS_DIR, "api-*.json")))
+    if not paths:
+        return None
+    with open(paths[-1], encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_result(result: dict) -> str:
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    path = os.path.join(RESULTS_DIR, f"api-{stamp}-{result['commit']}.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(result, f, indent=2)
+    return path
+
+
+def print_report(result: dict, previous: Optional[dict]) -> None:
+    baseline = previous["scenarios"] if previous else {}
+    header = f"{'scenario':<18}{'reqs':>6}{'err':>5}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'req/s':>9}"
+    if previous:
+        header += f"   vs {previous['commit']}: p95 / req/s"
+    print(header)
+    for name, stats in result["scenarios"].items():
+        line = (
+            f"{name:<18}{stats['requests']:>6}{stats['errors']:>5}"
+            f"{stats['p50_ms']:>9.1f}{stats['p95_ms']:>9.1f}{stats['p99_ms']:>9.1f}"
+            f"{stats['requests_per_second']:>9.1f}"
+        )
+        before = baseline.get(name)
+        if before:
+            line += f"   {_delta(before['p95_ms'], stats['p95_ms']):>8} / {_delta(before['requests_per_second'], stats['requests_per_second'])}"
+        print(line)
+
+
+def _delta(before: float, after: float) -> str:
+    if not before:
+        return "n/a"
+    return f"{(after - before) / before * 100:+.1f}%"
+
+
+# ────────────────────────────────────────────
+# Entry point
+# ────────────────────────────────────────────
+
+async def run(args, base_url: str) -> dict:
+    names = [n.strip() for n in args.scenarios.split(",") if n.strip()]
+    unknown = set(names) - set(SCENARIOS)
+    if unknown:
+        raise SystemExit(f"Unknown scenarios: {', '.join(sorted(unknown))}")
+
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=base_url, timeout=120.0, limits=limits) as client:
+        scenarios = await build_scenarios(client, names)
+        results = {}
+        for name, request in scenarios.items():
+            # Warm up connections, JD store and parse workers before timing
+            await run_scenario(client, request, min(args.concurrency, args.requests), args.concurrency)
+            results[name] = await run_scenario(client, request, args.requests, args.concurrency)
+            print(f"  {name}: done", file=sys.stderr)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load-test the API against a mock LLM.")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS))
+    parser.add_argument("--requests", type=int, default=200, help="timed requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn workers for the API")
+    parser.add_argument("--llm-latency", type=float, default=0.3)
+    parser.add_argument("--llm-tokens-per-second", type=float, default=400.0)
+    parser.add_argument("--llm-malformed-rate", type=float, default=0.0)
+    parser.add_argument("--llm-rpm-limit", type=int, default=0, help="mock 429s above this RPM")
+    parser.add_argument("--llm-tpm-limit", type=int, default=0, help="mock 429s above this TPM")
+    parser.add_argument("--target", help="URL of an already running API (skips starting servers)")
+    parser.add_argument("--no-save", action="store_true", help="don't write a results file")
+    args = parser.parse_args()
+
+    processes = []
+    base_url = args.target
+    if base_url is None:
+        base_url, processes = start_servers(args)
+    try:
+        scenarios = asyncio.run(run(args, base_url))
+    finally:
+        stop_servers(processes)
+
+    commit, dirty = _git_commit()
+    result = {
+        "commit": commit + ("-dirty" if dirty else ""),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "config": {
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "workers": args.workers,
+            "llm_latency": args.llm_latency,
+            "llm_tokens_per_second": args.llm_tokens_per_second,
+            "llm_malformed_rate": args.llm_malformed_rate,
+            "llm_rpm_limit": args.llm_rpm_limit,
+            "llm_tpm_limit": args.llm_tpm_limit,
+            "target": args.target,
+        },
+        "scenarios": scenarios,
+    }
+    previous = latest_result()
+    if previous and previous["config"] != result["config"]:
+        print(f"Note: previous run ({previous['commit']}) used a different config; deltas are indicative only.")
+    print_report(result, previous)
+    if not args.no_save:
+        print(f"\nSaved {save_result(result)}")
+
+
+if __name__ == "__main__":
+    main()
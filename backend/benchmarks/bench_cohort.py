@@ -0,0 +1,55 @@
+"""
+Cohort Scoring Benchmark
+Times score_cohort on a synthetic students × JDs cohort and compares it with
+per-pair calculate_ats_score calls (sampled and extrapolated).
+
+Usage (from backend/):
+    python -m benchmarks.bench_cohort [--students 2000] [--jds 300]
+"""
+
+import argparse
+import time
+
+from benchmarks.corpus import jd_corpus, resume_corpus
+from services.ats_scorer import calculate_ats_score
+from services.cohort_scorer import score_cohort
+from services.keyword_extractor import extract_weighted_keywords
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--students", type=int, default=2000)
+    parser.add_argument("--jds", type=int, default=300)
+    parser.add_argument("--sample-pairs", type=int, default=2000)
+    args = parser.parse_args()
+
+    resumes = list(enumerate(resume_corpus(args.students)))
+    jds = list(enumerate(jd_corpus(args.jds)))
+
+    start = time.perf_counter()
+    result = score_cohort(resumes, jds)
+    result.top_k(5)
+    matrix_time = time.perf_counter() - start
+
+    # Per-pair baseline on a sample, checked against the matrix
+    jd_keywords = [extract_weighted_keywords(text) for _, text in jds]
+    mismatches = 0
+    start = time.perf_counter()
+    for n in range(args.sample_pairs):
+        i, j = n % len(resumes), (n * 7) % len(jds)
+        keywords = [kw for kw, _ in jd_keywords[j]]
+        weights = [w for _, w in jd_keywords[j]]
+        score = calculate_ats_score(resumes[i][1], keywords, keyword_weights=weights)["before_score"]
+        mismatches += score != result.scores[i, j]
+    per_pair = (time.perf_counter() - start) / args.sample_pairs
+    pairwise_estimate = per_pair * len(resumes) * len(jds)
+
+    print(f"cohort:            {len(resumes)} students x {len(jds)} JDs")
+    print(f"matrix + top-5:    {matrix_time:8.2f} s")
+    print(f"per-pair estimate: {pairwise_estimate:8.2f} s  ({per_pair * 1e6:.0f} us/pair)")
+    print(f"speedup:           {pairwise_estimate / matrix_time:8.1f}x")
+    print(f"sample mismatches: {mismatches}/{args.sample_pairs}")
+
+
+if __name__ == "__main__":
+    main()
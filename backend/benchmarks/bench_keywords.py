@@ -0,0 +1,97 @@
+"""
+JD Keyword Extraction Benchmark
+Compares keyword_extractor against the original unigram counter on a
+synthetic JD corpus: time per JD, and how many of each JD's required skills
+(its "Hands-on experience with ..." lines) make the top keywords, with
+multi-word skills counted only when kept whole.
+
+Usage (from backend/):
+    python -m benchmarks.bench_keywords [--jds 2000] [--repeat 5] [--top 10]
+"""
+
+import argparse
+import re
+import time
+from collections import Counter
+
+from benchmarks.corpus import jd_corpus
+from services.keyword_extractor import extract_jd_keywords
+from services.tech_terms import canonical
+
+_REQUIRED_RE = re.compile(r"^- Hands-on experience with (.+)$", re.MULTILINE)
+
+
+def _legacy_extract_jd_keywords(jd_text: str) -> list[str]:
+    """The extractor as it was before phrases and section weights, kept for comparison."""
+    stop_words = {
+        'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+        'of', 'with', 'by', 'from', 'is', 'are', 'was', 'were', 'be', 'been',
+        'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
+        'could', 'should', 'may', 'might', 'shall', 'can', 'this', 'that',
+        'these', 'those', 'i', 'me', 'my', 'we', 'our', 'you', 'your', 'he',
+        'she', 'it', 'they', 'them', 'their', 'its', 'not', 'no', 'nor',
+        'as', 'if', 'then', 'than', 'so', 'up', 'out', 'about', 'into',
+        'through', 'during', 'before', 'after', 'above', 'below', 'between',
+        'same', 'each', 'every', 'all', 'both', 'few', 'more', 'most',
+        'other', 'some', 'such', 'only', 'own', 'also', 'just', 'very',
+        'any', 'who', 'which', 'what', 'where', 'when', 'how', 'able',
+        'across', 'within', 'including', 'well', 'must', 'role', 'work',
+        'working', 'using', 'based', 'etc', 'like', 'new', 'good', 'great',
+        'looking', 'join', 'team', 'company', 'position', 'candidate',
+        'required', 'preferred', 'years', 'experience', 'strong',
+    }
+    text = jd_text.lower()
+    text = re.sub(r'[^a-z0-9\s.#+\-]', ' ', text)
+    words = re.findall(r'[a-z][a-z0-9.#+\-]*[a-z0-9+#]|[a-z]', text)
+    keywords = [w for w in words if w not in stop_words and len(w) > 1]
+    return [word for word, _ in Counter(keywords).most_common(50)]
+
+
+def _time(fn, corpus: list[str], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in corpus:
+            fn(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _recall(fn, corpus: list[str], top: int) -> tuple[float, float]:
+    """(share of required skills in the top keywords, same for multi-word skills only)."""
+    found = total = phrase_found = phrase_total = 0
+    for text in corpus:
+        keywords = set(fn(text)[:top])
+        for skill in _REQUIRED_RE.findall(text):
+            hit = canonical(skill) in keywords or skill.lower() in keywords
+            found += hit
+            total += 1
+            if " " in skill:
+                phrase_found += hit
+                phrase_total += 1
+    return found / total, phrase_found / phrase_total if phrase_total else 0.0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--jds", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    corpus = jd_corpus(args.jds)
+
+    legacy = _time(_legacy_extract_jd_keywords, corpus, args.repeat)
+    current = _time(extract_jd_keywords, corpus, args.repeat)
+    legacy_recall, legacy_phrases = _recall(_legacy_extract_jd_keywords, corpus, args.top)
+    current_recall, current_phrases = _recall(extract_jd_keywords, corpus, args.top)
+
+    print(f"jds:                  {len(corpus)}")
+    print(f"legacy:               {legacy * 1000:8.1f} ms  ({legacy / len(corpus) * 1e6:6.1f} us/jd)")
+    print(f"current:              {current * 1000:8.1f} ms  ({current / len(corpus) * 1e6:6.1f} us/jd)")
+    print(f"required in top {args.top:<3}   legacy {legacy_recall:6.1%}   current {current_recall:6.1%}")
+    print(f"phrases in top {args.top:<3}    legacy {legacy_phrases:6.1%}   current {current_phrases:6.1%}")
+
+
+if __name__ == "__main__":
+    main()
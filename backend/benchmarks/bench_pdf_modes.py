@@ -0,0 +1,71 @@
+"""
+PDF Extraction Mode Benchmark
+Compares pdf_parser's "text" and "layout" modes. Accuracy comes from
+styled synthetic resumes (bold headings, some two-column, some headings
+sharing a line with body text): the share of each resume's items found
+under the right section. Throughput comes from the styled corpus and from
+the plain single-column corpus.
+
+Usage (from backend/):
+    python -m benchmarks.bench_pdf_modes [--resumes 200] [--repeat 3]
+"""
+
+import argparse
+import time
+
+from benchmarks.corpus import pdf_corpus, styled_pdf_corpus
+from services.pdf_parser import EXTRACTION_MODES, extract_text_from_pdf
+
+
+def _normalize(text: str) -> str:
+    return " ".join(text.replace("•", " ").replace("·", " ").split())
+
+
+def _accuracy(corpus, mode: str, two_column: bool) -> float:
+    found = total = 0
+    for data, truth, is_two_column in corpus:
+        if is_two_column != two_column:
+            continue
+        sections = extract_text_from_pdf(data, mode=mode)["sections"]
+        for section, items in truth.items():
+            content = _normalize(sections.get(section, ""))
+            for item in items:
+                found += _normalize(item) in content
+                total += 1
+    return found / total if total else 0.0
+
+
+def _time(pdfs: list[bytes], mode: str, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for data in pdfs:
+            extract_text_from_pdf(data, mode=mode)
+        best = min(best, time.perf_counter() - start)
+    return best / len(pdfs)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--resumes", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    styled = styled_pdf_corpus(args.resumes)
+    plain = pdf_corpus(args.resumes)
+    styled_pdfs = [data for data, _, _ in styled]
+
+    print(f"resumes: {len(styled)} styled ({sum(c for _, _, c in styled)} two-column), {len(plain)} plain")
+    print(f"{'mode':<8}{'1-col acc':>11}{'2-col acc':>11}{'styled ms':>11}{'plain ms':>10}")
+    for mode in EXTRACTION_MODES:
+        print(
+            f"{mode:<8}"
+            f"{_accuracy(styled, mode, False):>11.1%}"
+            f"{_accuracy(styled, mode, True):>11.1%}"
+            f"{_time(styled_pdfs, mode, args.repeat) * 1000:>11.2f}"
+            f"{_time(plain, mode, args.repeat) * 1000:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
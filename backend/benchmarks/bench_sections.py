@@ -0,0 +1,95 @@
+"""
+Section Splitter Micro-benchmark
+Compares pdf_parser._extract_sections against the original per-line,
+per-pattern implementation on a synthetic resume corpus.
+
+Usage (from backend/):
+    python -m benchmarks.bench_sections [--resumes 2000] [--repeat 5]
+"""
+
+import argparse
+import re
+import time
+
+from benchmarks.corpus import resume_corpus
+from services.pdf_parser import _extract_sections
+
+
+def _legacy_extract_sections(text: str) -> dict:
+    """The splitter as it was before precompilation, kept for comparison."""
+    heading_patterns = [
+        r'(?i)\b(education)\b',
+        r'(?i)\b(experience|work\s*experience|professional\s*experience)\b',
+        r'(?i)\b(projects|personal\s*projects|academic\s*projects)\b',
+        r'(?i)\b(skills|technical\s*skills|core\s*competencies)\b',
+        r'(?i)\b(certifications?|certificates?)\b',
+        r'(?i)\b(achievements?|awards?|honors?)\b',
+        r'(?i)\b(summary|objective|profile)\b',
+        r'(?i)\b(extracurricular|activities|volunteering)\b',
+    ]
+    heading_map = {
+        'education': 'Education', 'experience': 'Experience',
+        'work experience': 'Experience', 'professional experience': 'Experience',
+        'projects': 'Projects', 'personal projects': 'Projects', 'academic projects': 'Projects',
+        'skills': 'Skills', 'technical skills': 'Skills', 'core competencies': 'Skills',
+        'certifications': 'Certifications', 'certificates': 'Certifications',
+        'certification': 'Certifications', 'certificate': 'Certifications',
+        'achievements': 'Achievements', 'awards': 'Achievements', 'honors': 'Achievements',
+        'achievement': 'Achievements', 'award': 'Achievements', 'honor': 'Achievements',
+        'summary': 'Summary', 'objective': 'Summary', 'profile': 'Summary',
+        'extracurricular': 'Activities', 'activities': 'Activities', 'volunteering': 'Activities',
+    }
+    lines = text.split('\n')
+    sections = {}
+    current_section = "Header"
+    current_content = []
+    for line in lines:
+        matched = False
+        for pattern in heading_patterns:
+            match = re.search(pattern, line.strip())
+            if match and len(line.strip().split()) <= 5:
+                if current_content:
+                    sections[current_section] = '\n'.join(current_content).strip()
+                raw_heading = match.group(1).lower().strip()
+                current_section = heading_map.get(raw_heading, raw_heading.title())
+                current_content = []
+                matched = True
+                break
+        if not matched:
+            current_content.append(line)
+    if current_content:
+        sections[current_section] = '\n'.join(current_content).strip()
+    return sections
+
+
+def _time(fn, corpus: list[str], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in corpus:
+            fn(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--resumes", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    corpus = resume_corpus(args.resumes)
+
+    mismatches = sum(_extract_sections(t) != _legacy_extract_sections(t) for t in corpus)
+    legacy = _time(_legacy_extract_sections, corpus, args.repeat)
+    current = _time(_extract_sections, corpus, args.repeat)
+
+    print(f"resumes:    {len(corpus)}")
+    print(f"mismatches: {mismatches}")
+    print(f"legacy:     {legacy * 1000:8.1f} ms  ({legacy / len(corpus) * 1e6:6.1f} us/resume)")
+    print(f"current:    {current * 1000:8.1f} ms  ({current / len(corpus) * 1e6:6.1f} us/resume)")
+    print(f"speedup:    {legacy / current:6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
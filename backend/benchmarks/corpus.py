@@ -0,0 +1,251 @@
+"""
+Synthetic Corpus
+Deterministic generator for fake student resumes and JDs, so benchmarks can
+run offline and produce comparable numbers between commits.
+"""
+
+import random
+
+HEADINGS = [
+    "EDUCATION", "Experience", "Work Experience", "PROJECTS", "Academic Projects",
+    "Technical Skills", "Certifications", "Achievements", "Summary", "Extracurricular Activities",
+]
+
+SKILLS = [
+    "Python", "Java", "C++", "JavaScript", "React", "Node.js", "SQL", "MySQL", "MongoDB",
+    "Docker", "Kubernetes", "AWS", "Git", "Flask", "Django", "Spring Boot", "TensorFlow",
+    "Pandas", "NumPy", "Machine Learning", "Data Structures", "Algorithms", "REST APIs",
+    "HTML", "CSS", "Tailwind", "Excel", "Power BI", "Linux", "Go", "Kotlin", "Firebase",
+]
+
+VERBS = [
+    "Built", "Designed", "Developed", "Implemented", "Led", "Optimized", "Automated",
+    "Deployed", "Migrated", "Refactored", "Analyzed", "Created",
+]
+
+OBJECTS = [
+    "a placement portal", "an attendance tracker", "a REST API", "a chatbot",
+    "a recommendation engine", "an e-commerce site", "a data pipeline",
+    "a hostel management system", "a sentiment classifier", "a library app",
+]
+
+RESULTS = [
+    "used by 300+ students", "cutting load time by 40%", "serving 1k daily requests",
+    "improving accuracy to 92%", "reducing manual work by 5 hours a week",
+    "adopted by the college coding club",
+]
+
+COMPANIES = ["TCS", "Infosys", "Wipro", "Flipkart", "Zoho", "Razorpay", "Swiggy", "Accenture"]
+
+
+def make_bullet(rng: random.Random) -> str:
+    skills = ", ".join(rng.sample(SKILLS, 2))
+    return f"• {rng.choice(VERBS)} {rng.choice(OBJECTS)} using {skills}, {rng.choice(RESULTS)}."
+
+
+def make_resume(rng: random.Random, bullets_per_section: int = 6) -> str:
+    """One plain-text resume with contact header and 6-8 sections."""
+    name = f"Student {rng.randint(1000, 9999)}"
+    lines = [
+        name,
+        f"{name.lower().replace(' ', '.')}@college.edu.in | +91 98{rng.randint(10000000, 99999999)}",
+        f"linkedin.com/in/{name.lower().replace(' ', '-')} | github.com/{name.lower().replace(' ', '')}",
+    ]
+    for heading in rng.sample(HEADINGS, rng.randint(6, 8)):
+        lines.append("")
+        lines.append(heading)
+        if "Skill" in heading:
+            lines.append(", ".join(rng.sample(SKILLS, 12)))
+            continue
+        for _ in range(bullets_per_section):
+            lines.append(make_bullet(rng))
+    return "\n".join(lines)
+
+
+def make_jd(rng: random.Random) -> str:
+    """One JD with an about-us blurb, responsibilities and requirements."""
+    company = rng.choice(COMPANIES)
+    required = rng.sample(SKILLS, 8)
+    return "\n".join([
+        f"About {company}",
+        f"{company} is one of India's fastest growing technology companies.",
+        "",
+        "Responsibilities",
+        *(f"- {rng.choice(VERBS)} {rng.choice(OBJECTS)} with {s}" for s in required[:4]),
+        "",
+        "Requirements",
+        *(f"- Hands-on experience with {s}" for s in required),
+        f"- Strong fundamentals in {rng.choice(SKILLS)} and {rng.choice(SKILLS)}",
+    ])
+
+
+def resume_corpus(n: int, seed: int = 7) -> list[str]:
+    rng = random.Random(seed)
+    return [make_resume(rng) for _ in range(n)]
+
+
+def jd_corpus(n: int, seed: int = 11) -> list[str]:
+    rng = random.Random(seed)
+    return [make_jd(rng) for _ in range(n)]
+
+
+def make_resume_pdf(text: str) -> bytes:
+    """Render a plain-text resume into a one- or two-page PDF."""
+    import fitz
+
+    doc = fitz.open()
+    lines = text.split("\n")
+    # ~50 lines of 10pt text fit on an A4 page with 54pt margins
+    for start in range(0, len(lines), 50):
+        page = doc.new_page(width=595, height=842)
+        page.insert_textbox(
+            fitz.Rect(54, 54, 541, 788),
+            "\n".join(lines[start:start + 50]),
+            fontsize=10,
+        )
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+def pdf_corpus(n: int, seed: int = 7) -> list[bytes]:
+    return [make_resume_pdf(text) for text in resume_corpus(n, seed)]
+
+
+# Styled resumes for the layout benchmark: one heading spelling per expected section
+STYLED_HEADINGS = {
+    "Education": ["EDUCATION", "Education"],
+    "Experience": ["EXPERIENCE", "Work Experience"],
+    "Projects": ["PROJECTS", "Academic Projects"],
+    "Skills": ["TECHNICAL SKILLS", "Skills"],
+    "Certifications": ["CERTIFICATIONS", "Certifications"],
+    "Achievements": ["ACHIEVEMENTS", "Awards"],
+}
+
+# Sections placed in the narrow left column of two-column resumes
+SIDEBAR_SECTIONS = ("Education", "Skills", "Certifications")
+
+DEGREES = ["B.Tech Computer Science", "B.E. Information Technology", "BCA", "M.Tech Data Science"]
+CERTIFICATES = ["AWS Cloud Practitioner", "Google Data Analytics", "Meta Front-End Developer", "NPTEL Java"]
+
+_PAGE_W, _PAGE_H = 595, 842
+_MARGIN = 40
+_BOTTOM = _PAGE_H - 50
+
+
+def _styled_items(rng: random.Random, section: str) -> list[str]:
+    if section == "Education":
+        return [
+            f"{rng.choice(DEGREES)}, {rng.choice(COMPANIES)} Institute, {rng.randint(2022, 2026)}"
+            for _ in range(2)
+        ]
+    if section == "Skills":
+        return [", ".join(rng.sample(SKILLS, 8))]
+    if section == "Certifications":
+        return [f"{c} ({rng.randint(2022, 2025)})" for c in rng.sample(CERTIFICATES, 2)]
+    return [make_bullet(rng) for _ in range(rng.randint(2, 3))]
+
+
+def _wrap(text: str, width: float, fontname: str, size: float, first_width: float) -> list[str]:
+    """Greedy word wrap; the first line may be narrower (text after an inline heading)."""
+    import fitz
+
+    lines: list[str] = []
+    current = ""
+    for word in text.split():
+        candidate = f"{current} {word}" if current else word
+        limit = first_width if not lines else width
+        if current and fitz.get_text_length(candidate, fontname=fontname, fontsize=size) > limit:
+            lines.append(current)
+            current = word
+        else:
+            current = candidate
+    if current:
+        lines.append(current)
+    return lines
+
+
+def make_styled_resume_pdf(rng: random.Random, two_column: bool = False) -> tuple[bytes, dict[str, list[str]]]:
+    """
+    One styled resume PDF: a large bold name, bold 12pt section headings and
+    10pt body text. Two-column resumes put the sidebar sections in a narrow
+    left column and draw both columns row by row, the way many resume
+    builders do, so the content stream interleaves the columns. Skills
+    sections sometimes share a line with their heading ("Skills: Python, ...").
+
+    Returns:
+        (pdf bytes, {section name: body items}) — the sections a parser should find
+    """
+    import fitz
+
+    name = f"Student {rng.randint(1000, 9999)}"
+    contact = (
+        f"{name.lower().replace(' ', '.')}@college.edu.in | +91 98{rng.randint(10000000, 99999999)} | "
+        f"linkedin.com/in/{name.lower().replace(' ', '-')}"
+    )
+    # (page, y, x, text, font, size)
+    ops: list[tuple[int, float, float, str, str, float]] = [
+        (0, 60, _MARGIN, name, "hebo", 20),
+        (0, 80, _MARGIN, contact, "helv", 9),
+    ]
+
+    if two_column:
+        columns = {"left": [_MARGIN, 160, 0, 110.0], "right": [230, _PAGE_W - _MARGIN - 230, 0, 110.0]}
+    else:
+        columns = {"main": [_MARGIN, _PAGE_W - 2 * _MARGIN, 0, 110.0]}
+
+    truth: dict[str, list[str]] = {}
+    for section in rng.sample(list(STYLED_HEADINGS), rng.randint(5, 6)):
+        heading = rng.choice(STYLED_HEADINGS[section])
+        items = _styled_items(rng, section)
+        truth[section] = items
+        column = columns["main"] if not two_column else columns["left" if section in SIDEBAR_SECTIONS else "right"]
+        x, width = column[0], column[1]
+
+        def advance(step: float) -> None:
+            column[3] += step
+            if column[3] > _BOTTOM:
+                column[2] += 1
+                column[3] = 60.0
+
+        advance(8)
+        inline = section == "Skills" and not two_column and rng.random() < 0.5
+        if inline:
+            label = f"{heading}:"
+            offset = fitz.get_text_length(label, fontname="hebo", fontsize=12) + 4
+            ops.append((column[2], column[3], x, label, "hebo", 12))
+            lines = _wrap(items[0], width, "helv", 10, width - offset)
+            ops.append((column[2], column[3], x + offset, lines[0], "helv", 10))
+            for line in lines[1:]:
+                advance(12.5)
+                ops.append((column[2], column[3], x, line, "helv", 10))
+            advance(16)
+            continue
+
+        ops.append((column[2], column[3], x, heading, "hebo", 12))
+        advance(16)
+        for item in items:
+            for line in _wrap(item, width, "helv", 10, width):
+                ops.append((column[2], column[3], x, line, "helv", 10))
+                advance(12.5)
+            advance(3)
+
+    doc = fitz.open()
+    for page_index, y, x, text, font, size in sorted(ops, key=lambda op: (op[0], op[1], op[2])):
+        while doc.page_count <= page_index:
+            doc.new_page(width=_PAGE_W, height=_PAGE_H)
+        doc[page_index].insert_text((x, y), text, fontname=font, fontsize=size)
+    data = doc.tobytes()
+    doc.close()
+    return data, truth
+
+
+def styled_pdf_corpus(n: int, seed: int = 13) -> list[tuple[bytes, dict[str, list[str]], bool]]:
+    """(pdf, expected sections, two_column) for n styled resumes, half of them two-column."""
+    rng = random.Random(seed)
+    corpus = []
+    for i in range(n):
+        two_column = i % 2 == 1
+        data, truth = make_styled_resume_pdf(rng, two_column)
+        corpus.append((data, truth, two_column))
+    return corpus
@@ -0,0 +1,319 @@
+"""
+Mock LLM Server
+Local OpenAI-compatible stand-in for Groq, so the API can be load-tested
+without network access or credits. Serves POST /v1/chat/completions (plain
+and streamed) with a canned, schema-valid answer for whichever engine sent
+the prompt, after a configurable first-token latency and at a configurable
+token rate. A configurable share of answers is truncated into invalid JSON.
+Optional RPM/TPM limits answer with Groq-style x-ratelimit-* headers and
+429s with Retry-After.
+
+Usage (from backend/):
+    python -m benchmarks.mock_llm [--port 9100] [--latency 0.3] [--tokens-per-second 400]
+        [--malformed-rate 0.0] [--rpm-limit 0] [--tpm-limit 0]
+Then start the API with GROQ_BASE_URL=http://127.0.0.1:9100/v1.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import re
+import time
+import uuid
+from collections import deque
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+# Rough chars-per-token ratio for English JSON, used for usage and pacing
+CHARS_PER_TOKEN = 4
+
+CANNED = {
+    "bullets": {
+        "bullets": [
+            {
+                "original": "Built a placement portal using React and Node.js.",
+                "rewritten": "Developed a placement portal with React and Node.js REST APIs, used by 300+ students.",
+                "jd_keywords_used": ["react", "node.js", "rest"],
+                "rationale": "Surfaced the JD's stack and the existing usage metric.",
+            },
+            {
+                "original": "Automated attendance tracking with Python.",
+                "rewritten": "Automated attendance tracking in Python, reducing manual work by 5 hours a week.",
+                "jd_keywords_used": ["python", "automation"],
+                "rationale": "Led with the JD keyword and kept the resume's own outcome.",
+            },
+            {
+                "original": "Designed a MySQL schema for a library app.",
+                "rewritten": "Designed a normalized MySQL schema for a library app serving 1k daily requests.",
+                "jd_keywords_used": ["sql", "mysql"],
+                "rationale": "Mapped the JD's SQL requirement to real database work.",
+            },
+        ],
+        "match_analysis": {
+            "strong_matches": ["Python", "React"],
+            "partial_matches": ["SQL"],
+            "gaps": ["Kubernetes"],
+        },
+    },
+    "rewrite": {
+        "optimized_bullet": "Developed a placement portal with React and Node.js, used by 300+ students.",
+        "original_source_snippet": "Built a placement portal using React and Node.js.",
+        "mapping_logic": "Same project and stack; reworded with the JD's phrasing.",
+        "honesty_check": "Pass",
+    },
+    "roadmap": {
+        "identified_gaps": [
+            {
+                "skill": "Docker",
+                "frequency": "3/5",
+                "impact_score": "8",
+                "learning_path": [
+                    {
+                        "resource_name": "Docker for Beginners",
+                        "provider": "YouTube",
+                        "link_placeholder": "docker tutorial for beginners",
+                        "estimated_time": "1 week",
+                    }
+                ],
+            }
+        ],
+        "overall_readiness_summary": "Strong fundamentals; containerization is the main gap.",
+    },
+    "interview": {
+        "project_summary": "A placement portal built with React and Node.js. It tracks applications per student.",
+        "interview_prep": [
+            {
+                "category": category,
+                "question": f"{category} question about the placement portal?",
+                "intent": "Check ownership of the implementation.",
+                "hint_for_student": "Answer with the specific choices from the project.",
+            }
+            for category in (
+                "Architectural Choice",
+                "Edge Case Handling",
+                "Data/State Management",
+                "Optimization",
+                "Conflict/Challenge",
+            )
+        ],
+    },
+    "assessment": {
+        "predicted_company": "Infosys",
+        "assessment_tier": "Mass Recruiter",
+        "test_pattern": {
+            "provider": "HackerRank",
+            "sections": [
+                {"name": "Quantitative Aptitude", "difficulty": "Medium", "focus_topics": ["Probability"]},
+                {"name": "Coding", "difficulty": "2 Easy DSA problems", "languages": ["Python"]},
+            ],
+        },
+        "preparation_roadmap": "1. Aptitude sets 2. Two easy DSA problems daily 3. One mock test",
+    },
+}
+
+# A phrase unique to each engine's system prompt
+ENGINE_MARKERS = [
+    ("several of a student's resume bullet points", "rewrite_batch"),
+    ("Rewrite Engine", "rewrite"),
+    ("Career Roadmap Architect", "roadmap"),
+    ("Senior Technical Interviewer", "interview"),
+    ("Placement Intelligence Agent", "assessment"),
+]
+
+
+def detect_engine(messages: list[dict]) -> str:
+    system = next((m.get("content", "") for m in messages if m.get("role") == "system"), "")
+    for marker, engine in ENGINE_MARKERS:
+        if marker in system:
+            return engine
+    return "bullets"
+
+
+def create_app(
+    latency: float = 0.3,
+    tokens_per_second: float = 400.0,
+    malformed_rate: float = 0.0,
+    seed: int = 0,
+    rpm_limit: int = 0,
+    tpm_limit: int = 0,
+) -> FastAPI:
+    """
+    Build the mock server.
+
+    Args:
+        latency: seconds before the first token
+        tokens_per_second: generation speed after the first token (0 = instant)
+        malformed_rate: share of answers truncated into invalid JSON
+        seed: RNG seed for which answers are malformed
+        rpm_limit: requests per rolling minute before 429s (0 = unlimited)
+        tpm_limit: tokens (prompt + max_tokens) per rolling minute (0 = unlimited)
+    """
+    app = FastAPI(title="Mock LLM")
+    rng = random.Random(seed)
+    stats = {"requests": 0, "streamed": 0, "malformed": 0, "rate_limited": 0}
+    # (timestamp, tokens) of requests admitted in the last minute
+    window: deque[tuple[float, int]] = deque()
+
+    def admit(body: dict) -> dict | JSONResponse:
+        """Apply the rolling-minute limits; rate-limit headers or a 429 response."""
+        if not rpm_limit and not tpm_limit:
+            return {}
+        now = time.monotonic()
+        while window and window[0][0] <= now - 60:
+            window.popleft()
+        prompt_chars = sum(len(m.get("content", "")) for m in body.get("messages", []))
+        cost = prompt_chars // CHARS_PER_TOKEN + body.get("max_tokens", 0)
+        used_tokens = sum(tokens for _, tokens in window)
+        over_requests = rpm_limit and len(window) >= rpm_limit
+        over_tokens = tpm_limit and used_tokens + cost > tpm_limit
+        if over_requests or over_tokens:
+            stats["rate_limited"] += 1
+            retry_after = max(window[0][0] + 60 - now, 0.1) if window else 1.0
+            return JSONResponse(
+                status_code=429,
+                content={"error": {"message": "Rate limit reached", "type": "tokens", "code": "rate_limit_exceeded"}},
+                headers={"retry-after": f"{retry_after:.2f}"},
+            )
+        window.append((now, cost))
+        headers = {}
+        if rpm_limit:
+            headers["x-ratelimit-limit-requests"] = str(rpm_limit)
+            headers["x-ratelimit-remaining-requests"] = str(rpm_limit - len(window))
+            headers["x-ratelimit-reset-requests"] = f"{window[0][0] + 60 - now:.2f}s"
+        if tpm_limit:
+            headers["x-ratelimit-limit-tokens"] = str(tpm_limit)
+            headers["x-ratelimit-remaining-tokens"] = str(tpm_limit - used_tokens - cost)
+            headers["x-ratelimit-reset-tokens"] = f"{window[0][0] + 60 - now:.2f}s"
+        return headers
+
+    def answer(body: dict) -> str:
+        messages = body.get("messages", [])
+        engine = detect_engine(messages)
+        if engine == "rewrite_batch":
+            # One entry per "[i] ..." experience line in the user prompt
+            user = next((m.get("content", "") for m in messages if m.get("role") == "user"), "")
+            count = len(re.findall(r"^\[\d+\] ", user, re.MULTILINE))
+            content = json.dumps({
+                "rewrites": [{"index": i, **CANNED["rewrite"]} for i in range(count)]
+            })
+        else:
+            content = json.dumps(CANNED[engine])
+        if malformed_rate and rng.random() < malformed_rate:
+            stats["malformed"] += 1
+            content = content[: rng.randint(1, len(content) - 1)]
+        return content
+
+    def usage(body: dict, content: str) -> dict:
+        prompt_chars = sum(len(m.get("content", "")) for m in body.get("messages", []))
+        prompt_tokens = prompt_chars // CHARS_PER_TOKEN
+        completion_tokens = len(content) // CHARS_PER_TOKEN
+        return {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        }
+
+    def generation_seconds(content: str) -> float:
+        if not tokens_per_second:
+            return 0.0
+        return len(content) / CHARS_PER_TOKEN / tokens_per_second
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        stats["requests"] += 1
+        headers = admit(body)
+        if isinstance(headers, JSONResponse):
+            return headers
+        content = answer(body)
+        completion_id = f"chatcmpl-{uuid.uuid4().hex[:24]}"
+        created = int(time.time())
+        model = body.get("model", "mock")
+
+        if not body.get("stream"):
+            await asyncio.sleep(latency + generation_seconds(content))
+            return JSONResponse({
+                "id": completion_id,
+                "object": "chat.completion",
+                "created": created,
+                "model": model,
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": content},
+                    "finish_reason": "stop",
+                }],
+                "usage": usage(body, content),
+            }, headers=headers)
+
+        stats["streamed"] += 1
+
+        async def events():
+            await asyncio.sleep(latency)
+            # Emit a few tokens per chunk; sleeping per token costs more than it models
+            step = CHARS_PER_TOKEN * 8
+            pause = generation_seconds(content[:step])
+            for i in range(0, len(content), step):
+                chunk = {
+                    "id": completion_id,
+                    "object": "chat.completion.chunk",
+                    "created": created,
+                    "model": model,
+                    "choices": [{
+                        "index": 0,
+                        "delta": {"content": content[i:i + step]},
+                        "finish_reason": None,
+                    }],
+                }
+                yield f"data: {json.dumps(chunk)}\n\n"
+                if pause:
+                    await asyncio.sleep(pause)
+            # Groq reports stream usage on the final chunk under x_groq
+            final = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": model,
+                "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}],
+                "x_groq": {"usage": usage(body, content)},
+            }
+            yield f"data: {json.dumps(final)}\n\n"
+            yield "data: [DONE]\n\n"
+
+        return StreamingResponse(events(), media_type="text/event-stream", headers=headers)
+
+    @app.get("/stats")
+    async def get_stats():
+        return stats
+
+    return app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="OpenAI-compatible mock LLM server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9100)
+    parser.add_argument("--latency", type=float, default=0.3, help="seconds to first token")
+    parser.add_argument("--tokens-per-second", type=float, default=400.0)
+    parser.add_argument("--malformed-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--rpm-limit", type=int, default=0)
+    parser.add_argument("--tpm-limit", type=int, default=0)
+    args = parser.parse_args()
+
+    import uvicorn
+
+    app = create_app(
+        args.latency,
+        args.tokens_per_second,
+        args.malformed_rate,
+        args.seed,
+        args.rpm_limit,
+        args.tpm_limit,
+    )
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
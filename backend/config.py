@@ -1,11 +1,12 @@
 import os
+import tempfile
 from dotenv import load_dotenv
 
 load_dotenv()
 
 # Groq API — OpenAI-compatible endpoint
 GROQ_API_KEY = os.getenv("GROQ_API_KEY", "")
-GROQ_BASE_URL = "https://api.groq.com/openai/v1"
+GROQ_BASE_URL = os.getenv("GROQ_BASE_URL", "https://api.groq.com/openai/v1")
 GROQ_MODEL = "llama-3.3-70b-versatile"
 
 # Firebase
@@ -21,3 +22,90 @@ ALLOWED_ORIGINS = [
 
 # Upload limits
 MAX_FILE_SIZE_MB = 10
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# PDF parsing (process pool so PyMuPDF never runs on the event loop)
+PDF_PARSE_WORKERS = int(os.getenv("PDF_PARSE_WORKERS", str(min(4, os.cpu_count() or 1))))
+PDF_PARSE_MAX_PENDING = int(os.getenv("PDF_PARSE_MAX_PENDING", "64"))
+PDF_PARSE_TIMEOUT_SECONDS = float(os.getenv("PDF_PARSE_TIMEOUT_SECONDS", "15"))
+PDF_MAX_PAGES = int(os.getenv("PDF_MAX_PAGES", "10"))
+# "text" (plain page text) or "layout" (font-aware headings, two-column reading order)
+PDF_EXTRACTION_MODE = os.getenv("PDF_EXTRACTION_MODE", "text")
+
+# Parsed-resume cache keyed by PDF content hash (re-uploads skip PyMuPDF)
+RESUME_CACHE_ENABLED = os.getenv("RESUME_CACHE_ENABLED", "true").lower() == "true"
+RESUME_CACHE_MAX_ENTRIES = int(os.getenv("RESUME_CACHE_MAX_ENTRIES", "512"))
+RESUME_CACHE_TTL_SECONDS = int(os.getenv("RESUME_CACHE_TTL_SECONDS", str(30 * 24 * 3600)))
+RESUME_CACHE_DB_PATH = os.getenv("RESUME_CACHE_DB_PATH", "")  # empty = memory only
+RESUME_CACHE_DB_MAX_ENTRIES = int(os.getenv("RESUME_CACHE_DB_MAX_ENTRIES", "20000"))
+
+# LLM gateway (shared async client used by every engine)
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "256"))
+LLM_TIMEOUT_SECONDS = float(os.getenv("LLM_TIMEOUT_SECONDS", "30"))
+LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "3"))
+LLM_RETRY_BASE_DELAY = float(os.getenv("LLM_RETRY_BASE_DELAY", "0.5"))
+# Client-side Groq rate limiting (per worker process; adapts to x-ratelimit-* headers)
+LLM_RATE_LIMIT_ENABLED = os.getenv("LLM_RATE_LIMIT_ENABLED", "true").lower() == "true"
+LLM_RPM_LIMIT = float(os.getenv("LLM_RPM_LIMIT", "30"))
+LLM_TPM_LIMIT = float(os.getenv("LLM_TPM_LIMIT", "12000"))
+# Reject (503 with an ETA) rather than queue longer than this
+LLM_QUEUE_MAX_WAIT_SECONDS = float(os.getenv("LLM_QUEUE_MAX_WAIT_SECONDS", "60"))
+
+# LLM response cache (in-process LRU + optional SQLite tier)
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "2048"))
+LLM_CACHE_TTL_SECONDS = int(os.getenv("LLM_CACHE_TTL_SECONDS", str(24 * 3600)))
+LLM_CACHE_DB_PATH = os.getenv("LLM_CACHE_DB_PATH", "")  # empty = memory only
+LLM_CACHE_DB_MAX_ENTRIES = int(os.getenv("LLM_CACHE_DB_MAX_ENTRIES", "50000"))
+# Ask the model for missing required fields when a response is cut off or incomplete
+LLM_CONTINUATION_ENABLED = os.getenv("LLM_CONTINUATION_ENABLED", "true").lower() == "true"
+# Coalesce identical in-flight LLM calls, JD lookups and PDF parses into one
+SINGLE_FLIGHT_ENABLED = os.getenv("SINGLE_FLIGHT_ENABLED", "true").lower() == "true"
+# Engines that must always hit the LLM, e.g. "interview,rewrite"
+LLM_CACHE_DISABLED_ENGINES = {
+    name.strip() for name in os.getenv("LLM_CACHE_DISABLED_ENGINES", "").split(",") if name.strip()
+}
+
+# Batch Mode (one resume against several JDs)
+BATCH_MAX_JDS = int(os.getenv("BATCH_MAX_JDS", "5"))
+BATCH_MAX_CONCURRENCY = int(os.getenv("BATCH_MAX_CONCURRENCY", "5"))
+# Multi-bullet rewrite (several experiences, one completion)
+REWRITE_BATCH_MAX_BULLETS = int(os.getenv("REWRITE_BATCH_MAX_BULLETS", "12"))
+
+# Bulk resume ingestion (TPO cohort uploads)
+BULK_INGEST_WORKERS = int(os.getenv("BULK_INGEST_WORKERS", str(os.cpu_count() or 1)))
+BULK_INGEST_DIR = os.getenv("BULK_INGEST_DIR", os.path.join(tempfile.gettempdir(), "syrus-bulk"))
+BULK_MAX_ARCHIVE_MB = int(os.getenv("BULK_MAX_ARCHIVE_MB", "500"))
+# API jobs share one pool, sized to leave cores for the interactive PDF pool
+BULK_JOB_WORKERS = int(os.getenv(
+    "BULK_JOB_WORKERS", str(max(1, (os.cpu_count() or 1) - PDF_PARSE_WORKERS))
+))
+BULK_MAX_CONCURRENT_JOBS = int(os.getenv("BULK_MAX_CONCURRENT_JOBS", "1"))
+# Finished jobs (and their JSONL output) are deleted after this long
+BULK_JOB_TTL_SECONDS = int(os.getenv("BULK_JOB_TTL_SECONDS", "3600"))
+
+# Session persistence ("firestore", or "memory" for local runs and benchmarks)
+SESSION_STORE_BACKEND = os.getenv("SESSION_STORE_BACKEND", "firestore")
+# Write-behind buffering of save_session (off by default)
+WRITE_BEHIND_ENABLED = os.getenv("WRITE_BEHIND_ENABLED", "false").lower() == "true"
+WRITE_BEHIND_MAX_BATCH = int(os.getenv("WRITE_BEHIND_MAX_BATCH", "500"))
+WRITE_BEHIND_FLUSH_SECONDS = float(os.getenv("WRITE_BEHIND_FLUSH_SECONDS", "2"))
+# A segment that fails this many flushes while later ones commit is moved aside
+WRITE_BEHIND_MAX_ATTEMPTS = int(os.getenv("WRITE_BEHIND_MAX_ATTEMPTS", "5"))
+WRITE_BEHIND_SPOOL_DIR = os.getenv(
+    "WRITE_BEHIND_SPOOL_DIR", os.path.join(tempfile.gettempdir(), "syrus-spool")
+)
+
+# Shared JD store (each distinct JD's keywords and assessment prep computed once)
+JD_CACHE_MAX_ENTRIES = int(os.getenv("JD_CACHE_MAX_ENTRIES", "1024"))
+
+# Prompt context compaction: resume tokens sent per LLM call (0 = send the whole resume)
+PROMPT_CONTEXT_TOKEN_BUDGET = int(os.getenv("PROMPT_CONTEXT_TOKEN_BUDGET", "600"))
+
+# Prometheus /metrics endpoint and Server-Timing spans
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+
+# Background warm-up after startup: LLM client, Firestore and PDF workers (off by default)
+WARMUP_ON_STARTUP = os.getenv("WARMUP_ON_STARTUP", "false").lower() == "true"
+# Delay before warming up, so the first requests are not competing with imports
+WARMUP_DELAY_SECONDS = float(os.getenv("WARMUP_DELAY_SECONDS", "1"))
@@ -1,14 +1,48 @@
-from fastapi import FastAPI
+import asyncio
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
-from config import ALLOWED_ORIGINS
+from config import ALLOWED_ORIGINS, METRICS_ENABLED, WARMUP_ON_STARTUP
 from routes.resume import router as resume_router
 from routes.history import router as history_router
+from routes.bulk import router as bulk_router
+from routes.cohort import router as cohort_router
+from services import jd_store, resume_cache, single_flight
+from services.bulk_ingest import shutdown_job_pool
+from services.llm_cache import get_cache
+from services.llm_client import close_client
+from services.metrics import MetricsMiddleware, register_hit_ratio, render
+from services.pdf_pool import shutdown_pool
+from services.rate_limiter import LLMBusyError
+from services.session_store import start_store, stop_store
+from services.warmup import warm_up
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await start_store()
+    # Heavy dependencies load on first use; optionally pay for them in the
+    # background once the app is serving rather than on the first request
+    warmup = asyncio.create_task(warm_up()) if WARMUP_ON_STARTUP else None
+    yield
+    if warmup is not None:
+        warmup.cancel()
+    # Flush buffered session writes, then release the shared
+    # LLM connection pool and PDF workers
+    await stop_store()
+    await close_client()
+    shutdown_pool()
+    shutdown_job_pool()
+
 
 app = FastAPI(
     title="Cyrus — Resume Agent API",
     description="Honesty-First AI resume tailoring for campus placements",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 # CORS
@@ -20,11 +54,64 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Metrics (outermost, so time spent in CORS handling is included)
+if METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+    register_hit_ratio("llm", lambda: get_cache().stats())
+    register_hit_ratio("jd", jd_store.stats)
+    register_hit_ratio("resume", resume_cache.stats)
+
+
+@app.exception_handler(LLMBusyError)
+async def llm_busy_handler(request: Request, exc: LLMBusyError):
+    """Queue too long: tell the client when to come back instead of failing."""
+    return JSONResponse(
+        status_code=503,
+        content={
+            "detail": str(exc),
+            "queue_position": exc.position,
+            "eta_seconds": round(exc.eta_seconds, 1),
+        },
+        headers={"Retry-After": str(max(1, round(exc.eta_seconds)))},
+    )
+
+
 # Routes
 app.include_router(resume_router, prefix="/api")
 app.include_router(history_router, prefix="/api")
+app.include_router(bulk_router, prefix="/api")
+app.include_router(cohort_router, prefix="/api")
 
 
 @app.get("/")
 async def health():
     return {"status": "ok", "service": "cyrus-resume-agent"}
+
+
+@app.get("/stats/coalescing", include_in_schema=False)
+async def coalescing_stats():
+    """Per-flight leader/follower counts for identical in-flight work (this worker)."""
+    return single_flight.stats()
+
+
+if METRICS_ENABLED:
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics():
+        body, content_type = render()
+        return Response(content=body, media_type=content_type)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from services.startup_profile import print_import_profile
+
+    parser = argparse.ArgumentParser(description="Cyrus resume agent API (serve with: uvicorn main:app)")
+    parser.add_argument("--profile-imports", action="store_true", help="print an import-time breakdown of app startup")
+    parser.add_argument("--top", type=int, default=20, help="packages to list with --profile-imports")
+    args = parser.parse_args()
+
+    if args.profile_imports:
+        print_import_profile(args.top)
+    else:
+        parser.print_help()
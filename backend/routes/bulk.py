@@ -0,0 +1,214 @@
+"""
+Bulk Ingestion API Routes
+Endpoints for TPOs to submit a zip of a cohort's resumes as a background
+job, poll its progress and download the parsed JSONL.
+"""
+
+import asyncio
+import os
+import time
+import uuid
+import zipfile
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timezone
+
+from fastapi import APIRouter, UploadFile, File, HTTPException
+from fastapi.responses import FileResponse
+
+from config import (
+    BULK_INGEST_DIR,
+    BULK_JOB_TTL_SECONDS,
+    BULK_JOB_WORKERS,
+    BULK_MAX_ARCHIVE_MB,
+    BULK_MAX_CONCURRENT_JOBS,
+    UPLOAD_CHUNK_SIZE,
+)
+from services.bulk_ingest import get_job_pool, ingest, shutdown_job_pool
+
+router = APIRouter(tags=["Bulk Ingestion"])
+
+# Jobs live in this worker's memory; poll the same instance that accepted the job
+_jobs: dict[str, dict] = {}
+_tasks: set[asyncio.Task] = set()
+# job_id -> monotonic time after which a finished job and its output are deleted
+_expires: dict[str, float] = {}
+_job_slots = None
+
+
+def _get_job_slots() -> asyncio.Semaphore:
+    """Lazy-initialize the semaphore bounding jobs that parse at once (the rest stay queued)."""
+    global _job_slots
+    if _job_slots is None:
+        _job_slots = asyncio.Semaphore(BULK_MAX_CONCURRENT_JOBS)
+    return _job_slots
+
+
+@router.post("/bulk/ingest")
+async def submit_ingest_job(file: UploadFile = File(...)):
+    """
+    Submit a zip archive of PDF resumes for parsing.
+    Returns immediately with a job_id to poll.
+    """
+    if not file.filename or not file.filename.lower().endswith('.zip'):
+        raise HTTPException(
+            status_code=400,
+            detail="Only .zip archives are accepted."
+        )
+
+    _evict_expired()
+    _remove_orphans()
+    os.makedirs(BULK_INGEST_DIR, exist_ok=True)
+    job_id = uuid.uuid4().hex
+    archive_path = os.path.join(BULK_INGEST_DIR, f"{job_id}.zip")
+
+    # Stream the archive to disk with an early size cutoff
+    max_bytes = BULK_MAX_ARCHIVE_MB * 1024 * 1024
+    total = 0
+    with open(archive_path, "wb") as out:
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            total += len(chunk)
+            if total > max_bytes:
+                out.close()
+                os.remove(archive_path)
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Archive exceeds {BULK_MAX_ARCHIVE_MB}MB limit."
+                )
+            await asyncio.to_thread(out.write, chunk)
+
+    if not await asyncio.to_thread(zipfile.is_zipfile, archive_path):
+        os.remove(archive_path)
+        raise HTTPException(
+            status_code=400,
+            detail="File is not a valid zip archive."
+        )
+
+    job = {
+        "job_id": job_id,
+        "status": "queued",
+        "filename": file.filename,
+        "done": 0,
+        "total": None,
+        "report": None,
+        "error": None,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+    }
+    _jobs[job_id] = job
+
+    task = asyncio.create_task(_run_job(job, archive_path))
+    _tasks.add(task)
+    task.add_done_callback(_tasks.discard)
+
+    return {
+        "status": "success",
+        "job_id": job_id,
+    }
+
+
+@router.get("/bulk/ingest/{job_id}")
+async def get_ingest_job(job_id: str):
+    """
+    Poll a bulk ingestion job. The report (throughput, per-file failures)
+    is included once the job has completed.
+    """
+    _evict_expired()
+    job = _jobs.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    return {
+        "status": "success",
+        "job": job,
+    }
+
+
+@router.get("/bulk/ingest/{job_id}/results")
+async def download_ingest_results(job_id: str):
+    """
+    Download the parsed records of a completed job as JSONL.
+    """
+    _evict_expired()
+    job = _jobs.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    if job["status"] != "completed":
+        raise HTTPException(status_code=409, detail=f"Job is {job['status']}")
+
+    return FileResponse(
+        _output_path(job_id),
+        media_type="application/x-ndjson",
+        filename=f"{job_id}.jsonl",
+    )
+
+
+async def _run_job(job: dict, archive_path: str) -> None:
+    """
+    Run ingestion off the event loop, in the shared parser pool, once a job
+    slot is free. Finished jobs expire after BULK_JOB_TTL_SECONDS.
+    """
+    def on_progress(done: int, total: int) -> None:
+        job["done"] = done
+        job["total"] = total
+
+    output_path = _output_path(job["job_id"])
+    try:
+        async with _get_job_slots():
+            job["status"] = "running"
+            try:
+                report = await asyncio.to_thread(
+                    ingest,
+                    archive_path,
+                    output_path,
+                    workers=BULK_JOB_WORKERS,
+                    on_progress=on_progress,
+                    executor=get_job_pool(),
+                )
+                # Served to clients as is; the results endpoint finds the file by job id
+                report.pop("output_path", None)
+                job["report"] = report
+                job["status"] = "completed"
+            except Exception as e:
+                if isinstance(e, BrokenProcessPool):
+                    # A worker died mid-job; start a fresh pool for the next one
+                    shutdown_job_pool()
+                job["status"] = "failed"
+                job["error"] = f"Bulk ingestion failed: {str(e)}"
+                _remove(output_path)
+    finally:
+        _remove(archive_path)
+        _expires[job["job_id"]] = time.monotonic() + BULK_JOB_TTL_SECONDS
+
+
+def _evict_expired() -> None:
+    """Forget finished jobs past their TTL and delete their output."""
+    now = time.monotonic()
+    for job_id, expires in list(_expires.items()):
+        if expires <= now:
+            del _expires[job_id]
+            _jobs.pop(job_id, None)
+            _remove(_output_path(job_id))
+
+
+def _remove_orphans() -> None:
+    """Delete files left in BULK_INGEST_DIR by a previous process once they are past the TTL."""
+    cutoff = time.time() - BULK_JOB_TTL_SECONDS
+    try:
+        entries = list(os.scandir(BULK_INGEST_DIR))
+    except FileNotFoundError:
+        return
+    for entry in entries:
+        job_id = entry.name.split(".")[0]
+        if job_id not in _jobs and entry.is_file() and entry.stat().st_mtime < cutoff:
+            _remove(entry.path)
+
+
+def _output_path(job_id: str) -> str:
+    return os.path.join(BULK_INGEST_DIR, f"{job_id}.jsonl")
+
+
+def _remove(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
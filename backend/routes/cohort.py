@@ -0,0 +1,62 @@
+"""
+Cohort API Routes
+TPO dashboard endpoints for cohort-wide ATS readiness across active JDs.
+"""
+
+import asyncio
+
+from fastapi import APIRouter, HTTPException
+from pydantic import BaseModel
+
+router = APIRouter(tags=["Cohort"])
+
+
+class CohortResume(BaseModel):
+    student_id: str
+    raw_text: str
+
+
+class CohortJD(BaseModel):
+    jd_id: str
+    jd_text: str
+
+
+class CohortScoreRequest(BaseModel):
+    resumes: list[CohortResume]
+    jds: list[CohortJD]
+    top_k: int = 5
+    ready_threshold: int = 60
+
+
+@router.post("/cohort/scores")
+async def cohort_scores(request: CohortScoreRequest):
+    """
+    Score every resume against every JD and return top-K JD
+    recommendations per student plus per-JD cohort readiness.
+    """
+    if not request.resumes:
+        raise HTTPException(status_code=400, detail="At least one resume is required.")
+
+    if not request.jds:
+        raise HTTPException(status_code=400, detail="At least one job description is required.")
+
+    # numpy/scipy load on the first cohort request, not at app startup
+    from services.cohort_scorer import score_cohort
+
+    try:
+        # CPU-bound; keep it off the event loop
+        result = await asyncio.to_thread(
+            score_cohort,
+            [(r.student_id, r.raw_text) for r in request.resumes],
+            [(j.jd_id, j.jd_text) for j in request.jds],
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Cohort scoring failed: {str(e)}")
+
+    return {
+        "status": "success",
+        "recommendations": result.top_k(request.top_k),
+        "jd_readiness": result.jd_readiness(request.ready_threshold),
+        "student_count": len(result.student_ids),
+        "jd_count": len(result.jd_ids),
+    }
@@ -7,7 +7,14 @@ from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 from typing import Optional
 
-from services.firestore import save_session, get_sessions, get_session_by_id
+from services.session_store import (
+    save_session,
+    get_sessions,
+    get_session_by_id,
+    get_skill_gaps,
+    rebuild_skill_gaps,
+)
+from services import jd_store
 
 router = APIRouter(tags=["History"])
 
@@ -30,7 +37,17 @@ async def create_session(request: SaveSessionRequest):
         raise HTTPException(status_code=400, detail="user_id is required")
 
     try:
-        session_id = save_session(request.user_id, request.dict())
+        # Store the JD once in the shared collection; the session keeps its hash
+        data = request.dict()
+        if request.jd_text.strip():
+            key = (await jd_store.get_jd(request.jd_text))["hash"]
+            try:
+                await jd_store.wait_persisted(key)
+                data["jd_hash"] = key
+            except Exception as e:
+                # Not confirmed in the store, so the session keeps its own copy of the text
+                print(f"[History] WARNING: JD {key[:12]} not stored, saving its text with the session: {e}")
+        session_id = await save_session(request.user_id, data)
         return {
             "status": "success",
             "session_id": session_id,
@@ -40,19 +57,29 @@ async def create_session(request: SaveSessionRequest):
 
 
 @router.get("/history")
-async def list_sessions(user_id: str, limit: int = 20):
+async def list_sessions(
+    user_id: str,
+    limit: int = 20,
+    cursor: Optional[str] = None,
+    summary: bool = False,
+):
     """
-    Get all sessions for a user.
+    Get a page of sessions for a user, newest first.
+    summary=true returns only the list-view fields; fetch the full session
+    from /history/{session_id}. Pass next_cursor back as cursor for the
+    next page (null when there are no more).
     """
     if not user_id.strip():
         raise HTTPException(status_code=400, detail="user_id is required")
 
     try:
-        sessions = get_sessions(user_id, limit)
+        sessions = await get_sessions(user_id, limit, cursor, summary)
+        next_cursor = sessions[-1]["created_at"] if len(sessions) == limit else None
         return {
             "status": "success",
             "sessions": sessions,
             "count": len(sessions),
+            "next_cursor": next_cursor,
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch sessions: {str(e)}")
@@ -67,14 +94,50 @@ async def get_session(session_id: str, user_id: str):
         raise HTTPException(status_code=400, detail="user_id is required")
 
     try:
-        session = get_session_by_id(user_id, session_id)
+        session = await get_session_by_id(user_id, session_id)
         if not session:
             raise HTTPException(status_code=404, detail="Session not found")
         return {
             "status": "success",
-            "session": session,
+            "session": await jd_store.hydrate_session(session),
         }
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch session: {str(e)}")
+
+
+@router.get("/skill-gaps/{user_id}")
+async def skill_gaps(user_id: str, limit: int = 15, rebuild: bool = False):
+    """
+    Aggregate missing keywords across the user's saved sessions.
+    Served from the per-user aggregate maintained by save_session; users
+    without one (or rebuild=true) get it recomputed from history once.
+    """
+    if not user_id.strip():
+        raise HTTPException(status_code=400, detail="user_id is required")
+
+    try:
+        aggregate = None if rebuild else await get_skill_gaps(user_id)
+        if aggregate is None:
+            aggregate = await rebuild_skill_gaps(user_id)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to fetch skill gaps: {str(e)}")
+
+    session_count = aggregate.get("session_count", 0)
+    missing = sorted(aggregate.get("missing", {}).items(), key=lambda kv: kv[1], reverse=True)
+    matched = aggregate.get("matched", {})
+
+    return {
+        "status": "success",
+        "session_count": session_count,
+        "skill_gaps": [
+            {
+                "keyword": kw,
+                "missing_count": count,
+                "matched_count": matched.get(kw, 0),
+                "missing_share": round(count / session_count, 3) if session_count else 0.0,
+            }
+            for kw, count in missing[:limit]
+        ],
+    }
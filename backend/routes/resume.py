@@ -4,17 +4,33 @@ Endpoints for uploading resumes, analyzing JDs, generating tailored bullets,
 rewriting bullets (Honesty-First), and interview prep.
 """
 
+import asyncio
+import json
+
 from fastapi import APIRouter, UploadFile, File, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from typing import Optional
-
-from services.pdf_parser import extract_text_from_pdf
-from services.llm_engine import generate_bullets
-from services.ats_scorer import extract_jd_keywords, calculate_ats_score
-from services.rewrite_engine import rewrite_bullet
+from typing import AsyncIterator, Optional
+
+from services.pdf_pool import parse_pdf
+from config import (
+    BATCH_MAX_JDS,
+    BATCH_MAX_CONCURRENCY,
+    MAX_FILE_SIZE_MB,
+    REWRITE_BATCH_MAX_BULLETS,
+    UPLOAD_CHUNK_SIZE,
+)
+from services.llm_engine import generate_bullets, stream_bullets, _build_resume_context
+from services.ats_scorer import calculate_ats_score, calculate_ats_scores_batch
+from services import jd_store
+from services.rewrite_engine import rewrite_bullet, rewrite_bullets, stream_rewrite
+from services.honesty_verifier import check_bullets
+from services.context_selector import selector_for_parsed, selector_for_text
 from services.interview_engine import generate_interview_prep
-from services.roadmap_engine import generate_career_roadmap
+from services.roadmap_engine import generate_career_roadmap, stream_career_roadmap
 from services.assessment_engine import generate_assessment_prep
+from services.rate_limiter import LLMBusyError, queue_listener
+from services.single_flight import get_flight
 
 router = APIRouter(tags=["Resume Agent"])
 
@@ -32,12 +48,23 @@ class GenerateBulletsRequest(BaseModel):
     jd_text: str
 
 
+class BatchGenerateBulletsRequest(BaseModel):
+    parsed_resume: dict
+    jd_texts: list[str]
+
+
 class RewriteBulletRequest(BaseModel):
     master_resume_text: str  # Full resume text for honesty verification
     target_jd: str
     target_experience: str   # The specific bullet/experience to rewrite
 
 
+class RewriteBulletsRequest(BaseModel):
+    master_resume_text: str
+    target_jd: str
+    target_experiences: list[str]  # Rewritten together in one completion
+
+
 class InterviewPrepRequest(BaseModel):
     project_title: str
     project_description: str
@@ -70,16 +97,17 @@ async def upload_resume(file: UploadFile = File(...)):
             detail="Only PDF files are accepted."
         )
 
-    # Validate file size (10MB max)
-    contents = await file.read()
-    if len(contents) > 10 * 1024 * 1024:
+    # Validate file size (10MB max) while reading, so oversized
+    # uploads are rejected without buffering them whole
+    contents = await _read_upload(file, MAX_FILE_SIZE_MB * 1024 * 1024)
+    if contents is None:
         raise HTTPException(
             status_code=400,
-            detail="File size exceeds 10MB limit."
+            detail=f"File size exceeds {MAX_FILE_SIZE_MB}MB limit."
         )
 
     try:
-        parsed = extract_text_from_pdf(contents)
+        parsed = await parse_pdf(contents)
     except Exception as e:
         raise HTTPException(
             status_code=422,
@@ -104,11 +132,14 @@ async def analyze_jd(request: JDAnalyzeRequest):
             detail="Job description text cannot be empty."
         )
 
-    keywords = extract_jd_keywords(request.jd_text)
+    jd = await jd_store.get_jd(request.jd_text)
+    keywords = jd["keywords"]
 
     return {
         "status": "success",
+        "jd_hash": jd["hash"],
         "keywords": keywords,
+        "keyword_weights": jd.get("keyword_weights"),
         "keyword_count": len(keywords),
     }
 
@@ -119,10 +150,104 @@ async def generate_tailored_bullets(request: GenerateBulletsRequest):
     Generate 3 tailored bullet rewrites + ATS scores.
     The core endpoint of the Resume Agent.
     """
-    if not request.jd_text.strip():
+    _validate_generate_request(request)
+
+    # Step 1: JD keywords (extracted once per distinct JD), and the resume lines they point at
+    jd = await jd_store.get_jd(request.jd_text)
+    jd_keywords = jd["keywords"]
+    resume_context, context_stats = _bullets_selector(request.parsed_resume).select(
+        jd_keywords, engine="bullets"
+    )
+
+    # Step 2: Generate bullets via Groq LLM (non-blocking)
+    llm_result = await generate_bullets(request.parsed_resume, request.jd_text, resume_context=resume_context)
+
+    # Step 3: Verify each rewrite against the resume; only honest ones count toward the score
+    suggested_texts = check_bullets(llm_result.get("bullets", []), request.parsed_resume["raw_text"])
+
+    scores = calculate_ats_score(
+        resume_text=request.parsed_resume["raw_text"],
+        jd_keywords=jd_keywords,
+        suggested_bullets=suggested_texts,
+        keyword_weights=jd.get("keyword_weights"),
+    )
+
+    return {
+        "status": "success",
+        "bullets": llm_result.get("bullets", []),
+        "match_analysis": llm_result.get("match_analysis", {}),
+        "ats_scores": scores,
+        "jd_keywords": jd_keywords,
+        "prompt_context": context_stats,
+    }
+
+
+@router.post("/generate-bullets/stream")
+async def generate_tailored_bullets_stream(request: GenerateBulletsRequest):
+    """
+    Server-Sent Events variant of /generate-bullets.
+
+    Events: keywords, ats_baseline (both before any LLM work), one bullet
+    event per finished bullet, match_analysis, ats_scores, then done.
+    """
+    _validate_generate_request(request)
+
+    async def events() -> AsyncIterator[str]:
+        resume_text = request.parsed_resume["raw_text"]
+        jd = await jd_store.get_jd(request.jd_text)
+        jd_keywords = jd["keywords"]
+        keyword_weights = jd.get("keyword_weights")
+        yield _sse("keywords", {"jd_keywords": jd_keywords, "keyword_count": len(jd_keywords)})
+        yield _sse("ats_baseline", calculate_ats_score(resume_text, jd_keywords, keyword_weights=keyword_weights))
+
+        resume_context, context_stats = _bullets_selector(request.parsed_resume).select(
+            jd_keywords, engine="bullets"
+        )
+
+        async for kind, value in stream_bullets(request.parsed_resume, request.jd_text, resume_context):
+            if kind == "bullet":
+                check_bullets([value], resume_text)
+                yield _sse("bullet", value)
+                continue
+
+            bullets = value.get("bullets", [])
+            yield _sse("match_analysis", value.get("match_analysis", {}))
+            yield _sse("ats_scores", calculate_ats_score(
+                resume_text=resume_text,
+                jd_keywords=jd_keywords,
+                suggested_bullets=check_bullets(bullets, resume_text),
+                keyword_weights=keyword_weights,
+            ))
+            yield _sse("done", {"status": "success", "bullets": bullets, "prompt_context": context_stats})
+
+    return _event_stream(events(), "Bullet engine failed")
+
+
+@router.post("/generate-bullets/batch")
+async def generate_tailored_bullets_batch(request: BatchGenerateBulletsRequest):
+    """
+    Batch Mode: tailor one resume to several JDs at once.
+    Results are ranked by baseline (before) ATS score, best match first.
+    """
+    jd_texts = request.jd_texts
+    if not jd_texts:
         raise HTTPException(
             status_code=400,
-            detail="Job description text cannot be empty."
+            detail="At least one job description is required."
+        )
+
+    # Results carry jd_index into the request's list, so blanks are rejected rather than dropped
+    blank = [i for i, jd in enumerate(jd_texts) if not jd.strip()]
+    if blank:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Job description(s) at index {', '.join(map(str, blank))} are empty."
+        )
+
+    if len(jd_texts) > BATCH_MAX_JDS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Batch mode accepts at most {BATCH_MAX_JDS} job descriptions."
         )
 
     if not request.parsed_resume.get("raw_text", "").strip():
@@ -131,29 +256,60 @@ async def generate_tailored_bullets(request: GenerateBulletsRequest):
             detail="Parsed resume is empty. Upload a resume first."
         )
 
-    # Step 1: Extract JD keywords
-    jd_keywords = extract_jd_keywords(request.jd_text)
+    resume_text = request.parsed_resume["raw_text"]
 
-    # Step 2: Generate bullets via Grok LLM
-    llm_result = generate_bullets(request.parsed_resume, request.jd_text)
+    # Step 1: Shared work — resume index once; keywords, baselines and context per JD
+    selector = _bullets_selector(request.parsed_resume)
+    jd_records = await asyncio.gather(*(jd_store.get_jd(jd) for jd in jd_texts))
+    jd_keyword_lists = [jd["keywords"] for jd in jd_records]
+    jd_weight_lists = [jd.get("keyword_weights") for jd in jd_records]
+    baselines = calculate_ats_scores_batch(resume_text, jd_keyword_lists, keyword_weight_lists=jd_weight_lists)
+    contexts = [selector.select(keywords, engine="bullets") for keywords in jd_keyword_lists]
 
-    # Step 3: Calculate ATS scores
-    suggested_texts = [
-        b.get("rewritten", "") for b in llm_result.get("bullets", [])
-    ]
+    # Step 2: Fan out the LLM calls; wall time ≈ the slowest JD
+    semaphore = asyncio.Semaphore(BATCH_MAX_CONCURRENCY)
 
-    scores = calculate_ats_score(
-        resume_text=request.parsed_resume["raw_text"],
-        jd_keywords=jd_keywords,
-        suggested_bullets=suggested_texts,
+    async def tailor(jd_text: str, resume_context: str) -> dict:
+        async with semaphore:
+            return await generate_bullets(request.parsed_resume, jd_text, resume_context=resume_context)
+
+    llm_results = await asyncio.gather(
+        *(tailor(jd, context) for jd, (context, _) in zip(jd_texts, contexts)),
+        return_exceptions=True,
     )
 
+    # Step 3: Verify every bullet, then final scores for every JD in one pass
+    bullet_lists = [
+        check_bullets(r.get("bullets", []), resume_text) if isinstance(r, dict) else None
+        for r in llm_results
+    ]
+    scores = calculate_ats_scores_batch(resume_text, jd_keyword_lists, bullet_lists, jd_weight_lists)
+
+    results = []
+    for i, (jd_text, llm_result) in enumerate(zip(jd_texts, llm_results)):
+        item = {
+            "jd_index": i,
+            "jd_snippet": jd_text[:120],
+            "baseline_score": baselines[i]["before_score"],
+            "ats_scores": scores[i],
+            "jd_keywords": jd_keyword_lists[i],
+            "prompt_context": contexts[i][1],
+        }
+        if isinstance(llm_result, Exception):
+            item["bullets"] = []
+            item["match_analysis"] = {}
+            item["error"] = f"Bullet engine failed: {str(llm_result)}"
+        else:
+            item["bullets"] = llm_result.get("bullets", [])
+            item["match_analysis"] = llm_result.get("match_analysis", {})
+        results.append(item)
+
+    results.sort(key=lambda r: r["baseline_score"], reverse=True)
+
     return {
         "status": "success",
-        "bullets": llm_result.get("bullets", []),
-        "match_analysis": llm_result.get("match_analysis", {}),
-        "ats_scores": scores,
-        "jd_keywords": jd_keywords,
+        "results": results,
+        "count": len(results),
     }
 
 
@@ -168,39 +324,122 @@ async def rewrite_bullet_endpoint(request: RewriteBulletRequest):
     Passes the FULL master_resume_text so the LLM can verify
     honesty against the student's complete history.
     """
-    if not request.master_resume_text.strip():
+    _validate_rewrite_request(request)
+
+    try:
+        resume_context, context_stats = await _rewrite_context(
+            request.master_resume_text, request.target_jd, request.target_experience
+        )
+        result = await rewrite_bullet(
+            master_resume_text=request.master_resume_text,
+            target_jd=request.target_jd,
+            target_experience=request.target_experience,
+            resume_context=resume_context,
+        )
+    except LLMBusyError:
+        raise
+    except Exception as e:
         raise HTTPException(
-            status_code=400,
-            detail="Master resume text is required for honesty verification."
+            status_code=500,
+            detail=f"Rewrite engine failed: {str(e)}"
         )
 
-    if not request.target_jd.strip():
+    return {
+        "status": "success",
+        **result,
+        "prompt_context": context_stats,
+    }
+
+
+@router.post("/rewrite-bullet/stream")
+async def rewrite_bullet_stream(request: RewriteBulletRequest):
+    """
+    Server-Sent Events variant of /rewrite-bullet.
+
+    Emits a field event as each output field finishes (optimized_bullet
+    only if it passes the honesty check), then done with the complete,
+    verified result.
+    """
+    _validate_rewrite_request(request)
+
+    async def events() -> AsyncIterator[str]:
+        resume_context, context_stats = await _rewrite_context(
+            request.master_resume_text, request.target_jd, request.target_experience
+        )
+        async for kind, value in stream_rewrite(
+            master_resume_text=request.master_resume_text,
+            target_jd=request.target_jd,
+            target_experience=request.target_experience,
+            resume_context=resume_context,
+        ):
+            if kind == "field":
+                yield _sse("field", value)
+            else:
+                yield _sse("done", {"status": "success", **value, "prompt_context": context_stats})
+
+    return _event_stream(events(), "Rewrite engine failed")
+
+
+@router.post("/rewrite-bullets")
+async def rewrite_bullets_endpoint(request: RewriteBulletsRequest):
+    """
+    Rewrite several experiences for one JD in a single LLM call.
+    The resume and JD are sent once; results come back in input order,
+    each shaped like a /rewrite-bullet response (blank entries get a
+    skipped error result in their slot).
+    """
+    # Blank rows are skipped but keep their slot, so results stay aligned with the input
+    positions = [i for i, e in enumerate(request.target_experiences) if e.strip()]
+    experiences = [request.target_experiences[i] for i in positions]
+    if not experiences:
         raise HTTPException(
             status_code=400,
-            detail="Target job description cannot be empty."
+            detail="At least one target experience is required."
         )
 
-    if not request.target_experience.strip():
+    if len(experiences) > REWRITE_BATCH_MAX_BULLETS:
         raise HTTPException(
             status_code=400,
-            detail="Target experience to rewrite cannot be empty."
+            detail=f"At most {REWRITE_BATCH_MAX_BULLETS} experiences can be rewritten at once."
         )
 
+    _validate_rewrite_request(RewriteBulletRequest(
+        master_resume_text=request.master_resume_text,
+        target_jd=request.target_jd,
+        target_experience=experiences[0],
+    ))
+
     try:
-        result = rewrite_bullet(
+        resume_context, context_stats = await _rewrite_context(
+            request.master_resume_text, request.target_jd, "\n".join(experiences)
+        )
+        results, llm_calls = await rewrite_bullets(
             master_resume_text=request.master_resume_text,
             target_jd=request.target_jd,
-            target_experience=request.target_experience,
+            target_experiences=experiences,
+            resume_context=resume_context,
         )
+    except LLMBusyError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
             detail=f"Rewrite engine failed: {str(e)}"
         )
 
+    slots = [
+        {"error": "Target experience is empty.", "skipped": True}
+        for _ in request.target_experiences
+    ]
+    for i, result in zip(positions, results):
+        slots[i] = result
+
     return {
         "status": "success",
-        **result,
+        "results": slots,
+        "count": len(slots),
+        "llm_calls": llm_calls,
+        "prompt_context": context_stats,
     }
 
 
@@ -226,12 +465,14 @@ async def interview_prep_endpoint(request: InterviewPrepRequest):
         )
 
     try:
-        result = generate_interview_prep(
+        result = await generate_interview_prep(
             project_title=request.project_title,
             project_description=request.project_description,
             tech_stack=request.tech_stack,
             github_url=request.github_url,
         )
+    except LLMBusyError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -253,23 +494,17 @@ async def career_roadmap_endpoint(request: CareerRoadmapRequest):
     """
     Generate a career roadmap identifying skill gaps and learning resources.
     """
-    if not request.master_resume_text.strip():
-        raise HTTPException(
-            status_code=400,
-            detail="Master resume text is required."
-        )
-
-    if not request.target_jd.strip():
-        raise HTTPException(
-            status_code=400,
-            detail="Target job description is required."
-        )
+    _validate_roadmap_request(request)
 
     try:
-        result = generate_career_roadmap(
+        resume_context, context_stats = await _roadmap_context(request)
+        result = await generate_career_roadmap(
             master_resume_text=request.master_resume_text,
             target_jds=request.target_jd,
+            resume_context=resume_context,
         )
+    except LLMBusyError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -279,9 +514,34 @@ async def career_roadmap_endpoint(request: CareerRoadmapRequest):
     return {
         "status": "success",
         **result,
+        "prompt_context": context_stats,
     }
 
 
+@router.post("/career-roadmap/stream")
+async def career_roadmap_stream(request: CareerRoadmapRequest):
+    """
+    Server-Sent Events variant of /career-roadmap.
+
+    Emits a gap event per finished skill gap, then done with the complete result.
+    """
+    _validate_roadmap_request(request)
+
+    async def events() -> AsyncIterator[str]:
+        resume_context, context_stats = await _roadmap_context(request)
+        async for kind, value in stream_career_roadmap(
+            master_resume_text=request.master_resume_text,
+            target_jds=request.target_jd,
+            resume_context=resume_context,
+        ):
+            if kind == "gap":
+                yield _sse("gap", value)
+            else:
+                yield _sse("done", {"status": "success", **value, "prompt_context": context_stats})
+
+    return _event_stream(events(), "Career roadmap engine failed")
+
+
 # ────────────────────────────────────────────
 # Placement Intelligence Agent (Assessments)
 # ────────────────────────────────────────────
@@ -297,17 +557,167 @@ async def assessment_prep_endpoint(request: AssessmentPrepRequest):
             detail="Target job description is required."
         )
 
-    try:
-        result = generate_assessment_prep(
-            target_jd=request.target_jd,
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Assessment Prep engine failed: {str(e)}"
-        )
+    # Assessment patterns depend only on the JD, so one result serves everyone
+    jd = await jd_store.get_jd(request.target_jd)
+    result = jd.get("assessment_prep")
+    if result is None or "error" in result:
+        async def generate() -> dict:
+            # Another worker may have stored one already
+            prep = await jd_store.get_assessment_prep(jd["hash"])
+            if prep is None or "error" in prep:
+                prep = await generate_assessment_prep(target_jd=request.target_jd)
+                # A response that failed to parse is returned but not kept, so the next request retries
+                if "error" not in prep:
+                    await jd_store.set_assessment_prep(jd["hash"], prep)
+            return prep
+
+        try:
+            # Keyed by JD hash, so whitespace variants of one JD share the call too
+            result = await get_flight("assessment").do(jd["hash"], generate)
+        except LLMBusyError:
+            raise
+        except Exception as e:
+            raise HTTPException(
+                status_code=500,
+                detail=f"Assessment Prep engine failed: {str(e)}"
+            )
 
     return {
         "status": "success",
         **result,
     }
+
+
+# ────────────────────────────────────────────
+# Helpers
+# ────────────────────────────────────────────
+
+async def _read_upload(file: UploadFile, max_bytes: int) -> Optional[bytes]:
+    """Read an upload in chunks; None as soon as it exceeds max_bytes."""
+    if file.size is not None and file.size > max_bytes:
+        return None
+
+    chunks = []
+    total = 0
+    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+        total += len(chunk)
+        if total > max_bytes:
+            return None
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+def _validate_generate_request(request: GenerateBulletsRequest) -> None:
+    if not request.jd_text.strip():
+        raise HTTPException(
+            status_code=400,
+            detail="Job description text cannot be empty."
+        )
+
+    if not request.parsed_resume.get("raw_text", "").strip():
+        raise HTTPException(
+            status_code=400,
+            detail="Parsed resume is empty. Upload a resume first."
+        )
+
+
+def _validate_rewrite_request(request: RewriteBulletRequest) -> None:
+    if not request.master_resume_text.strip():
+        raise HTTPException(
+            status_code=400,
+            detail="Master resume text is required for honesty verification."
+        )
+
+    if not request.target_jd.strip():
+        raise HTTPException(
+            status_code=400,
+            detail="Target job description cannot be empty."
+        )
+
+    if not request.target_experience.strip():
+        raise HTTPException(
+            status_code=400,
+            detail="Target experience to rewrite cannot be empty."
+        )
+
+
+def _validate_roadmap_request(request: CareerRoadmapRequest) -> None:
+    if not request.master_resume_text.strip():
+        raise HTTPException(
+            status_code=400,
+            detail="Master resume text is required."
+        )
+
+    if not request.target_jd.strip():
+        raise HTTPException(
+            status_code=400,
+            detail="Target job description is required."
+        )
+
+
+def _bullets_selector(parsed_resume: dict):
+    return selector_for_parsed(parsed_resume, _build_resume_context(parsed_resume))
+
+
+async def _rewrite_context(resume_text: str, target_jd: str, experience: str) -> tuple[str, dict]:
+    """Resume lines relevant to the JD and to the experience(s) being rewritten."""
+    jd_keywords = (await jd_store.get_jd(target_jd))["keywords"]
+    return selector_for_text(resume_text).select(jd_keywords, query=experience, engine="rewrite")
+
+
+async def _roadmap_context(request: CareerRoadmapRequest) -> tuple[str, dict]:
+    jd_keywords = (await jd_store.get_jd(request.target_jd))["keywords"]
+    return selector_for_text(request.master_resume_text).select(jd_keywords, engine="roadmap")
+
+
+def _sse(event: str, data) -> str:
+    """Format one Server-Sent Event."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+def _event_stream(events: AsyncIterator[str], failure_label: str) -> StreamingResponse:
+    """
+    Wrap an event generator in an SSE response. Once streaming has started
+    the status code is already sent, so failures become an error event.
+    While an LLM call waits for rate-limit budget, queued events report the
+    request's queue position and ETA.
+    """
+    async def guarded() -> AsyncIterator[str]:
+        try:
+            async for event in _with_queue_updates(events):
+                yield event
+        except Exception as e:
+            yield _sse("error", {"detail": f"{failure_label}: {str(e)}"})
+
+    return StreamingResponse(
+        guarded(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _with_queue_updates(events: AsyncIterator[str]) -> AsyncIterator[str]:
+    """Interleave the rate limiter's queue updates with the stream's own events."""
+    outbox: asyncio.Queue = asyncio.Queue()
+    finished = object()
+
+    async def pump() -> None:
+        try:
+            async for event in events:
+                await outbox.put(event)
+        except Exception as e:
+            await outbox.put(e)
+        finally:
+            await outbox.put(finished)
+
+    # The pump task copies the current context, listener included
+    token = queue_listener.set(lambda status: outbox.put_nowait(_sse("queued", status)))
+    task = asyncio.create_task(pump())
+    queue_listener.reset(token)
+    try:
+        while (item := await outbox.get()) is not finished:
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        task.cancel()
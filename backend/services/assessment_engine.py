@@ -4,9 +4,8 @@ Uses the Groq LLM to predict the Aptitude/Online Assessment pattern
 based on a target company JD (specifically for Indian campuses).
 """
 
-import json
-from openai import OpenAI
-from config import GROQ_API_KEY, GROQ_BASE_URL, GROQ_MODEL
+from services.llm_client import chat_completion
+from services.response_parser import parse_engine_response
 
 
 ASSESSMENT_SYSTEM_PROMPT = """You are the Syrus Placement Intelligence Agent. Your goal is to predict the "Aptitude/Online Assessment" pattern for a company based on its Job Description and historical hiring data for Indian campuses.
@@ -41,7 +40,7 @@ ASSESSMENT_SYSTEM_PROMPT = """You are the Syrus Placement Intelligence Agent. Yo
 Only return valid JSON. No markdown fences, no extra text."""
 
 
-def generate_assessment_prep(target_jd: str) -> dict:
+async def generate_assessment_prep(target_jd: str) -> dict:
     """
     Generate assessment prep pattern and roadmap.
 
@@ -51,37 +50,30 @@ def generate_assessment_prep(target_jd: str) -> dict:
     Returns:
         dict containing predicted company, sections, and roadmap
     """
-    client = OpenAI(
-        api_key=GROQ_API_KEY,
-        base_url=GROQ_BASE_URL,
-    )
-
     user_prompt = f"""## INPUT DATA:
 - TARGET_JD:
 {target_jd}
 
 Generate the assessment pattern prediction. Return valid JSON only."""
 
-    response = client.chat.completions.create(
-        model=GROQ_MODEL,
-        messages=[
-            {"role": "system", "content": ASSESSMENT_SYSTEM_PROMPT},
-            {"role": "user", "content": user_prompt},
-        ],
+    result_text = await chat_completion(
+        system_prompt=ASSESSMENT_SYSTEM_PROMPT,
+        user_prompt=user_prompt,
         temperature=0.3,
         max_tokens=1500,
-        response_format={"type": "json_object"},
+        engine="assessment",
     )
 
-    result_text = response.choices[0].message.content
-    try:
-        return json.loads(result_text)
-    except json.JSONDecodeError:
-        return {
-            "predicted_company": "Unknown",
-            "assessment_tier": "Unknown",
-            "test_pattern": {"provider": "Unknown", "sections": []},
-            "preparation_roadmap": "Failed to generate roadmap.",
-            "error": "Failed to parse LLM response",
-            "raw_response": result_text,
-        }
+    result = await parse_engine_response(
+        result_text, "assessment", ASSESSMENT_SYSTEM_PROMPT, user_prompt, temperature=0.3, max_tokens=1500
+    )
+    if result is not None:
+        return result
+    return {
+        "predicted_company": "Unknown",
+        "assessment_tier": "Unknown",
+        "test_pattern": {"provider": "Unknown", "sections": []},
+        "preparation_roadmap": "Failed to generate roadmap.",
+        "error": "Failed to parse LLM response",
+        "raw_response": result_text,
+    }
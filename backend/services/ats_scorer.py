@@ -1,61 +1,92 @@
 """
 ATS Scoring Service
 Calculates a weighted keyword-match score between resume text and JD requirements.
+Keywords and their weights come from keyword_extractor.
 """
 
 import re
-from collections import Counter
+from functools import lru_cache
 from typing import Optional
 
+from services.metrics import ATS_SCORING_SECONDS, span
 
-def extract_jd_keywords(jd_text: str) -> list[str]:
-    """
-    Extract important keywords from a Job Description.
-    Focuses on technical skills, tools, and action verbs.
-    """
-    # Common filler words to ignore
-    stop_words = {
-        'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-        'of', 'with', 'by', 'from', 'is', 'are', 'was', 'were', 'be', 'been',
-        'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
-        'could', 'should', 'may', 'might', 'shall', 'can', 'this', 'that',
-        'these', 'those', 'i', 'me', 'my', 'we', 'our', 'you', 'your', 'he',
-        'she', 'it', 'they', 'them', 'their', 'its', 'not', 'no', 'nor',
-        'as', 'if', 'then', 'than', 'so', 'up', 'out', 'about', 'into',
-        'through', 'during', 'before', 'after', 'above', 'below', 'between',
-        'same', 'each', 'every', 'all', 'both', 'few', 'more', 'most',
-        'other', 'some', 'such', 'only', 'own', 'also', 'just', 'very',
-        'any', 'who', 'which', 'what', 'where', 'when', 'how', 'able',
-        'across', 'within', 'including', 'well', 'must', 'role', 'work',
-        'working', 'using', 'based', 'etc', 'like', 'new', 'good', 'great',
-        'looking', 'join', 'team', 'company', 'position', 'candidate',
-        'required', 'preferred', 'years', 'experience', 'strong',
-    }
 
-    # Normalize text
-    text = jd_text.lower()
-    text = re.sub(r'[^a-z0-9\s.#+\-]', ' ', text)
+# Token = run of letters/digits that may contain tech punctuation (c++, c#, node.js, ci-cd)
+_TOKEN_RE = re.compile(r'[a-z0-9][a-z0-9.#+\-]*[a-z0-9+#]|[a-z0-9]')
 
-    # Extract words (keep compound tech terms like c++, c#, node.js)
-    words = re.findall(r'[a-z][a-z0-9.#+\-]*[a-z0-9+#]|[a-z]', text)
 
-    # Filter out stop words and short words
-    keywords = [
-        w for w in words
-        if w not in stop_words and len(w) > 1
-    ]
+def tokenize(text: str) -> list[tuple[str, int]]:
+    """Lowercase and split text into (token, char_offset) pairs."""
+    return [(m.group(), m.start()) for m in _TOKEN_RE.finditer(text.lower())]
+
+
+class KeywordMatcher:
+    """
+    Token-boundary keyword index compiled once per JD.
 
-    # Count frequency — higher frequency = more important
-    freq = Counter(keywords)
+    Keywords are matched as whole tokens (or whole token sequences for
+    phrases), so "java" no longer matches inside "javascript" and short
+    keywords like "go" or "r" only match on their own. Skills also match
+    under their aliases ("nodejs" finds node.js). A scan is a single pass
+    over the text's tokens with one dict lookup per token.
+    """
 
-    # Return unique keywords sorted by frequency (most important first)
-    return [word for word, _ in freq.most_common(50)]
+    def __init__(self, keywords: list[str]):
+        self.keywords = list(keywords)
+        # first token -> [(token sequence, keyword)], longest phrase first
+        self._index: dict[str, list[tuple[tuple[str, ...], str]]] = {}
+        for kw in self.keywords:
+            for spelling in _spellings(kw):
+                seq = tuple(tok for tok, _ in tokenize(spelling))
+                if seq:
+                    self._index.setdefault(seq[0], []).append((seq, kw))
+        for candidates in self._index.values():
+            candidates.sort(key=lambda c: len(c[0]), reverse=True)
+
+    def scan_tokens(self, tokens: list[tuple[str, int]]) -> dict[str, list[int]]:
+        """Return {keyword: [char offsets]} for every keyword found in the tokens."""
+        hits: dict[str, list[int]] = {}
+        words = [tok for tok, _ in tokens]
+        for i, word in enumerate(words):
+            candidates = self._index.get(word)
+            if candidates is None:
+                continue
+            matched = set()
+            for seq, kw in candidates:
+                if kw in matched:
+                    continue
+                if len(seq) == 1 or tuple(words[i:i + len(seq)]) == seq:
+                    hits.setdefault(kw, []).append(tokens[i][1])
+                    matched.add(kw)
+        return hits
+
+    def scan(self, text: str) -> dict[str, list[int]]:
+        """Return {keyword: [char offsets]} for every keyword found in text."""
+        return self.scan_tokens(tokenize(text))
+
+
+def _spellings(keyword: str) -> list[str]:
+    # tech_terms tokenizes its tables with this module's tokenize, so it is
+    # imported on first use rather than at the top
+    from services.tech_terms import variants
+    return variants(keyword)
+
+
+@lru_cache(maxsize=512)
+def _compile_matcher(keywords: tuple[str, ...]) -> KeywordMatcher:
+    return KeywordMatcher(list(keywords))
+
+
+def get_matcher(jd_keywords: list[str]) -> KeywordMatcher:
+    """Compiled matcher for a JD's keyword list (cached across requests)."""
+    return _compile_matcher(tuple(jd_keywords))
 
 
 def calculate_ats_score(
     resume_text: str,
     jd_keywords: list[str],
     suggested_bullets: Optional[list[str]] = None,
+    keyword_weights: Optional[list[float]] = None,
 ) -> dict:
     """
     Calculate ATS readiness scores.
@@ -64,10 +95,55 @@ def calculate_ats_score(
         resume_text: the raw resume text
         jd_keywords: extracted keywords from the JD
         suggested_bullets: optional list of rewritten bullet strings
+        keyword_weights: optional weight per keyword (same order); without
+            them every keyword counts equally
 
     Returns:
         dict with before_score, after_score, matched_keywords, missing_keywords
     """
+    with span("ats_scoring", ATS_SCORING_SECONDS, mode="single"):
+        return _score_tokens(tokenize(resume_text), jd_keywords, suggested_bullets, keyword_weights)
+
+
+def calculate_ats_scores_batch(
+    resume_text: str,
+    jd_keyword_lists: list[list[str]],
+    suggested_bullet_lists: Optional[list[Optional[list[str]]]] = None,
+    keyword_weight_lists: Optional[list[Optional[list[float]]]] = None,
+) -> list[dict]:
+    """
+    Score one resume against several JDs in one pass.
+    The resume is tokenized once and shared across every JD.
+
+    Args:
+        resume_text: the raw resume text
+        jd_keyword_lists: one extracted keyword list per JD
+        suggested_bullet_lists: optional rewritten bullets per JD (same order)
+        keyword_weight_lists: optional keyword weights per JD (same order)
+
+    Returns:
+        list of score dicts, in the same order as jd_keyword_lists
+    """
+    with span("ats_scoring", ATS_SCORING_SECONDS, mode="batch"):
+        resume_tokens = tokenize(resume_text)
+        if suggested_bullet_lists is None:
+            suggested_bullet_lists = [None] * len(jd_keyword_lists)
+        if keyword_weight_lists is None:
+            keyword_weight_lists = [None] * len(jd_keyword_lists)
+        return [
+            _score_tokens(resume_tokens, keywords, bullets, weights)
+            for keywords, bullets, weights in zip(
+                jd_keyword_lists, suggested_bullet_lists, keyword_weight_lists
+            )
+        ]
+
+
+def _score_tokens(
+    resume_tokens: list[tuple[str, int]],
+    jd_keywords: list[str],
+    suggested_bullets: Optional[list[str]] = None,
+    keyword_weights: Optional[list[float]] = None,
+) -> dict:
     if not jd_keywords:
         return {
             "before_score": 0,
@@ -77,27 +153,32 @@ def calculate_ats_score(
             "new_matches_from_bullets": [],
         }
 
-    resume_lower = resume_text.lower()
+    matcher = get_matcher(jd_keywords)
+
+    # Each keyword counts its weight; equal weights reduce to the plain match ratio
+    weighted = keyword_weights is not None and len(keyword_weights) == len(jd_keywords)
+    weight = dict(zip(jd_keywords, keyword_weights)) if weighted else dict.fromkeys(jd_keywords, 1.0)
+    total_weight = sum(weight.values()) or 1.0
 
     # Calculate BEFORE score
-    before_matched = [kw for kw in jd_keywords if kw in resume_lower]
-    before_score = round((len(before_matched) / len(jd_keywords)) * 100)
+    resume_hits = matcher.scan_tokens(resume_tokens)
+    before_matched = [kw for kw in jd_keywords if kw in resume_hits]
+    before_weight = sum(weight[kw] for kw in before_matched)
+    before_score = round(before_weight / total_weight * 100)
 
     # Calculate AFTER score (with suggested bullets injected)
-    if suggested_bullets:
-        enhanced_text = resume_lower + " " + " ".join(
-            b.lower() for b in suggested_bullets
-        )
-        after_matched = [kw for kw in jd_keywords if kw in enhanced_text]
-        new_matches = [
-            kw for kw in after_matched if kw not in before_matched
-        ]
-    else:
-        after_matched = before_matched
-        new_matches = []
+    bullet_hits: set[str] = set()
+    for bullet in suggested_bullets or []:
+        bullet_hits.update(matcher.scan(bullet))
+    new_matches = [
+        kw for kw in jd_keywords if kw in bullet_hits and kw not in resume_hits
+    ]
+    after_weight = before_weight + sum(weight[kw] for kw in new_matches)
+    after_score = round(after_weight / total_weight * 100)
 
-    after_score = round((len(after_matched) / len(jd_keywords)) * 100)
-    missing = [kw for kw in jd_keywords if kw not in (after_matched if suggested_bullets else before_matched)]
+    missing = [
+        kw for kw in jd_keywords if kw not in resume_hits and kw not in bullet_hits
+    ]
 
     return {
         "before_score": min(before_score, 100),
@@ -106,4 +187,6 @@ def calculate_ats_score(
         "missing_keywords": missing[:15],  # Top 15 most important missing
         "new_matches_from_bullets": new_matches,
         "total_jd_keywords": len(jd_keywords),
+        "weighted": weighted,
+        "keyword_counts": {kw: len(resume_hits[kw]) for kw in before_matched},
     }
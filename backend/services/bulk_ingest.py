@@ -0,0 +1,232 @@
+"""
+Bulk Ingestion Service
+Parses a whole cohort's resumes (a zip archive or a directory of PDFs) in
+parallel across cores and writes one compact JSONL record per file.
+
+Also runnable offline:
+    python -m services.bulk_ingest resumes.zip -o cohort.jsonl [--workers 8] [--mode layout]
+"""
+
+import argparse
+import hashlib
+import json
+import multiprocessing
+import os
+import time
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, Executor, ProcessPoolExecutor, wait
+from typing import Callable, Iterator, Optional
+
+from config import (
+    BULK_INGEST_WORKERS,
+    BULK_JOB_WORKERS,
+    MAX_FILE_SIZE_MB,
+    PDF_EXTRACTION_MODE,
+    PDF_MAX_PAGES,
+    PDF_PARSE_TIMEOUT_SECONDS,
+)
+from services.pdf_parser import EXTRACTION_MODES, extract_text_from_pdf
+
+_job_pool = None
+
+
+def get_job_pool() -> ProcessPoolExecutor:
+    """Lazy-initialize the parser pool shared by every API job in this process."""
+    global _job_pool
+    if _job_pool is None:
+        # spawn, not fork: the API process runs an event loop and thread pools
+        _job_pool = ProcessPoolExecutor(
+            max_workers=BULK_JOB_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _job_pool
+
+
+def shutdown_job_pool() -> None:
+    """Stop the shared parser processes (called on app shutdown, or once the pool breaks)."""
+    global _job_pool
+    if _job_pool is not None:
+        _job_pool.shutdown(wait=False, cancel_futures=True)
+        _job_pool = None
+
+
+def list_sources(path: str) -> list[str]:
+    """Names of the PDFs in a zip archive or directory, in a stable order."""
+    if zipfile.is_zipfile(path):
+        with zipfile.ZipFile(path) as archive:
+            return sorted(
+                info.filename for info in archive.infolist()
+                if not info.is_dir() and _is_pdf(info.filename)
+            )
+    if not os.path.isdir(path):
+        raise ValueError(f"{path} is not a zip archive or a directory")
+    return sorted(
+        os.path.relpath(os.path.join(root, name), path)
+        for root, _, files in os.walk(path)
+        for name in files
+        if _is_pdf(name)
+    )
+
+
+def iter_sources(path: str, names: list[str]) -> Iterator[tuple[str, Optional[bytes], Optional[str]]]:
+    """
+    Lazily yield (name, bytes, error) for each PDF, so only the files in
+    flight are held in memory. Oversized files yield an error instead of bytes.
+    """
+    max_bytes = MAX_FILE_SIZE_MB * 1024 * 1024
+    if zipfile.is_zipfile(path):
+        with zipfile.ZipFile(path) as archive:
+            for name in names:
+                # Check the declared size before inflating anything
+                if archive.getinfo(name).file_size > max_bytes:
+                    yield name, None, f"File size exceeds {MAX_FILE_SIZE_MB}MB limit."
+                    continue
+                try:
+                    data = archive.read(name)
+                except (zipfile.BadZipFile, OSError) as e:
+                    yield name, None, f"Failed to extract from archive: {str(e)}"
+                    continue
+                yield name, data, None
+        return
+
+    for name in names:
+        full_path = os.path.join(path, name)
+        if os.path.getsize(full_path) > max_bytes:
+            yield name, None, f"File size exceeds {MAX_FILE_SIZE_MB}MB limit."
+            continue
+        with open(full_path, "rb") as f:
+            yield name, f.read(), None
+
+
+def ingest(
+    path: str,
+    output_path: str,
+    workers: int = BULK_INGEST_WORKERS,
+    on_progress: Optional[Callable[[int, int], None]] = None,
+    executor: Optional[Executor] = None,
+    mode: str = PDF_EXTRACTION_MODE,
+) -> dict:
+    """
+    Parse every PDF under path and write JSONL records to output_path.
+
+    Each line is {"file", "sha256", "parsed_resume"} on success or
+    {"file", "error"} on failure; records are written as they complete.
+
+    Args:
+        path: zip archive or directory of PDFs
+        output_path: JSONL file to create
+        workers: number of parser processes (the size of executor, if given)
+        on_progress: called with (done, total) after each file
+        executor: pool to parse in, e.g. get_job_pool(); a private pool of
+            workers processes is started (and stopped) when omitted
+        mode: pdf_parser extraction mode
+
+    Returns:
+        report dict with counts, per-file failures and throughput
+    """
+    names = list_sources(path)
+    total = len(names)
+    failures = []
+    succeeded = 0
+    pages = 0
+    started = time.perf_counter()
+
+    # Keep a couple of files queued per worker; more just costs memory
+    max_in_flight = workers * 2
+
+    own_executor = executor is None
+    if own_executor:
+        executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+
+    try:
+        with open(output_path, "w", encoding="utf-8") as out:
+            in_flight = set()
+            done_count = 0
+
+            def record(result: dict) -> None:
+                nonlocal succeeded, pages, done_count
+                out.write(json.dumps(result, ensure_ascii=False, separators=(",", ":")) + "\n")
+                if "error" in result:
+                    failures.append({"file": result["file"], "error": result["error"]})
+                else:
+                    succeeded += 1
+                    pages += result["parsed_resume"].get("page_count", 0)
+                done_count += 1
+                if on_progress:
+                    on_progress(done_count, total)
+
+            for name, data, error in iter_sources(path, names):
+                if error is not None:
+                    record({"file": name, "error": error})
+                    continue
+                in_flight.add(executor.submit(_parse_one, name, data, mode))
+                if len(in_flight) >= max_in_flight:
+                    finished, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        record(future.result())
+
+            for future in wait(in_flight).done:
+                record(future.result())
+    finally:
+        if own_executor:
+            executor.shutdown()
+
+    elapsed = time.perf_counter() - started
+    return {
+        "total": total,
+        "succeeded": succeeded,
+        "failed": len(failures),
+        "failures": failures,
+        "pages": pages,
+        "elapsed_seconds": round(elapsed, 3),
+        "files_per_second": round(total / elapsed, 2) if elapsed else 0.0,
+        "pages_per_second": round(pages / elapsed, 2) if elapsed else 0.0,
+        "output_path": output_path,
+    }
+
+
+def _parse_one(name: str, data: bytes, mode: str) -> dict:
+    """Worker entry point — never raises, so one bad PDF can't sink the batch."""
+    try:
+        parsed = extract_text_from_pdf(
+            data,
+            max_pages=PDF_MAX_PAGES,
+            timeout_seconds=PDF_PARSE_TIMEOUT_SECONDS,
+            mode=mode,
+        )
+    except Exception as e:
+        return {"file": name, "error": f"Failed to parse PDF: {str(e)}"}
+    return {
+        "file": name,
+        "sha256": hashlib.sha256(data).hexdigest(),
+        "parsed_resume": parsed,
+    }
+
+
+def _is_pdf(name: str) -> bool:
+    return name.lower().endswith(".pdf") and not os.path.basename(name).startswith(".")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Bulk-parse a cohort's resumes into JSONL.")
+    parser.add_argument("source", help="zip archive or directory of PDF resumes")
+    parser.add_argument("-o", "--output", required=True, help="JSONL file to write")
+    parser.add_argument("--workers", type=int, default=BULK_INGEST_WORKERS)
+    parser.add_argument("--mode", choices=EXTRACTION_MODES, default=PDF_EXTRACTION_MODE)
+    args = parser.parse_args()
+
+    report = ingest(args.source, args.output, workers=args.workers, mode=args.mode)
+    for failure in report["failures"]:
+        print(f"FAILED {failure['file']}: {failure['error']}")
+    print(
+        f"Parsed {report['succeeded']}/{report['total']} files "
+        f"({report['pages']} pages) in {report['elapsed_seconds']}s — "
+        f"{report['files_per_second']} files/s, {report['pages_per_second']} pages/s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Cohort Scoring Service
+Scores every resume in a cohort against every active JD at once for the TPO
+dashboard. Resumes and JDs are encoded as sparse binary matrices over one
+shared keyword vocabulary, so the full students × JDs score matrix is a
+single sparse matrix multiply instead of one calculate_ats_score call per pair.
+JD rows hold keyword weights, so the scores are the weighted ones.
+"""
+
+from typing import Optional
+
+import numpy as np
+from scipy import sparse
+
+from services.ats_scorer import KeywordMatcher, tokenize
+from services.keyword_extractor import extract_weighted_keywords
+
+
+class CohortScores:
+    """
+    Students × JDs matrix of baseline ATS scores (0-100), with the same
+    semantics as calculate_ats_score's before_score.
+    """
+
+    def __init__(self, student_ids: list, jd_ids: list, scores: np.ndarray):
+        self.student_ids = student_ids
+        self.jd_ids = jd_ids
+        self.scores = scores
+
+    def top_k(self, k: int) -> dict:
+        """Best k JDs per student as {student_id: [{"jd_id", "score"}, ...]}."""
+        k = min(k, len(self.jd_ids))
+        if k <= 0:
+            return {sid: [] for sid in self.student_ids}
+
+        # argpartition picks the top k in O(J); only those k are sorted
+        top = np.argpartition(-self.scores, k - 1, axis=1)[:, :k]
+        top_scores = np.take_along_axis(self.scores, top, axis=1)
+        order = np.argsort(-top_scores, axis=1, kind="stable")
+        top = np.take_along_axis(top, order, axis=1)
+
+        return {
+            sid: [
+                {"jd_id": self.jd_ids[j], "score": int(self.scores[i, j])}
+                for j in top[i]
+            ]
+            for i, sid in enumerate(self.student_ids)
+        }
+
+    def jd_readiness(self, threshold: int) -> list[dict]:
+        """Per-JD aggregate: mean score and share of students at or above threshold."""
+        if not self.student_ids:
+            return [{"jd_id": jd_id, "mean_score": 0.0, "ready_share": 0.0} for jd_id in self.jd_ids]
+        means = self.scores.mean(axis=0)
+        ready = (self.scores >= threshold).mean(axis=0)
+        return [
+            {
+                "jd_id": jd_id,
+                "mean_score": round(float(means[j]), 1),
+                "ready_share": round(float(ready[j]), 3),
+            }
+            for j, jd_id in enumerate(self.jd_ids)
+        ]
+
+
+def score_cohort(
+    resumes: list[tuple[str, str]],
+    jds: list[tuple[str, str]],
+) -> CohortScores:
+    """
+    Score every resume against every JD.
+
+    Args:
+        resumes: (student_id, resume raw_text) pairs
+        jds: (jd_id, jd_text) pairs
+
+    Returns:
+        CohortScores with a len(resumes) × len(jds) score matrix
+    """
+    weighted_lists = [extract_weighted_keywords(text) for _, text in jds]
+    jd_keyword_lists = [[kw for kw, _ in weighted] for weighted in weighted_lists]
+
+    # Shared vocabulary over every JD's keywords
+    vocabulary: dict[str, int] = {}
+    for keywords in jd_keyword_lists:
+        for kw in keywords:
+            vocabulary.setdefault(kw, len(vocabulary))
+
+    jd_matrix = _encode(
+        [[vocabulary[kw] for kw in keywords] for keywords in jd_keyword_lists],
+        len(vocabulary),
+        values=[[w for _, w in weighted] for weighted in weighted_lists],
+    )
+
+    # One matcher for the whole vocabulary; each resume is scanned once
+    matcher = KeywordMatcher(list(vocabulary))
+    resume_matrix = _encode(
+        [
+            [vocabulary[kw] for kw in matcher.scan_tokens(tokenize(text))]
+            for _, text in resumes
+        ],
+        len(vocabulary),
+    )
+
+    # matched[i, j] = weight of keywords(resume i) ∩ keywords(jd j)
+    matched = (resume_matrix @ jd_matrix.T).toarray()
+    jd_totals = np.asarray(jd_matrix.sum(axis=1)).ravel()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scores = np.where(jd_totals > 0, matched / jd_totals * 100, 0)
+
+    return CohortScores(
+        student_ids=[sid for sid, _ in resumes],
+        jd_ids=[jd_id for jd_id, _ in jds],
+        scores=np.minimum(np.rint(scores), 100).astype(np.int16),
+    )
+
+
+def _encode(rows: list[list[int]], width: int, values: Optional[list[list[float]]] = None) -> sparse.csr_matrix:
+    """CSR matrix with a 1 (or the matching value) at every (row, column) listed."""
+    indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+    np.cumsum([len(r) for r in rows], out=indptr[1:])
+    indices = np.fromiter((c for r in rows for c in r), dtype=np.int32, count=int(indptr[-1]))
+    if values is None:
+        data = np.ones(len(indices), dtype=np.float32)
+    else:
+        data = np.fromiter((v for r in values for v in r), dtype=np.float64, count=len(indices))
+    return sparse.csr_matrix((data, indices, indptr), shape=(len(rows), width))
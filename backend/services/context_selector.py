@@ -0,0 +1,192 @@
+"""
+Context Selector Service — Send the LLM only the resume lines a JD is about
+Prompt tokens dominate Groq latency and TPM budget, and most of a resume is
+irrelevant to any one JD. The resume is split into sections and lines
+(pdf_parser._extract_sections), each line is ranked against the JD keywords
+with BM25, and the best lines are packed into a token budget. Kept lines are
+emitted in their original order under their section headings, so the prompt
+still reads like a resume.
+
+Every selection reports its prompt-token savings so routes can return them
+in the response metadata.
+"""
+
+import math
+import re
+from functools import lru_cache
+from typing import Optional
+
+from config import PROMPT_CONTEXT_TOKEN_BUDGET
+from services.ats_scorer import tokenize
+from services.metrics import PROMPT_CONTEXT_TOKENS
+from services.pdf_parser import _extract_sections
+
+# BM25 parameters (the usual defaults)
+_K1 = 1.2
+_B = 0.75
+
+# Sections that carry the evidence for a rewrite rank slightly higher at equal overlap
+_SECTION_WEIGHTS = {
+    "Skills": 1.2,
+    "Experience": 1.15,
+    "Projects": 1.15,
+    "Header": 0.5,
+}
+
+# Lines starting with a bullet glyph always start a new item
+_BULLET_RE = re.compile(r"^\s*[•▪●◦\-*–]\s*")
+
+# Word pieces and standalone punctuation, for count_tokens
+_PIECE_RE = re.compile(r"\w+|[^\w\s]")
+
+
+def count_tokens(text: str) -> int:
+    """
+    Estimate how many LLM tokens text costs.
+
+    Short words are one token and long ones roughly one per six characters;
+    punctuation is one token each. Close enough to the Llama tokenizer on
+    English resume text for budgeting, without loading a tokenizer.
+    """
+    return sum(1 + (len(piece) - 1) // 6 for piece in _PIECE_RE.findall(text))
+
+
+class ContextSelector:
+    """
+    One resume, tokenized and indexed once; select() ranks it against any
+    keyword list, so a batch of JDs reuses the same index.
+    """
+
+    def __init__(self, sections: dict, baseline: str):
+        """
+        Args:
+            sections: heading -> content, as pdf_parser returns them
+            baseline: the context that would be sent without compaction
+        """
+        self.baseline = baseline
+        self.baseline_tokens = count_tokens(baseline)
+        self.headings = [h for h, content in sections.items() if content.strip()]
+        # (section index, text, term frequencies, length in terms, token cost)
+        self.units: list[tuple[int, str, dict, int, int]] = []
+        doc_freq: dict[str, int] = {}
+        for section, heading in enumerate(self.headings):
+            for text in _split_items(sections[heading]):
+                terms: dict[str, int] = {}
+                for tok, _ in tokenize(text):
+                    terms[tok] = terms.get(tok, 0) + 1
+                for tok in terms:
+                    doc_freq[tok] = doc_freq.get(tok, 0) + 1
+                self.units.append((section, text, terms, sum(terms.values()), count_tokens(text) + 1))
+        n = len(self.units)
+        self.idf = {
+            tok: math.log((n - df + 0.5) / (df + 0.5) + 1.0) for tok, df in doc_freq.items()
+        }
+        self.avg_len = sum(u[3] for u in self.units) / n if n else 0.0
+
+    def select(
+        self,
+        keywords: list[str],
+        query: str = "",
+        budget: Optional[int] = None,
+        engine: str = "default",
+    ) -> tuple[str, dict]:
+        """
+        Pack the lines most relevant to keywords (and query) into budget tokens.
+
+        Args:
+            keywords: JD keywords, most important first
+            query: extra text to match, e.g. the experience being rewritten
+            budget: token budget for the context (default PROMPT_CONTEXT_TOKEN_BUDGET; 0 = off)
+            engine: label for the savings metric
+
+        Returns:
+            (context, stats) where stats has original_tokens, context_tokens,
+            saved_tokens, budget and compacted
+        """
+        budget = PROMPT_CONTEXT_TOKEN_BUDGET if budget is None else budget
+        if not budget or self.baseline_tokens <= budget or not self.units:
+            return self.baseline, self._stats(self.baseline_tokens, budget, engine)
+
+        query_terms = _query_terms(keywords, query)
+        ranked = sorted(
+            range(len(self.units)),
+            key=lambda i: (-self._score(i, query_terms), i),
+        )
+
+        kept = set()
+        used = 0
+        heading_cost = {}
+        for i in ranked:
+            section, _, _, _, cost = self.units[i]
+            # A section's heading is paid for by its first kept line
+            extra = 0 if section in heading_cost else count_tokens(self.headings[section]) + 3
+            if used + cost + extra > budget:
+                continue
+            kept.add(i)
+            used += cost + extra
+            heading_cost.setdefault(section, extra)
+
+        parts = []
+        for section, heading in enumerate(self.headings):
+            lines = [u[1] for i, u in enumerate(self.units) if i in kept and u[0] == section]
+            if lines:
+                parts.append(f"### {heading}\n" + "\n".join(lines))
+        context = "\n\n".join(parts)
+        return context, self._stats(count_tokens(context), budget, engine)
+
+    def _score(self, i: int, query_terms: set[str]) -> float:
+        section, _, terms, length, _ = self.units[i]
+        score = 0.0
+        norm = _K1 * (1 - _B + _B * length / self.avg_len) if self.avg_len else _K1
+        for tok in query_terms:
+            tf = terms.get(tok)
+            if tf:
+                score += self.idf[tok] * tf * (_K1 + 1) / (tf + norm)
+        return score * _SECTION_WEIGHTS.get(self.headings[section], 1.0)
+
+    def _stats(self, context_tokens: int, budget: int, engine: str) -> dict:
+        PROMPT_CONTEXT_TOKENS.labels(engine, "original").inc(self.baseline_tokens)
+        PROMPT_CONTEXT_TOKENS.labels(engine, "sent").inc(context_tokens)
+        return {
+            "original_tokens": self.baseline_tokens,
+            "context_tokens": context_tokens,
+            "saved_tokens": self.baseline_tokens - context_tokens,
+            "budget": budget,
+            "compacted": context_tokens < self.baseline_tokens,
+        }
+
+
+def selector_for_parsed(parsed_resume: dict, baseline: str) -> ContextSelector:
+    """Selector over a pdf_parser result (its sections, or raw_text when none were found)."""
+    sections = parsed_resume.get("sections") or {"Resume": parsed_resume.get("raw_text", "")}
+    return ContextSelector(sections, baseline)
+
+
+@lru_cache(maxsize=128)
+def selector_for_text(resume_text: str) -> ContextSelector:
+    """Selector over plain resume text (rewrite and roadmap requests), cached per text."""
+    return ContextSelector(_extract_sections(resume_text), resume_text)
+
+
+def _split_items(content: str) -> list[str]:
+    """
+    Split section content into items: one per bullet or line, with wrapped
+    continuation lines (starting lowercase) joined back onto their item.
+    """
+    items: list[str] = []
+    for line in content.split("\n"):
+        stripped = line.strip()
+        if not stripped:
+            continue
+        continuation = stripped[0].islower() and not _BULLET_RE.match(line)
+        if continuation and items:
+            items[-1] = f"{items[-1]} {stripped}"
+        else:
+            items.append(stripped)
+    return items
+
+
+def _query_terms(keywords: list[str], query: str) -> set[str]:
+    terms = {tok for keyword in keywords for tok, _ in tokenize(keyword)}
+    terms.update(tok for tok, _ in tokenize(query))
+    return terms
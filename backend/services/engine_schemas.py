@@ -0,0 +1,123 @@
+"""
+Engine Schemas — Pydantic models for each engine's JSON response
+Used by response_parser to validate completions item by item, so one
+malformed bullet, gap or question is dropped instead of failing the whole
+response. Fields without a default are required; a response missing one is
+what triggers a continuation request.
+
+Extra keys are kept (extra="allow") so prompt additions such as
+alternative_bullets pass through untouched.
+"""
+
+from typing import Optional, Union
+
+from pydantic import BaseModel, ConfigDict, Field
+
+# Values the model writes either as a number or as text ("8", 8, "3/5")
+Scalar = Union[str, int, float]
+
+
+class _Lenient(BaseModel):
+    model_config = ConfigDict(extra="allow")
+
+
+# ── Bullet engine ──
+
+class Bullet(_Lenient):
+    original: str = ""
+    rewritten: str
+    jd_keywords_used: list[str] = []
+    rationale: str = ""
+
+
+class MatchAnalysis(_Lenient):
+    strong_matches: list[str] = []
+    partial_matches: list[str] = []
+    gaps: list[str] = []
+
+
+class BulletsResponse(_Lenient):
+    bullets: list[Bullet] = Field(min_length=1)
+    match_analysis: MatchAnalysis
+
+
+# ── Rewrite engine ──
+
+class RewriteResponse(_Lenient):
+    optimized_bullet: str
+    original_source_snippet: str = ""
+    mapping_logic: str = ""
+    honesty_check: str = "Fail"
+    alternative_bullets: list[str] = []
+
+
+class RewriteItem(RewriteResponse):
+    index: Optional[Scalar] = None
+
+
+class MultiRewriteResponse(_Lenient):
+    rewrites: list[RewriteItem] = Field(min_length=1)
+
+
+# ── Career roadmap ──
+
+class LearningResource(_Lenient):
+    resource_name: str
+    provider: str = ""
+    link_placeholder: str = ""
+    estimated_time: str = ""
+
+
+class SkillGap(_Lenient):
+    skill: str
+    frequency: Scalar = ""
+    impact_score: Scalar = ""
+    learning_path: list[LearningResource] = []
+
+
+class RoadmapResponse(_Lenient):
+    identified_gaps: list[SkillGap]
+    overall_readiness_summary: str
+
+
+# ── Interview prep ──
+
+class InterviewQuestion(_Lenient):
+    category: str = ""
+    question: str
+    intent: str = ""
+    hint_for_student: str = ""
+
+
+class InterviewResponse(_Lenient):
+    project_summary: str
+    interview_prep: list[InterviewQuestion] = Field(min_length=1)
+
+
+# ── Assessment prep ──
+
+class AssessmentSection(_Lenient):
+    name: str
+    difficulty: str = ""
+
+
+class TestPattern(_Lenient):
+    provider: str = "Unknown"
+    sections: list[AssessmentSection] = []
+
+
+class AssessmentResponse(_Lenient):
+    predicted_company: str
+    assessment_tier: str
+    test_pattern: TestPattern
+    preparation_roadmap: str
+
+
+ENGINE_SCHEMAS: dict[str, type[BaseModel]] = {
+    "bullets": BulletsResponse,
+    "rewrite": RewriteResponse,
+    "rewrite_batch": MultiRewriteResponse,
+    "roadmap": RoadmapResponse,
+    "interview": InterviewResponse,
+    "assessment": AssessmentResponse,
+}
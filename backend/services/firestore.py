@@ -1,22 +1,55 @@
 """
 Firestore Service
 Handles saving and retrieving user sessions from Firebase Firestore.
+firebase_admin (and gRPC under it) is imported on first use, so processes
+that never touch Firestore do not pay for it at startup.
 """
 
 import os
 import json
-import firebase_admin
-from firebase_admin import credentials, firestore
+import time
 from datetime import datetime, timezone
 
 _db = None
+# A failed initialization is remembered for this long instead of
+# re-probing credentials on every call
+_INIT_RETRY_SECONDS = 60
+_init_error = None
+_init_retry_at = 0.0
+
+# Fields needed to render the history list; everything else is fetched
+# per session on demand
+SUMMARY_FIELDS = [
+    "jd_snippet",
+    "created_at",
+    "ats_scores.before_score",
+    "ats_scores.after_score",
+    "bullet_count",
+    "keyword_count",
+]
 
 
 def _get_db():
     """Lazy-initialize Firestore client."""
-    global _db
+    global _db, _init_error, _init_retry_at
     if _db is not None:
         return _db
+    if _init_error is not None and time.monotonic() < _init_retry_at:
+        raise _init_error
+
+    try:
+        _db = _init_db()
+    except Exception as e:
+        _init_error = e
+        _init_retry_at = time.monotonic() + _INIT_RETRY_SECONDS
+        raise
+    _init_error = None
+    return _db
+
+
+def _init_db():
+    import firebase_admin
+    from firebase_admin import credentials, firestore
 
     if not firebase_admin._apps:
         creds_json = os.getenv("FIREBASE_CREDENTIALS_JSON", "")
@@ -29,37 +62,103 @@ def _get_db():
             print("[Firestore] WARNING: No FIREBASE_CREDENTIALS_JSON found, trying default credentials")
             firebase_admin.initialize_app()
 
-    _db = firestore.client()
-    return _db
+    return firestore.client()
 
 
-def save_session(user_id: str, data: dict) -> str:
-    """Save a resume analysis session to Firestore."""
-    db = _get_db()
-    session_data = {
+def connect() -> None:
+    """Initialize the Firestore client ahead of the first request."""
+    _get_db()
+
+
+def build_session_data(user_id: str, data: dict) -> dict:
+    """Shape a session document from a save request."""
+    session = {
         "user_id": user_id,
-        "jd_text": data.get("jd_text", ""),
         "jd_snippet": data.get("jd_text", "")[:120],
         "bullets": data.get("bullets", []),
         "match_analysis": data.get("match_analysis", {}),
         "ats_scores": data.get("ats_scores", {}),
-        "jd_keywords": data.get("jd_keywords", []),
+        # Denormalized so the summary listing needs no arrays
+        "bullet_count": len(data.get("bullets", [])),
+        "keyword_count": len(data.get("jd_keywords", [])),
         "created_at": datetime.now(timezone.utc).isoformat(),
     }
-    doc_ref = db.collection("users").document(user_id).collection("sessions").add(session_data)
-    return doc_ref[1].id
+    # Sessions for a JD confirmed in the shared collection reference it by
+    # hash instead of carrying their own copy of the text. The keywords are
+    # the ones this session was scored against, so they are always kept.
+    session["jd_keywords"] = data.get("jd_keywords", [])
+    if data.get("jd_hash"):
+        session["jd_hash"] = data["jd_hash"]
+    else:
+        session["jd_text"] = data.get("jd_text", "")
+    return session
 
 
-def get_sessions(user_id: str, limit: int = 20) -> list:
-    """Retrieve recent sessions for a user, newest first."""
+def save_session(user_id: str, data: dict) -> str:
+    """Save a resume analysis session to Firestore."""
+    db = _get_db()
+    session_id = db.collection("users").document(user_id).collection("sessions").document().id
+    save_sessions_batch([(user_id, session_id, build_session_data(user_id, data))])
+    return session_id
+
+
+def save_sessions_batch(items: list[tuple[str, str, dict]]) -> None:
+    """
+    Write many sessions in one atomic batch.
+
+    Args:
+        items: (user_id, session_id, session_data) tuples; the caller keeps
+            len(items) + distinct users within Firestore's 500-write limit
+    """
+    db = _get_db()
+    batch = db.batch()
+    scores_by_user: dict[str, list] = {}
+    for user_id, session_id, session_data in items:
+        user_ref = db.collection("users").document(user_id)
+        batch.set(user_ref.collection("sessions").document(session_id), session_data)
+        scores_by_user.setdefault(user_id, []).append(session_data.get("ats_scores", {}))
+
+    # Session and skill-gap aggregate are written atomically,
+    # with one aggregate write per user regardless of session count
+    for user_id, ats_scores in scores_by_user.items():
+        batch.set(
+            _skill_gaps_ref(db.collection("users").document(user_id)),
+            _skill_gap_increments(ats_scores),
+            merge=True,
+        )
+    batch.commit()
+
+
+def get_sessions(
+    user_id: str,
+    limit: int = 20,
+    cursor: str | None = None,
+    summary: bool = False,
+) -> list:
+    """
+    Retrieve recent sessions for a user, newest first.
+
+    Args:
+        user_id: owner of the sessions
+        limit: page size
+        cursor: created_at of the last session on the previous page
+        summary: fetch only the list-view fields (SUMMARY_FIELDS)
+    """
+    from firebase_admin import firestore
+
     db = _get_db()
     sessions_ref = (
         db.collection("users")
         .document(user_id)
         .collection("sessions")
         .order_by("created_at", direction=firestore.Query.DESCENDING)
-        .limit(limit)
     )
+    if summary:
+        sessions_ref = sessions_ref.select(SUMMARY_FIELDS)
+    if cursor:
+        sessions_ref = sessions_ref.start_after({"created_at": cursor})
+    sessions_ref = sessions_ref.limit(limit)
+
     sessions = []
     for doc in sessions_ref.stream():
         session = doc.to_dict()
@@ -68,6 +167,24 @@ def get_sessions(user_id: str, limit: int = 20) -> list:
     return sessions
 
 
+def summarize_session(session: dict) -> dict:
+    """Project a full session dict down to SUMMARY_FIELDS (plus its id)."""
+    summary = {}
+    for field in SUMMARY_FIELDS:
+        parent, _, child = field.partition(".")
+        if parent not in session:
+            continue
+        if child:
+            value = session[parent] or {}
+            if child in value:
+                summary.setdefault(parent, {})[child] = value[child]
+        else:
+            summary[parent] = session[parent]
+    if "id" in session:
+        summary["id"] = session["id"]
+    return summary
+
+
 def get_session_by_id(user_id: str, session_id: str) -> dict | None:
     """Retrieve a single session by ID."""
     db = _get_db()
@@ -83,3 +200,76 @@ def get_session_by_id(user_id: str, session_id: str) -> dict | None:
         session["id"] = doc.id
         return session
     return None
+
+
+def get_jd(jd_hash: str) -> dict | None:
+    """Read a shared JD record from the top-level jds collection."""
+    db = _get_db()
+    doc = db.collection("jds").document(jd_hash).get()
+    if doc.exists:
+        return doc.to_dict()
+    return None
+
+
+def save_jd(jd_hash: str, record: dict) -> None:
+    """Create or update (merge) a shared JD record."""
+    db = _get_db()
+    db.collection("jds").document(jd_hash).set(record, merge=True)
+
+
+def get_skill_gaps(user_id: str) -> dict | None:
+    """Read the user's running keyword aggregate (one document read)."""
+    db = _get_db()
+    doc = _skill_gaps_ref(db.collection("users").document(user_id)).get()
+    if doc.exists:
+        return doc.to_dict()
+    return None
+
+
+def rebuild_skill_gaps(user_id: str) -> dict:
+    """
+    Recompute the aggregate from the user's full history in one pass and
+    store it — used for users whose sessions predate the aggregate.
+    """
+    db = _get_db()
+    user_ref = db.collection("users").document(user_id)
+    # Only the scores are needed, not the full session documents
+    score_docs = user_ref.collection("sessions").select(["ats_scores"]).stream()
+    ats_scores = [doc.to_dict().get("ats_scores", {}) for doc in score_docs]
+
+    aggregate = {
+        "missing": _count_keywords(ats_scores, "missing_keywords"),
+        "matched": _count_keywords(ats_scores, "matched_keywords"),
+        "session_count": len(ats_scores),
+        "updated_at": datetime.now(timezone.utc).isoformat(),
+    }
+    _skill_gaps_ref(user_ref).set(aggregate)
+    return aggregate
+
+
+def _skill_gaps_ref(user_ref):
+    return user_ref.collection("aggregates").document("skill_gaps")
+
+
+def _skill_gap_increments(ats_scores: list[dict]) -> dict:
+    """Merge-set payload that bumps per-keyword counters for new sessions."""
+    from firebase_admin import firestore
+
+    payload = {
+        "session_count": firestore.Increment(len(ats_scores)),
+        "updated_at": datetime.now(timezone.utc).isoformat(),
+    }
+    for target, field in (("missing", "missing_keywords"), ("matched", "matched_keywords")):
+        counts = _count_keywords(ats_scores, field)
+        # An empty map under merge=True would overwrite the stored counters
+        if counts:
+            payload[target] = {kw: firestore.Increment(n) for kw, n in counts.items()}
+    return payload
+
+
+def _count_keywords(ats_scores: list[dict], field: str) -> dict:
+    counts: dict = {}
+    for scores in ats_scores:
+        for kw in scores.get(field, []):
+            counts[kw] = counts.get(kw, 0) + 1
+    return counts
@@ -0,0 +1,107 @@
+"""
+Honesty Verifier Service — Local check that a rewrite invents nothing
+Indexes the student's resume once (its tokens, tech terms and numbers) and
+flags any technology or metric in a rewritten bullet that the resume never
+mentions, e.g. a bullet claiming "SQL" for a resume that only lists "Excel".
+A check is a tokenize plus set lookups, so every bullet can be verified
+without another LLM round trip.
+"""
+
+import re
+from functools import lru_cache
+
+from services.ats_scorer import tokenize
+from services.tech_terms import find_terms
+
+# Numeric claims: 40, 40%, 300+, 5x, 1k, 2.5
+_NUMBER_RE = re.compile(r"\d+(?:\.\d+)?")
+
+
+class ResumeIndex:
+    """Everything a rewrite may legitimately draw on from one resume."""
+
+    def __init__(self, text: str):
+        tokens = tokenize(text)
+        self.tokens = {tok for tok, _ in tokens}
+        # Lenient on the source side: any mention of a term supports it
+        self.terms = {term for term, _ in find_terms(text, lenient=True)}
+        self.numbers = set(_NUMBER_RE.findall(text))
+
+    def supports_term(self, term: str) -> bool:
+        if term in self.terms:
+            return True
+        # A term whose words all appear (e.g. "data" + "analysis") is not invented
+        words = [tok for tok, _ in tokenize(term)]
+        return bool(words) and all(word in self.tokens for word in words)
+
+
+@lru_cache(maxsize=256)
+def get_resume_index(resume_text: str) -> ResumeIndex:
+    """Index for a resume, built once and reused for every bullet checked against it."""
+    return ResumeIndex(resume_text)
+
+
+def verify_bullet(bullet: str, index: ResumeIndex, source_text: str = "") -> dict:
+    """
+    Check a rewritten bullet against the resume.
+
+    Args:
+        bullet: the rewritten bullet text
+        index: the resume's ResumeIndex
+        source_text: extra text the rewrite may draw on (e.g. the original bullet)
+
+    Returns:
+        dict with passed, unsupported_terms and unsupported_metrics
+    """
+    extra = ResumeIndex(source_text) if source_text else None
+
+    unsupported_terms = []
+    for term, _ in find_terms(bullet):
+        if index.supports_term(term) or (extra is not None and extra.supports_term(term)):
+            continue
+        if term not in unsupported_terms:
+            unsupported_terms.append(term)
+
+    unsupported_metrics = []
+    for number in _NUMBER_RE.findall(bullet):
+        if number in index.numbers or (extra is not None and number in extra.numbers):
+            continue
+        if number not in unsupported_metrics:
+            unsupported_metrics.append(number)
+
+    return {
+        "passed": not unsupported_terms and not unsupported_metrics,
+        "unsupported_terms": unsupported_terms,
+        "unsupported_metrics": unsupported_metrics,
+    }
+
+
+def describe_failure(check: dict) -> str:
+    """Human-readable reason for a failed check."""
+    parts = []
+    if check["unsupported_terms"]:
+        parts.append("mentions " + ", ".join(check["unsupported_terms"]))
+    if check["unsupported_metrics"]:
+        parts.append("claims figures " + ", ".join(check["unsupported_metrics"]))
+    return " and ".join(parts) + " not found in your resume"
+
+
+def check_bullets(bullets: list[dict], resume_text: str) -> list[str]:
+    """
+    Verify each generated bullet's "rewritten" text in place.
+
+    Adds an "honesty" verdict to every bullet; the bullet's own "original"
+    counts as a source alongside the resume.
+
+    Returns:
+        the rewritten texts that passed, for ATS scoring
+    """
+    index = get_resume_index(resume_text)
+    passed = []
+    for bullet in bullets:
+        rewritten = bullet.get("rewritten", "")
+        check = verify_bullet(rewritten, index, bullet.get("original", ""))
+        bullet["honesty"] = check
+        if check["passed"]:
+            passed.append(rewritten)
+    return passed
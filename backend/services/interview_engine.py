@@ -4,9 +4,8 @@ Uses the Groq LLM to generate contextual ownership questions
 that test whether a student actually built their project.
 """
 
-import json
-from openai import OpenAI
-from config import GROQ_API_KEY, GROQ_BASE_URL, GROQ_MODEL
+from services.llm_client import chat_completion
+from services.response_parser import parse_engine_response
 
 
 INTERVIEW_SYSTEM_PROMPT = """You are a Senior Technical Interviewer specializing in entry-level engineering roles. You are reviewing a student's project to determine if they actually built it or just followed a tutorial.
@@ -38,7 +37,7 @@ Return a JSON object with this EXACT structure:
 Only return valid JSON. No markdown fences, no extra text."""
 
 
-def generate_interview_prep(project_title: str, project_description: str, tech_stack: list[str], github_url: str = None) -> dict:
+async def generate_interview_prep(project_title: str, project_description: str, tech_stack: list[str], github_url: str = None) -> dict:
     """
     Generate 5 deep-dive interview questions for a student's project.
 
@@ -50,11 +49,6 @@ def generate_interview_prep(project_title: str, project_description: str, tech_s
     Returns:
         dict with project_summary and interview_prep array
     """
-    client = OpenAI(
-        api_key=GROQ_API_KEY,
-        base_url=GROQ_BASE_URL,
-    )
-
     tech_stack_str = ", ".join(tech_stack) if tech_stack else "Not specified"
     github_str = f"\n- GITHUB_URL: {github_url}" if github_url else ""
 
@@ -65,24 +59,22 @@ def generate_interview_prep(project_title: str, project_description: str, tech_s
 
 Generate 5 deep-dive "Contextual Ownership" interview questions for this project. Return valid JSON only."""
 
-    response = client.chat.completions.create(
-        model=GROQ_MODEL,
-        messages=[
-            {"role": "system", "content": INTERVIEW_SYSTEM_PROMPT},
-            {"role": "user", "content": user_prompt},
-        ],
+    result_text = await chat_completion(
+        system_prompt=INTERVIEW_SYSTEM_PROMPT,
+        user_prompt=user_prompt,
         temperature=0.5,
         max_tokens=1500,
-        response_format={"type": "json_object"},
+        engine="interview",
     )
 
-    result_text = response.choices[0].message.content
-    try:
-        return json.loads(result_text)
-    except json.JSONDecodeError:
-        return {
-            "project_summary": "",
-            "interview_prep": [],
-            "error": "Failed to parse LLM response",
-            "raw_response": result_text,
-        }
+    result = await parse_engine_response(
+        result_text, "interview", INTERVIEW_SYSTEM_PROMPT, user_prompt, temperature=0.5, max_tokens=1500
+    )
+    if result is not None:
+        return result
+    return {
+        "project_summary": "",
+        "interview_prep": [],
+        "error": "Failed to parse LLM response",
+        "raw_response": result_text,
+    }
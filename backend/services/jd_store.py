@@ -0,0 +1,258 @@
+"""
+JD Store Service — Shared, deduplicated job descriptions
+Each distinct JD is stored once in the top-level jds collection, keyed by a
+hash of its normalized text, together with its extracted keywords and (once
+generated) its assessment prep. Sessions reference the JD by hash.
+
+Keyword extraction is local and fast, so get_jd never waits on the store:
+a JD this worker has not seen is extracted on the spot, cached in an
+in-process LRU and persisted in the background. Only the assessment prep
+(which is expensive to regenerate) and history hydration read the store.
+"""
+
+import asyncio
+import hashlib
+import threading
+import unicodedata
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Optional
+
+from config import JD_CACHE_MAX_ENTRIES, SINGLE_FLIGHT_ENABLED
+from services.keyword_extractor import extract_weighted_keywords
+from services.metrics import KEYWORD_EXTRACTION_SECONDS, span
+from services.session_store import call_backend
+from services.single_flight import get_flight
+
+# Bump when keyword extraction changes so stored keywords are recomputed
+KEYWORDS_VERSION = 3
+
+_lock = threading.Lock()
+_records: OrderedDict[str, dict] = OrderedDict()
+_hits = 0
+_misses = 0
+# Background writes of newly seen JDs, by hash
+_pending: dict[str, asyncio.Task] = {}
+# Hashes this worker has seen written to (or found in) the store
+_persisted: set[str] = set()
+
+
+def normalize_jd(jd_text: str) -> str:
+    """Canonical form used for hashing: NFC, whitespace runs collapsed."""
+    return " ".join(unicodedata.normalize("NFC", jd_text).split())
+
+
+def jd_hash(jd_text: str) -> str:
+    """Content hash identifying a JD regardless of whitespace and line breaks."""
+    return hashlib.sha256(normalize_jd(jd_text).encode("utf-8")).hexdigest()
+
+
+async def get_jd(jd_text: str) -> dict:
+    """
+    The shared record for a JD, creating it on first sight. Never waits on
+    the backing store; new records are persisted in the background.
+
+    Args:
+        jd_text: job description as pasted by the user
+
+    Returns:
+        dict with hash, text, keywords, keyword_weights and, if this worker
+        has seen it, assessment_prep. The record is shared by every caller
+        (and the LRU), so it and its lists must not be modified.
+    """
+    global _hits, _misses
+    key = jd_hash(jd_text)
+    record = _cache_get(key)
+    if record is not None and record.get("keywords_version") == KEYWORDS_VERSION:
+        _hits += 1
+        return record
+    _misses += 1
+    if SINGLE_FLIGHT_ENABLED:
+        # A cohort pasting the same JD at once does one extraction
+        return await get_flight("jd", copy_results=False).do(key, lambda: _create(key, jd_text))
+    return await _create(key, jd_text)
+
+
+async def _create(key: str, jd_text: str) -> dict:
+    with span("keyword_extraction", KEYWORD_EXTRACTION_SECONDS):
+        weighted = extract_weighted_keywords(jd_text)
+    fields = {
+        "text": jd_text,
+        "keywords": [term for term, _ in weighted],
+        # Parallel to keywords rather than a map, so keys like "node.js" need no field-path escaping
+        "keyword_weights": [weight for _, weight in weighted],
+        "keywords_version": KEYWORDS_VERSION,
+    }
+    record = {**(_cache_get(key) or {}), **fields, "hash": key}
+    _cache_set(key, record)
+    if key not in _pending:
+        task = asyncio.create_task(_persist(key, fields))
+        _pending[key] = task
+        task.add_done_callback(lambda t: _persist_done(key, t))
+    return record
+
+
+async def _persist(key: str, fields: dict) -> None:
+    """Write a newly extracted JD unless the store already has it at this KEYWORDS_VERSION."""
+    stored = await call_backend("get_jd", key)
+    if stored is not None and stored.get("keywords_version") == KEYWORDS_VERSION:
+        # Another worker got there first; keep anything it has that we lack
+        _merge_cached(key, stored)
+        _persisted.add(key)
+        return
+    if stored is None:
+        fields = {**fields, "created_at": datetime.now(timezone.utc).isoformat()}
+    else:
+        # Recomputed keywords for an older record; its original text stays
+        fields = {k: v for k, v in fields.items() if k != "text"}
+    await call_backend("save_jd", key, fields)
+    _persisted.add(key)
+
+
+def _persist_done(key: str, task: asyncio.Task) -> None:
+    _pending.pop(key, None)
+    if not task.cancelled() and task.exception() is not None:
+        # The record is cached here; wait_persisted or the next worker to see the JD tries again
+        print(f"[JDStore] WARNING: persisting {key[:12]} failed: {task.exception()}")
+
+
+async def wait_persisted(key: str) -> None:
+    """
+    Make sure a JD is in the backing store, e.g. before a session references
+    it by hash. Waits for its background write, and writes it again if that
+    write failed.
+
+    Raises:
+        LookupError: the JD is neither stored nor cached on this worker
+        Exception: from the backing store, if the write fails again
+    """
+    if key in _persisted:
+        return
+    task = _pending.get(key)
+    if task is not None:
+        try:
+            await asyncio.shield(task)
+            return
+        except Exception:
+            pass  # Logged by _persist_done; retried below
+    record = _cache_get(key)
+    if record is None:
+        stored = await call_backend("get_jd", key)
+        if stored is None:
+            raise LookupError(f"JD {key[:12]} is not stored")
+        _persisted.add(key)
+        return
+    fields = {k: record[k] for k in ("text", "keywords", "keyword_weights", "keywords_version") if k in record}
+    await _persist(key, fields)
+
+
+async def get_assessment_prep(key: str) -> Optional[dict]:
+    """A JD's assessment prep, from the LRU or, if this worker has none, the backing store."""
+    record = _cache_get(key)
+    if record is not None and "assessment_prep" in record:
+        return record["assessment_prep"]
+    try:
+        stored = await call_backend("get_jd", key)
+    except Exception as e:
+        print(f"[JDStore] WARNING: lookup of {key[:12]} failed: {e}")
+        return None
+    if stored is None or "assessment_prep" not in stored:
+        return None
+    _merge_cached(key, {"assessment_prep": stored["assessment_prep"]})
+    return stored["assessment_prep"]
+
+
+async def get_jd_by_hash(key: str) -> Optional[dict]:
+    """A JD record by hash, from the LRU or the backing store."""
+    global _hits, _misses
+    record = _cache_get(key)
+    if record is not None:
+        _hits += 1
+        return record
+    _misses += 1
+
+    try:
+        record = await call_backend("get_jd", key)
+    except Exception as e:
+        print(f"[JDStore] WARNING: lookup of {key[:12]} failed: {e}")
+        return None
+    if record is None:
+        return None
+    record["hash"] = key
+    _cache_set(key, record)
+    return record
+
+
+async def set_assessment_prep(key: str, result: dict) -> None:
+    """Attach a generated assessment prep to a JD record."""
+    await _save(key, {"assessment_prep": result})
+
+
+async def hydrate_session(session: dict) -> dict:
+    """Fill jd_text (and, for older sessions, jd_keywords) back in for a session stored by JD hash."""
+    key = session.get("jd_hash")
+    if not key or "jd_text" in session:
+        return session
+    record = await get_jd_by_hash(key)
+    if record is None:
+        return {**session, "jd_text": session.get("jd_snippet", ""), "jd_keywords": session.get("jd_keywords", [])}
+    # Sessions saved before they kept their own keywords take the JD's
+    return {**session, "jd_text": record["text"], "jd_keywords": session.get("jd_keywords") or record["keywords"]}
+
+
+def clear_cache() -> None:
+    global _hits, _misses
+    with _lock:
+        _records.clear()
+    _persisted.clear()
+    _hits = 0
+    _misses = 0
+
+
+def stats() -> dict:
+    """LRU hit/miss counts."""
+    lookups = _hits + _misses
+    return {
+        "hits": _hits,
+        "misses": _misses,
+        "hit_ratio": round(_hits / lookups, 4) if lookups else 0.0,
+        "entries": len(_records),
+    }
+
+
+async def _save(key: str, fields: dict) -> dict:
+    """Merge fields into the record in the LRU and the backing store."""
+    record = {**(_cache_get(key) or {}), **fields, "hash": key}
+    _cache_set(key, record)
+    stored = {k: v for k, v in fields.items() if k != "hash"}
+    try:
+        await call_backend("save_jd", key, stored)
+    except Exception as e:
+        # The request still has its record; the next worker to miss recomputes
+        print(f"[JDStore] WARNING: save of {key[:12]} failed: {e}")
+    return record
+
+
+def _merge_cached(key: str, stored: dict) -> None:
+    """Add stored fields the cached record lacks (the cached keywords win)."""
+    with _lock:
+        record = _records.get(key)
+        if record is not None:
+            _records[key] = {**stored, **record}
+
+
+def _cache_get(key: str) -> Optional[dict]:
+    with _lock:
+        record = _records.get(key)
+        if record is not None:
+            _records.move_to_end(key)
+        return record
+
+
+def _cache_set(key: str, record: dict) -> None:
+    with _lock:
+        _records[key] = record
+        _records.move_to_end(key)
+        while len(_records) > JD_CACHE_MAX_ENTRIES:
+            evicted, _ = _records.popitem(last=False)
+            _persisted.discard(evicted)
@@ -0,0 +1,125 @@
+"""
+Incremental JSON Parser
+Consumes an LLM completion token-by-token and reports each finished piece of
+the top-level JSON object as soon as its closing character arrives, so the
+streaming endpoints can forward a bullet or gap long before the model is done.
+"""
+
+import json
+from typing import AsyncIterator, Any
+
+
+class IncrementalJSONParser:
+    """
+    Scanner for a completion shaped like {"key": value, "list": [{...}, ...]}.
+
+    feed() returns events of the form:
+        ("item", key, obj)    — an object inside a top-level array finished
+        ("field", key, value) — a top-level value finished
+    Anything outside the outermost object (markdown fences, chatter) is ignored.
+    """
+
+    def __init__(self):
+        self._text = ""
+        self._pos = 0
+        # Open containers: (opening char, start offset, top-level key owning it)
+        self._stack: list[tuple[str, int, Any]] = []
+        self._in_string = False
+        self._escape = False
+        self._string_start = -1
+        self._expect_key = False
+        self._key = None
+        self._scalar_start = -1
+        self.done = False
+
+    def feed(self, chunk: str) -> list[tuple[str, Any, Any]]:
+        events = []
+        self._text += chunk
+        text = self._text
+
+        for i in range(self._pos, len(text)):
+            if self.done:
+                break
+            c = text[i]
+            depth = len(self._stack)
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif c == '\\':
+                    self._escape = True
+                elif c == '"':
+                    self._in_string = False
+                    if depth == 1:
+                        value = _loads(text[self._string_start:i + 1])
+                        if self._expect_key:
+                            self._key = value
+                            self._expect_key = False
+                        else:
+                            events.append(("field", self._key, value))
+                continue
+
+            if depth == 0:
+                if c == '{':
+                    self._stack.append((c, i, None))
+                    self._expect_key = True
+                continue
+
+            if c == '"':
+                self._in_string = True
+                self._string_start = i
+            elif c in '{[':
+                self._stack.append((c, i, self._key if depth == 1 else None))
+            elif c in '}]':
+                if depth == 1:
+                    self._finish_scalar(text, i, events)
+                    self._stack.pop()
+                    self.done = True
+                    continue
+                _, start, key = self._stack.pop()
+                value = _loads(text[start:i + 1])
+                if depth == 2:
+                    events.append(("field", key, value))
+                elif depth == 3 and self._stack[1][0] == '[' and c == '}':
+                    events.append(("item", self._stack[1][2], value))
+            elif depth == 1:
+                if c == ',':
+                    self._finish_scalar(text, i, events)
+                    self._expect_key = True
+                elif c not in ': \t\r\n' and self._scalar_start < 0:
+                    # Start of a number / true / false / null value
+                    self._scalar_start = i
+
+        self._pos = len(text)
+        return [e for e in events if e[2] is not _INVALID]
+
+    def _finish_scalar(self, text: str, end: int, events: list) -> None:
+        if self._scalar_start >= 0:
+            events.append(("field", self._key, _loads(text[self._scalar_start:end].strip())))
+            self._scalar_start = -1
+
+
+_INVALID = object()
+
+
+def _loads(fragment: str) -> Any:
+    try:
+        return json.loads(fragment)
+    except json.JSONDecodeError:
+        return _INVALID
+
+
+async def iter_json_events(deltas: AsyncIterator[str]) -> AsyncIterator[tuple[str, Any, Any]]:
+    """
+    Run a stream of text deltas through the parser.
+
+    Yields parser events as they complete, then a final ("complete", None, text)
+    event carrying the full completion text for the caller's regular parsing.
+    """
+    parser = IncrementalJSONParser()
+    chunks = []
+    async for delta in deltas:
+        chunks.append(delta)
+        for event in parser.feed(delta):
+            yield event
+    yield ("complete", None, "".join(chunks))
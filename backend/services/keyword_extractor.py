@@ -0,0 +1,154 @@
+"""
+Keyword Extractor Service — Weighted, phrase-aware JD keywords
+The old extractor counted unigrams, so "machine learning" and "spring boot"
+were split into noise and the top keywords were whatever generic words the
+JD repeated most. Extraction now:
+
+1. splits the JD into sections by their headings and weights each one
+   (requirements count most, the about-us blurb and perks least);
+2. walks every line with the tech_terms trie, so multi-word skills are kept
+   whole and aliases are folded into one canonical term ("nodejs" and
+   "Node.js" are both node.js);
+3. keeps the remaining non-stop-words at a fraction of a skill's weight, so
+   non-technical JDs still get keywords.
+
+Each keyword's weight is its summed section weight, scaled so the top
+keyword is 1.0. calculate_ats_score uses the weights for the weighted score.
+"""
+
+import re
+from typing import Optional
+
+from services.ats_scorer import tokenize
+from services.tech_terms import AMBIGUOUS_TERMS, TERM_STARTS, longest_match, looks_technical
+
+# Keywords kept per JD
+MAX_KEYWORDS = 50
+
+# A word that is not a known skill counts this much of one that is
+_GENERIC_WEIGHT = 0.3
+
+# Section headings and their weights, compiled into one pattern that must
+# match a heading line (or the text before its colon) in full, so "About 5
+# years of Python" or "Skills in Java and Go" stay body text. "About the
+# role" is a responsibilities heading; a bare "About" opens the about-us.
+_SECTION_WEIGHTS = {
+    "responsibilities": 2.0,
+    "requirements": 3.0,
+    "preferred": 1.5,
+    "about": 0.25,
+}
+_HEADING_RE = re.compile(
+    r"(?P<responsibilities>about the (role|job|position)|the role|your role|role overview|"
+    r"(key )?responsibilities|what you('ll| will) do|duties|job description)"
+    r"|(?P<requirements>requirements|required|(minimum |basic )?qualifications|must[- ]haves?|"
+    r"(key |technical |required )?skills|skills required|what you('ll)? bring|"
+    r"what we('re| are) looking for|who you are|eligibility|tech stack)"
+    r"|(?P<preferred>preferred|preferred (qualifications|skills)|nice[- ]to[- ]haves?|"
+    r"good[- ]to[- ]haves?|bonus( points)?|plus|added advantage)"
+    r"|(?P<about>about|about (us|the company|the team)|who we are|our company|company overview|"
+    r"benefits|perks|why join( us)?|what we offer|compensation|equal opportunity|our culture|"
+    r"life at \w+)"
+)
+
+# Weight of text before the first recognised heading
+_DEFAULT_WEIGHT = 1.0
+
+_HEADING_STRIP = " \t#*•-–:"
+
+STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'from', 'is', 'are', 'was', 'were', 'be', 'been',
+    'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
+    'could', 'should', 'may', 'might', 'shall', 'can', 'this', 'that',
+    'these', 'those', 'i', 'me', 'my', 'we', 'our', 'you', 'your', 'he',
+    'she', 'it', 'they', 'them', 'their', 'its', 'not', 'no', 'nor',
+    'as', 'if', 'then', 'than', 'so', 'up', 'out', 'about', 'into',
+    'through', 'during', 'before', 'after', 'above', 'below', 'between',
+    'same', 'each', 'every', 'all', 'both', 'few', 'more', 'most',
+    'other', 'some', 'such', 'only', 'own', 'also', 'just', 'very',
+    'any', 'who', 'which', 'what', 'where', 'when', 'how', 'able',
+    'across', 'within', 'including', 'well', 'must', 'role', 'work',
+    'working', 'using', 'based', 'etc', 'like', 'new', 'good', 'great',
+    'looking', 'join', 'team', 'company', 'position', 'candidate',
+    'required', 'preferred', 'years', 'experience', 'strong',
+    # JD boilerplate
+    'ability', 'knowledge', 'understanding', 'familiarity', 'proficiency',
+    'proficient', 'hands-on', 'fundamentals', 'plus', 'bonus', 'nice',
+    'responsibilities', 'requirements', 'qualifications', 'skills',
+    'candidates', 'opportunity', 'opportunities', 'one', 'year', 'us',
+    'fast', 'growing', 'fastest', 'help', 'make', 'e.g', 'i.e', 'per',
+})
+
+
+def extract_weighted_keywords(jd_text: str, limit: int = MAX_KEYWORDS) -> list[tuple[str, float]]:
+    """
+    Weighted keywords of a Job Description, most important first.
+
+    Args:
+        jd_text: job description text
+        limit: maximum number of keywords to return
+
+    Returns:
+        list of (keyword, weight) with weights in (0, 1], the top keyword 1.0
+    """
+    scores: dict[str, float] = {}
+    weight = _DEFAULT_WEIGHT
+    for line in jd_text.split("\n"):
+        section_weight, rest = _heading(line)
+        if section_weight is not None:
+            weight = section_weight
+            line = rest
+        for term, is_skill in _line_terms(line):
+            scores[term] = scores.get(term, 0.0) + (weight if is_skill else weight * _GENERIC_WEIGHT)
+
+    # sorted() is stable, so ties keep first-seen order
+    ranked = sorted(scores.items(), key=lambda item: -item[1])[:limit]
+    if not ranked:
+        return []
+    top = ranked[0][1]
+    return [(term, round(score / top, 3)) for term, score in ranked]
+
+
+def extract_jd_keywords(jd_text: str) -> list[str]:
+    """
+    Extract important keywords from a Job Description.
+    Skills and multi-word phrases come first, weighted by the section they appear in.
+    """
+    return [term for term, _ in extract_weighted_keywords(jd_text)]
+
+
+def _heading(line: str) -> tuple[Optional[float], str]:
+    """
+    (section weight, text to scan) if line opens a section, e.g. "Requirements"
+    or "Must have: Python, SQL"; (None, line) otherwise. Text after a colon
+    belongs to the new section.
+    """
+    head, sep, rest = line.partition(":")
+    head = " ".join(head.strip(_HEADING_STRIP).lower().split())
+    match = _HEADING_RE.fullmatch(head)
+    if match is None:
+        return None, line
+    return _SECTION_WEIGHTS[match.lastgroup], rest if sep else line
+
+
+def _line_terms(line: str) -> list[tuple[str, bool]]:
+    """Every keyword on one line as (term, is_skill), skills matched longest first."""
+    tokens = tokenize(line)
+    words = [tok for tok, _ in tokens]
+    terms = []
+    i = 0
+    while i < len(words):
+        word = words[i]
+        match = longest_match(words, i) if word in TERM_STARTS else None
+        if match is not None:
+            term, end = match
+            if end - i > 1 or term not in AMBIGUOUS_TERMS or looks_technical(line, tokens[i][1]):
+                terms.append((term, True))
+                i = end
+                continue
+        # As before phrases were added, generic keywords start with a letter ("2+", "10k" are noise)
+        if len(word) > 1 and word[0].isalpha() and word not in STOP_WORDS:
+            terms.append((word, False))
+        i += 1
+    return terms
@@ -0,0 +1,397 @@
+"""
+LLM Client Service — Shared async gateway to the Groq API
+Every engine goes through this module instead of building its own client, so a
+single worker keeps one pooled HTTP connection and many completions in flight.
+
+openai takes about half a second to import, so it is imported on first use
+rather than at startup; services/warmup can pay for it in the background.
+"""
+
+import asyncio
+import json
+import random
+from functools import lru_cache
+from time import perf_counter
+from typing import TYPE_CHECKING, AsyncIterator
+
+from config import (
+    GROQ_API_KEY,
+    GROQ_BASE_URL,
+    GROQ_MODEL,
+    LLM_MAX_CONCURRENCY,
+    LLM_TIMEOUT_SECONDS,
+    LLM_MAX_RETRIES,
+    LLM_RETRY_BASE_DELAY,
+    LLM_CACHE_DISABLED_ENGINES,
+    SINGLE_FLIGHT_ENABLED,
+)
+from services.llm_cache import get_cache, is_cacheable, make_key
+from services.metrics import (
+    LLM_CACHE_LOOKUPS,
+    LLM_REQUEST_SECONDS,
+    LLM_RETRIES,
+    LLM_TOKENS,
+    LLM_TTFT_SECONDS,
+    record_span,
+)
+from services.rate_limiter import (
+    RateLimiter,
+    Reservation,
+    engine_priority,
+    estimate_tokens,
+    get_limiter,
+    parse_duration,
+)
+from services.single_flight import get_flight
+
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
+
+_client = None
+_semaphore = None
+
+
+@lru_cache(maxsize=None)
+def _retryable_errors() -> tuple:
+    """Errors worth retrying — everything else (bad request, auth) fails fast."""
+    from openai import APIConnectionError, APITimeoutError, InternalServerError, RateLimitError
+
+    return (RateLimitError, APITimeoutError, APIConnectionError, InternalServerError)
+
+
+def _is_rate_limited(error) -> bool:
+    from openai import RateLimitError
+
+    return isinstance(error, RateLimitError)
+
+
+def get_client() -> "AsyncOpenAI":
+    """Lazy-initialize the long-lived AsyncOpenAI client (one connection pool per worker)."""
+    global _client
+    if _client is None:
+        from openai import AsyncOpenAI
+
+        _client = AsyncOpenAI(
+            api_key=GROQ_API_KEY,
+            base_url=GROQ_BASE_URL,
+            timeout=LLM_TIMEOUT_SECONDS,
+            # Retries are handled below so they respect the concurrency limit
+            max_retries=0,
+        )
+    return _client
+
+
+def _get_semaphore() -> asyncio.Semaphore:
+    """Lazy-initialize the semaphore capping in-flight completions."""
+    global _semaphore
+    if _semaphore is None:
+        _semaphore = asyncio.Semaphore(LLM_MAX_CONCURRENCY)
+    return _semaphore
+
+
+async def chat_completion(
+    system_prompt: str,
+    user_prompt: str,
+    temperature: float,
+    max_tokens: int,
+    json_mode: bool = True,
+    engine: str = "default",
+    use_cache: bool = True,
+) -> str:
+    """
+    Run a single chat completion against Groq and return the message content.
+    Identical requests are served from the response cache, and identical
+    requests already in flight share one completion, unless the caller or
+    the engine's config opts out.
+
+    Args:
+        system_prompt: the engine's system prompt
+        user_prompt: the request-specific user prompt
+        temperature: sampling temperature
+        max_tokens: completion token cap
+        json_mode: request a JSON object response
+        engine: name of the calling engine (used for cache opt-out)
+        use_cache: set False to always hit the LLM for this call (no coalescing either)
+
+    Returns:
+        the raw text content of the first choice
+    """
+    cache_key = None
+    if use_cache and is_cacheable(engine):
+        cache_key = make_key(system_prompt, user_prompt, GROQ_MODEL, temperature, max_tokens)
+        cached = await get_cache().aget(cache_key)
+        LLM_CACHE_LOOKUPS.labels(engine, "miss" if cached is None else "hit").inc()
+        if cached is not None:
+            return cached
+
+    async def complete() -> str:
+        content = await _create_with_retry(
+            system_prompt, user_prompt, temperature, max_tokens, json_mode, engine
+        )
+        if cache_key is not None and _is_storable(content, json_mode):
+            await get_cache().aset(cache_key, content)
+        return content
+
+    if SINGLE_FLIGHT_ENABLED and use_cache and engine not in LLM_CACHE_DISABLED_ENGINES:
+        flight_key = cache_key or make_key(system_prompt, user_prompt, GROQ_MODEL, temperature, max_tokens)
+        return await get_flight("llm").do(f"{flight_key}:{int(json_mode)}", complete)
+    return await complete()
+
+
+async def _create_with_retry(
+    system_prompt: str,
+    user_prompt: str,
+    temperature: float,
+    max_tokens: int,
+    json_mode: bool,
+    engine: str = "default",
+) -> str:
+    """Call Groq under the concurrency limit, retrying transient failures."""
+    kwargs = _build_kwargs(system_prompt, user_prompt, temperature, max_tokens, json_mode)
+    client = get_client()
+    limiter = get_limiter()
+    estimate = estimate_tokens(kwargs["messages"], max_tokens)
+    attempt = 0
+    started = perf_counter()
+    outcome = "error"
+    try:
+        while True:
+            reservation = await _acquire(limiter, estimate, engine)
+            try:
+                async with _get_semaphore():
+                    raw = await client.chat.completions.with_raw_response.create(**kwargs)
+                response = raw.parse()
+            except _retryable_errors() as e:
+                _release_failed(limiter, reservation, e, attempt)
+                if attempt >= LLM_MAX_RETRIES:
+                    raise
+                LLM_RETRIES.labels(engine).inc()
+                await _retry_delay(limiter, e, attempt)
+                attempt += 1
+                continue
+            except BaseException:
+                # Rejected (bad request, auth) or cancelled: nothing was generated
+                _refund(limiter, reservation)
+                raise
+            _settle(limiter, reservation, raw.headers, response.usage)
+            _record_usage(engine, response.usage)
+            outcome = "success"
+            return response.choices[0].message.content
+    finally:
+        elapsed = perf_counter() - started
+        LLM_REQUEST_SECONDS.labels(engine, "complete", outcome).observe(elapsed)
+        record_span(f"llm_{engine}", elapsed)
+
+
+async def stream_chat_completion(
+    system_prompt: str,
+    user_prompt: str,
+    temperature: float,
+    max_tokens: int,
+    engine: str = "default",
+    use_cache: bool = True,
+) -> AsyncIterator[str]:
+    """
+    Stream a chat completion from Groq, yielding text deltas as they arrive.
+    A cache hit is replayed as a single delta; a fresh completion is cached
+    once the stream finishes with valid JSON.
+
+    Groq's JSON mode does not support streaming, so the engines rely on their
+    "Only return valid JSON" system prompts here and the incremental parser
+    skips anything outside the outermost object.
+    """
+    cache_key = None
+    if use_cache and is_cacheable(engine):
+        cache_key = make_key(system_prompt, user_prompt, GROQ_MODEL, temperature, max_tokens)
+        cached = await get_cache().aget(cache_key)
+        LLM_CACHE_LOOKUPS.labels(engine, "miss" if cached is None else "hit").inc()
+        if cached is not None:
+            yield cached
+            return
+
+    kwargs = _build_kwargs(system_prompt, user_prompt, temperature, max_tokens, json_mode=False)
+    kwargs["stream"] = True
+    client = get_client()
+    limiter = get_limiter()
+    estimate = estimate_tokens(kwargs["messages"], max_tokens)
+    semaphore = _get_semaphore()
+    chunks = []
+    usage = None
+    started = perf_counter()
+    outcome = "error"
+
+    try:
+        attempt = 0
+        while True:
+            # Only the initial request is retried — once tokens have been
+            # forwarded to the client a replay would duplicate them
+            reservation = await _acquire(limiter, estimate, engine)
+            await semaphore.acquire()
+            try:
+                raw = await client.chat.completions.with_raw_response.create(**kwargs)
+                break
+            except _retryable_errors() as e:
+                semaphore.release()
+                _release_failed(limiter, reservation, e, attempt)
+                if attempt >= LLM_MAX_RETRIES:
+                    raise
+                LLM_RETRIES.labels(engine).inc()
+                await _retry_delay(limiter, e, attempt)
+                attempt += 1
+            except BaseException:
+                semaphore.release()
+                _refund(limiter, reservation)
+                raise
+
+        finished = False
+        try:
+            async for chunk in raw.parse():
+                usage = _stream_usage(chunk) or usage
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    if not chunks:
+                        LLM_TTFT_SECONDS.labels(engine).observe(perf_counter() - started)
+                    chunks.append(delta)
+                    yield delta
+            finished = True
+        finally:
+            semaphore.release()
+            if not finished:
+                # Client disconnected or the stream broke: charge what was
+                # generated so far rather than the whole max_tokens
+                generated = kwargs["messages"] + [{"content": "".join(chunks)}]
+                _refund(limiter, reservation, estimate_tokens(generated, 0))
+        _settle(limiter, reservation, raw.headers, usage)
+        _record_usage(engine, usage)
+        outcome = "success"
+    finally:
+        elapsed = perf_counter() - started
+        LLM_REQUEST_SECONDS.labels(engine, "stream", outcome).observe(elapsed)
+        record_span(f"llm_{engine}", elapsed)
+
+    content = "".join(chunks)
+    if cache_key is not None and _is_storable(content, json_mode=True):
+        await get_cache().aset(cache_key, content)
+
+
+def _build_kwargs(
+    system_prompt: str,
+    user_prompt: str,
+    temperature: float,
+    max_tokens: int,
+    json_mode: bool,
+) -> dict:
+    kwargs = {
+        "model": GROQ_MODEL,
+        "messages": [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt},
+        ],
+        "temperature": temperature,
+        "max_tokens": max_tokens,
+    }
+    if json_mode:
+        kwargs["response_format"] = {"type": "json_object"}
+    return kwargs
+
+
+async def _acquire(limiter: RateLimiter | None, estimate: int, engine: str) -> Reservation | None:
+    if limiter is None:
+        return None
+    return await limiter.acquire(estimate, engine_priority(engine))
+
+
+def _settle(limiter: RateLimiter | None, reservation: Reservation | None, headers, usage) -> None:
+    """Feed the real token count and rate-limit headers back to the limiter."""
+    if limiter is None:
+        return
+    limiter.observe_headers(headers)
+    prompt, completion = _usage_tokens(usage)
+    if prompt is not None or completion is not None:
+        limiter.settle(reservation, (prompt or 0) + (completion or 0))
+
+
+def _refund(limiter: RateLimiter | None, reservation: Reservation | None, used: int = 0) -> None:
+    """Settle a reservation that got no usage back, charging used tokens instead of the estimate."""
+    if limiter is not None:
+        limiter.settle(reservation, used)
+
+
+def _release_failed(limiter: RateLimiter | None, reservation: Reservation | None, error, attempt: int) -> None:
+    """
+    A failed attempt gets its tokens back (the next response's rate-limit
+    headers correct the bucket if Groq did count it). After a 429, hold
+    everyone back for Retry-After.
+    """
+    _refund(limiter, reservation)
+    if limiter is None or not _is_rate_limited(error):
+        return
+    headers = error.response.headers
+    limiter.observe_headers(headers)
+    limiter.pause(parse_duration(headers.get("retry-after")) or _backoff_delay(attempt))
+
+
+async def _retry_delay(limiter: RateLimiter | None, error, attempt: int) -> None:
+    # After a 429 the limiter's pause is the delay; sleeping as well would double it
+    if limiter is not None and _is_rate_limited(error):
+        return
+    await asyncio.sleep(_backoff_delay(attempt))
+
+
+def _usage_tokens(usage) -> tuple:
+    """(prompt_tokens, completion_tokens) from a usage object or dict."""
+    if usage is None:
+        return None, None
+    if isinstance(usage, dict):
+        return usage.get("prompt_tokens"), usage.get("completion_tokens")
+    return usage.prompt_tokens, usage.completion_tokens
+
+
+def _record_usage(engine: str, usage) -> None:
+    """Count prompt/completion tokens from a response's usage block."""
+    prompt, completion = _usage_tokens(usage)
+    if prompt:
+        LLM_TOKENS.labels(engine, "prompt").inc(prompt)
+    if completion:
+        LLM_TOKENS.labels(engine, "completion").inc(completion)
+
+
+def _stream_usage(chunk):
+    """
+    Usage from a stream chunk, if it carries any. Groq reports it on the last
+    chunk under its x_groq extension; OpenAI-style servers use chunk.usage.
+    """
+    usage = getattr(chunk, "usage", None)
+    if usage is None:
+        x_groq = getattr(chunk, "x_groq", None)
+        if isinstance(x_groq, dict):
+            usage = x_groq.get("usage")
+    return usage
+
+
+def _is_storable(content: str, json_mode: bool) -> bool:
+    """Never cache malformed JSON — a retry should get a fresh chance."""
+    if not content:
+        return False
+    if not json_mode:
+        return True
+    try:
+        json.loads(content)
+    except json.JSONDecodeError:
+        return False
+    return True
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Exponential backoff with full jitter."""
+    return random.uniform(0, LLM_RETRY_BASE_DELAY * (2 ** attempt))
+
+
+async def close_client() -> None:
+    """Close the shared client's connection pool (called on app shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.close()
+        _client = None
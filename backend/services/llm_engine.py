@@ -3,8 +3,11 @@ LLM Engine Service — Grok API (xAI)
 Uses the OpenAI-compatible endpoint to generate honest bullet rewrites.
 """
 
-from openai import OpenAI
-from config import GROQ_API_KEY, GROQ_BASE_URL, GROQ_MODEL
+from typing import Any, AsyncIterator, Optional
+
+from services.llm_client import chat_completion, stream_chat_completion
+from services.json_stream import iter_json_events
+from services.response_parser import parse_engine_response
 
 
 SYSTEM_PROMPT = """You are Cyrus, an expert resume consultant for Indian college students preparing for campus placements.
@@ -45,26 +48,66 @@ Return a JSON object with this structure:
 Only return valid JSON. No markdown fences, no extra text."""
 
 
-def generate_bullets(parsed_resume: dict, jd_text: str) -> dict:
+async def generate_bullets(
+    parsed_resume: dict,
+    jd_text: str,
+    resume_context: Optional[str] = None,
+) -> dict:
     """
     Call the Grok API to generate 3 tailored bullet rewrites.
 
     Args:
         parsed_resume: dict from pdf_parser with raw_text and sections
         jd_text: the raw job description text
+        resume_context: prebuilt _build_resume_context output, for callers
+            tailoring one resume to many JDs
 
     Returns:
         dict with bullets and match_analysis
     """
-    client = OpenAI(
-        api_key=GROQ_API_KEY,
-        base_url=GROQ_BASE_URL,
+    user_prompt = _build_user_prompt(parsed_resume, jd_text, resume_context)
+    result_text = await chat_completion(
+        system_prompt=SYSTEM_PROMPT,
+        user_prompt=user_prompt,
+        temperature=0.4,
+        max_tokens=1500,
+        engine="bullets",
     )
+    return await _parse_result(result_text, user_prompt)
 
+
+async def stream_bullets(
+    parsed_resume: dict,
+    jd_text: str,
+    resume_context: Optional[str] = None,
+) -> AsyncIterator[tuple[str, Any]]:
+    """
+    Streaming variant of generate_bullets.
+
+    Yields ("bullet", dict) as each bullet finishes, then ("result", dict)
+    with the same shape generate_bullets returns.
+    """
+    user_prompt = _build_user_prompt(parsed_resume, jd_text, resume_context)
+    deltas = stream_chat_completion(
+        system_prompt=SYSTEM_PROMPT,
+        user_prompt=user_prompt,
+        temperature=0.4,
+        max_tokens=1500,
+        engine="bullets",
+    )
+    async for kind, key, value in iter_json_events(deltas):
+        if kind == "item" and key == "bullets":
+            yield "bullet", value
+        elif kind == "complete":
+            yield "result", await _parse_result(value, user_prompt)
+
+
+def _build_user_prompt(parsed_resume: dict, jd_text: str, resume_context: Optional[str] = None) -> str:
     # Build context from parsed resume
-    resume_context = _build_resume_context(parsed_resume)
+    if resume_context is None:
+        resume_context = _build_resume_context(parsed_resume)
 
-    user_prompt = f"""## STUDENT'S PARSED RESUME
+    return f"""## STUDENT'S PARSED RESUME
 {resume_context}
 
 ## JOB DESCRIPTION
@@ -72,28 +115,19 @@ def generate_bullets(parsed_resume: dict, jd_text: str) -> dict:
 
 Generate exactly 3 honest, tailored bullet-point rewrites. Return valid JSON only."""
 
-    response = client.chat.completions.create(
-        model=GROQ_MODEL,
-        messages=[
-            {"role": "system", "content": SYSTEM_PROMPT},
-            {"role": "user", "content": user_prompt},
-        ],
-        temperature=0.4,
-        max_tokens=1500,
-        response_format={"type": "json_object"},
-    )
 
-    import json
-    result_text = response.choices[0].message.content
-    try:
-        return json.loads(result_text)
-    except json.JSONDecodeError:
-        return {
-            "bullets": [],
-            "match_analysis": {"strong_matches": [], "partial_matches": [], "gaps": []},
-            "error": "Failed to parse LLM response",
-            "raw_response": result_text,
-        }
+async def _parse_result(result_text: str, user_prompt: str) -> dict:
+    result = await parse_engine_response(
+        result_text, "bullets", SYSTEM_PROMPT, user_prompt, temperature=0.4, max_tokens=1500
+    )
+    if result is not None:
+        return result
+    return {
+        "bullets": [],
+        "match_analysis": {"strong_matches": [], "partial_matches": [], "gaps": []},
+        "error": "Failed to parse LLM response",
+        "raw_response": result_text,
+    }
 
 
 def _build_resume_context(parsed_resume: dict) -> str:
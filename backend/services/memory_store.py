@@ -0,0 +1,106 @@
+"""
+In-Memory Session Backend
+Drop-in stand-in for services.firestore (same function names and return
+shapes) for local runs, benchmarks and tests without Firebase credentials.
+Select it with SESSION_STORE_BACKEND=memory.
+"""
+
+import secrets
+import string
+import threading
+from datetime import datetime, timezone
+
+from services.firestore import build_session_data, summarize_session, _count_keywords
+
+_ID_ALPHABET = string.ascii_letters + string.digits
+
+
+def new_document_id() -> str:
+    """20-character random ID in Firestore's auto-ID format."""
+    return "".join(secrets.choice(_ID_ALPHABET) for _ in range(20))
+
+
+class MemoryBackend:
+    """Thread-safe dict store mirroring the Firestore layout."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._sessions: dict[str, dict[str, dict]] = {}
+        self._skill_gaps: dict[str, dict] = {}
+        self._jds: dict[str, dict] = {}
+
+    def save_session(self, user_id: str, data: dict) -> str:
+        session_id = new_document_id()
+        self.save_sessions_batch([(user_id, session_id, build_session_data(user_id, data))])
+        return session_id
+
+    def save_sessions_batch(self, items: list[tuple[str, str, dict]]) -> None:
+        with self._lock:
+            for user_id, session_id, session_data in items:
+                self._sessions.setdefault(user_id, {})[session_id] = dict(session_data)
+                aggregate = self._skill_gaps.setdefault(
+                    user_id, {"missing": {}, "matched": {}, "session_count": 0}
+                )
+                ats_scores = [session_data.get("ats_scores", {})]
+                for target, field in (("missing", "missing_keywords"), ("matched", "matched_keywords")):
+                    for kw, n in _count_keywords(ats_scores, field).items():
+                        aggregate[target][kw] = aggregate[target].get(kw, 0) + n
+                aggregate["session_count"] += 1
+                aggregate["updated_at"] = datetime.now(timezone.utc).isoformat()
+
+    def get_sessions(
+        self,
+        user_id: str,
+        limit: int = 20,
+        cursor: str | None = None,
+        summary: bool = False,
+    ) -> list:
+        with self._lock:
+            sessions = [
+                {**session, "id": session_id}
+                for session_id, session in self._sessions.get(user_id, {}).items()
+            ]
+        sessions.sort(key=lambda s: s["created_at"], reverse=True)
+        if cursor:
+            sessions = [s for s in sessions if s["created_at"] < cursor]
+        sessions = sessions[:limit]
+        if summary:
+            sessions = [summarize_session(s) for s in sessions]
+        return sessions
+
+    def get_session_by_id(self, user_id: str, session_id: str) -> dict | None:
+        with self._lock:
+            session = self._sessions.get(user_id, {}).get(session_id)
+        if session is None:
+            return None
+        return {**session, "id": session_id}
+
+    def get_jd(self, jd_hash: str) -> dict | None:
+        with self._lock:
+            record = self._jds.get(jd_hash)
+            return dict(record) if record else None
+
+    def save_jd(self, jd_hash: str, record: dict) -> None:
+        with self._lock:
+            self._jds.setdefault(jd_hash, {}).update(record)
+
+    def get_skill_gaps(self, user_id: str) -> dict | None:
+        with self._lock:
+            aggregate = self._skill_gaps.get(user_id)
+            return _copy_aggregate(aggregate) if aggregate else None
+
+    def rebuild_skill_gaps(self, user_id: str) -> dict:
+        with self._lock:
+            ats_scores = [s.get("ats_scores", {}) for s in self._sessions.get(user_id, {}).values()]
+            aggregate = {
+                "missing": _count_keywords(ats_scores, "missing_keywords"),
+                "matched": _count_keywords(ats_scores, "matched_keywords"),
+                "session_count": len(ats_scores),
+                "updated_at": datetime.now(timezone.utc).isoformat(),
+            }
+            self._skill_gaps[user_id] = aggregate
+            return _copy_aggregate(aggregate)
+
+
+def _copy_aggregate(aggregate: dict) -> dict:
+    return {**aggregate, "missing": dict(aggregate["missing"]), "matched": dict(aggregate["matched"])}
@@ -0,0 +1,199 @@
+"""
+Metrics Service — Prometheus instrumentation and per-request timing spans
+Counters and histograms for every stage of a request (route, PDF parse,
+keyword extraction, ATS scoring, LLM calls, Firestore calls, caches), served
+at GET /metrics. Spans recorded while handling a request are also returned to
+the caller in a Server-Timing header.
+
+Recording a sample is a lock-protected bucket increment, cheap enough to leave
+on in production. Values are per process; with several uvicorn workers each
+worker is scraped (or aggregated) separately.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Callable, Optional
+
+from prometheus_client import CONTENT_TYPE_LATEST, Counter, Gauge, Histogram, generate_latest
+
+# Request-level stages (route handling, PDF parse, LLM calls)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+# In-process CPU work (keyword extraction, scoring, per-page parse)
+FAST_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+
+HTTP_REQUEST_SECONDS = Histogram(
+    "syrus_http_request_seconds",
+    "Time from request start to the end of the response body",
+    ["method", "route", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+PDF_PARSE_SECONDS = Histogram(
+    "syrus_pdf_parse_seconds",
+    "PyMuPDF extraction time per document, measured in the worker",
+    buckets=LATENCY_BUCKETS,
+)
+PDF_PARSE_PAGE_SECONDS = Histogram(
+    "syrus_pdf_parse_page_seconds",
+    "PyMuPDF extraction time per page (averaged over each document)",
+    buckets=FAST_BUCKETS,
+)
+PDF_QUEUE_SECONDS = Histogram(
+    "syrus_pdf_queue_seconds",
+    "Time a document waited for (and travelled to and from) a parse worker",
+    buckets=LATENCY_BUCKETS,
+)
+PDF_PAGES = Counter("syrus_pdf_pages", "Pages parsed")
+KEYWORD_EXTRACTION_SECONDS = Histogram(
+    "syrus_keyword_extraction_seconds",
+    "extract_jd_keywords time per JD",
+    buckets=FAST_BUCKETS,
+)
+ATS_SCORING_SECONDS = Histogram(
+    "syrus_ats_scoring_seconds",
+    "ATS scoring time per call (batch scores several JDs per call)",
+    ["mode"],
+    buckets=FAST_BUCKETS,
+)
+LLM_TTFT_SECONDS = Histogram(
+    "syrus_llm_time_to_first_token_seconds",
+    "Time from sending a completion request to its first token",
+    ["engine"],
+    buckets=LATENCY_BUCKETS,
+)
+LLM_REQUEST_SECONDS = Histogram(
+    "syrus_llm_request_seconds",
+    "Total completion time including retries",
+    ["engine", "mode", "outcome"],
+    buckets=LATENCY_BUCKETS,
+)
+LLM_TOKENS = Counter(
+    "syrus_llm_tokens",
+    "Tokens reported by the LLM API",
+    ["engine", "kind"],
+)
+LLM_RETRIES = Counter("syrus_llm_retries", "Retried LLM requests", ["engine"])
+LLM_QUEUE_WAIT_SECONDS = Histogram(
+    "syrus_llm_queue_wait_seconds",
+    "Time spent waiting for rate-limit budget (queued requests only)",
+    ["priority"],
+    buckets=LATENCY_BUCKETS,
+)
+LLM_RATE_LIMITED = Counter("syrus_llm_rate_limited", "429 responses from the LLM API")
+LLM_RESPONSES = Counter(
+    "syrus_llm_responses",
+    "Engine responses by how they parsed: valid, repaired, continued (needed a continuation request) or failed",
+    ["engine", "outcome"],
+)
+LLM_CACHE_LOOKUPS = Counter(
+    "syrus_llm_cache_lookups",
+    "LLM response cache lookups",
+    ["engine", "result"],
+)
+PROMPT_CONTEXT_TOKENS = Counter(
+    "syrus_prompt_context_tokens",
+    "Estimated resume context tokens per LLM call, before (original) and after (sent) compaction",
+    ["engine", "kind"],
+)
+SINGLE_FLIGHT_CALLS = Counter(
+    "syrus_single_flight_calls",
+    "Calls through a single-flight group: leader (did the work) or follower (joined one in flight)",
+    ["flight", "role"],
+)
+STORE_CALL_SECONDS = Histogram(
+    "syrus_store_call_seconds",
+    "Session store (Firestore) call latency",
+    ["backend", "op"],
+    buckets=LATENCY_BUCKETS,
+)
+CACHE_HIT_RATIO = Gauge(
+    "syrus_cache_hit_ratio",
+    "Hit ratio since process start",
+    ["cache"],
+)
+
+_spans: ContextVar[Optional[list]] = ContextVar("syrus_spans", default=None)
+
+
+@contextmanager
+def span(name: str, histogram=None, **labels):
+    """
+    Time a block: observe it on histogram (if given) and add it to the
+    current request's Server-Timing spans.
+    """
+    start = perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = perf_counter() - start
+        if histogram is not None:
+            (histogram.labels(**labels) if labels else histogram).observe(elapsed)
+        record_span(name, elapsed)
+
+
+def record_span(name: str, seconds: float) -> None:
+    """Attach an already-measured duration to the current request, if any."""
+    spans = _spans.get()
+    if spans is not None:
+        spans.append((name, seconds))
+
+
+def register_hit_ratio(cache: str, stats: Callable[[], dict]) -> None:
+    """Export a cache's stats()["hit_ratio"] as syrus_cache_hit_ratio{cache=...}."""
+    CACHE_HIT_RATIO.labels(cache).set_function(lambda: stats()["hit_ratio"])
+
+
+def render() -> tuple[bytes, str]:
+    """Current metrics in Prometheus text format, with their content type."""
+    return generate_latest(), CONTENT_TYPE_LATEST
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware timing every HTTP request by route template, and
+    reporting the request's spans in a Server-Timing header. Plain ASGI rather
+    than BaseHTTPMiddleware so streamed responses are timed to their last byte.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = perf_counter()
+        status = 500
+        spans: list[tuple[str, float]] = []
+        token = _spans.set(spans)
+
+        async def send_with_timing(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if spans:
+                    headers = list(message.get("headers", []))
+                    headers.append((b"server-timing", _server_timing(spans)))
+                    message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _spans.reset(token)
+            # Route template, not the raw path, to keep label cardinality bounded
+            route = getattr(scope.get("route"), "path", "unmatched")
+            HTTP_REQUEST_SECONDS.labels(scope["method"], route, str(status)).observe(
+                perf_counter() - start
+            )
+
+
+def _server_timing(spans: list[tuple[str, float]]) -> bytes:
+    # Repeated stages (e.g. one scoring pass per JD) are summed
+    totals: dict[str, float] = {}
+    for name, seconds in spans:
+        totals[name] = totals.get(name, 0.0) + seconds
+    return ", ".join(
+        f"{name};dur={seconds * 1000:.1f}" for name, seconds in totals.items()
+    ).encode("latin-1")
@@ -1,37 +1,95 @@
 """
 PDF Parser Service
 Extracts structured text from uploaded PDF resumes using PyMuPDF.
+
+Two extraction modes:
+- "text": plain page text, sections guessed from heading-like lines.
+- "layout": text spans with their font size, weight and position. Headings
+  are detected from typography (larger or bold text, even when the body
+  continues on the same line), and two-column pages are read one column at
+  a time instead of line by line across both.
+
+PyMuPDF is imported on first use: parsing runs in the pdf_pool workers,
+and the API process only needs the section helpers.
 """
 
-import fitz  # PyMuPDF
 import re
-from typing import Optional
+import time
+from collections import Counter
+from typing import TYPE_CHECKING, Iterator, Optional
+
+if TYPE_CHECKING:
+    import fitz  # PyMuPDF
+
+EXTRACTION_MODES = ("text", "layout")
+
+# Bump whenever a change alters the parsed output; cached parses made by
+# another version are ignored (resume_cache)
+PARSER_VERSION = 1
 
+# fitz.TEXT_FONT_BOLD, the bold bit of a span's flags
+_FONT_BOLD = 1 << 4
 
-def extract_text_from_pdf(file_bytes: bytes) -> dict:
+
+def extract_text_from_pdf(
+    file_bytes: bytes,
+    max_pages: Optional[int] = None,
+    timeout_seconds: Optional[float] = None,
+    mode: str = "text",
+) -> dict:
     """
     Parse a PDF file and return structured resume sections.
 
+    Args:
+        file_bytes: the uploaded PDF
+        max_pages: reject documents with more pages than this
+        timeout_seconds: abandon extraction once this much time has passed
+            (checked between pages)
+        mode: "text" or "layout" (see module docstring)
+
     Returns:
         dict with keys: raw_text, sections (dict of heading -> content),
-        contact_info, word_count
+        contact_info, word_count, page_count, extraction_mode
     """
+    if mode not in EXTRACTION_MODES:
+        raise ValueError(f"Unknown extraction mode {mode!r}.")
+
+    import fitz  # PyMuPDF
+
     doc = fitz.open(stream=file_bytes, filetype="pdf")
-    pages = []
-    raw_text = ""
+    page_count = 0
 
-    for page in doc:
-        text = page.get_text("text")
-        pages.append(text)
-        raw_text += text + "\n"
+    try:
+        # page_count only reads the page tree; no page is loaded before this check
+        if max_pages is not None and doc.page_count > max_pages:
+            raise ValueError(
+                f"PDF has {doc.page_count} pages; the limit is {max_pages}."
+            )
 
-    doc.close()
+        if mode == "layout":
+            layout = _LayoutSections()
+            for page in _iter_pages(doc, timeout_seconds):
+                layout.add_page(page)
+                page_count += 1
+            raw_text = layout.raw_text()
+            sections = layout.sections()
+        else:
+            parts = []
+            for page in _iter_pages(doc, timeout_seconds):
+                parts.append(page.get_text("text"))
+                page_count += 1
+            raw_text = "\n".join(parts)
+            sections = None
+    finally:
+        doc.close()
 
     # Clean up whitespace
     raw_text = re.sub(r'\n{3,}', '\n\n', raw_text).strip()
 
-    # Attempt to extract sections by common resume headings
-    sections = _extract_sections(raw_text)
+    # Attempt to extract sections by common resume headings (layout mode
+    # falls back to this when the typography marked none)
+    if not sections:
+        sections = _extract_sections(raw_text)
 
     # Extract contact info (basic heuristic)
     contact_info = _extract_contact_info(raw_text)
@@ -41,78 +99,98 @@ def extract_text_from_pdf(file_bytes: bytes) -> dict:
         "sections": sections,
         "contact_info": contact_info,
         "word_count": len(raw_text.split()),
-        "page_count": len(pages),
+        "page_count": page_count,
+        "extraction_mode": mode,
     }
 
 
+def _iter_pages(doc: "fitz.Document", timeout_seconds: Optional[float]) -> Iterator["fitz.Page"]:
+    """
+    Load pages one at a time, so each page's text and layout can be freed
+    before the next is read, checking the deadline before every page.
+    """
+    deadline = time.monotonic() + timeout_seconds if timeout_seconds else None
+    for index in range(doc.page_count):
+        if deadline is not None and time.monotonic() > deadline:
+            raise TimeoutError(f"PDF parsing exceeded {timeout_seconds:g}s.")
+        yield doc.load_page(index)
+
+
+# Common resume headings, in priority order (first match wins)
+_HEADING_ALTERNATIVES = [
+    r'education',
+    r'experience|work\s*experience|professional\s*experience',
+    r'projects|personal\s*projects|academic\s*projects',
+    r'skills|technical\s*skills|core\s*competencies',
+    r'certifications?|certificates?',
+    r'achievements?|awards?|honors?',
+    r'summary|objective|profile',
+    r'extracurricular|activities|volunteering',
+]
+_HEADING_PATTERNS = [
+    re.compile(rf'(?i)\b({alternatives})\b') for alternatives in _HEADING_ALTERNATIVES
+]
+
+# Single alternation of every heading — one search decides whether a line
+# can be a heading at all; the ordered list above only runs on the rare hits
+_ANY_HEADING_RE = re.compile(rf'(?i)\b(?:{"|".join(_HEADING_ALTERNATIVES)})\b')
+
+# Headings are short lines
+_MAX_HEADING_WORDS = 5
+
+# Normalize heading names
+_HEADING_MAP = {
+    'education': 'Education',
+    'experience': 'Experience',
+    'work experience': 'Experience',
+    'professional experience': 'Experience',
+    'projects': 'Projects',
+    'personal projects': 'Projects',
+    'academic projects': 'Projects',
+    'skills': 'Skills',
+    'technical skills': 'Skills',
+    'core competencies': 'Skills',
+    'certifications': 'Certifications',
+    'certificates': 'Certifications',
+    'certification': 'Certifications',
+    'certificate': 'Certifications',
+    'achievements': 'Achievements',
+    'awards': 'Achievements',
+    'honors': 'Achievements',
+    'achievement': 'Achievements',
+    'award': 'Achievements',
+    'honor': 'Achievements',
+    'summary': 'Summary',
+    'objective': 'Summary',
+    'profile': 'Summary',
+    'extracurricular': 'Activities',
+    'activities': 'Activities',
+    'volunteering': 'Activities',
+}
+
+
 def _extract_sections(text: str) -> dict:
     """
     Heuristically split resume text into named sections.
     Looks for common headings like Education, Experience, Projects, Skills.
     """
-    heading_patterns = [
-        r'(?i)\b(education)\b',
-        r'(?i)\b(experience|work\s*experience|professional\s*experience)\b',
-        r'(?i)\b(projects|personal\s*projects|academic\s*projects)\b',
-        r'(?i)\b(skills|technical\s*skills|core\s*competencies)\b',
-        r'(?i)\b(certifications?|certificates?)\b',
-        r'(?i)\b(achievements?|awards?|honors?)\b',
-        r'(?i)\b(summary|objective|profile)\b',
-        r'(?i)\b(extracurricular|activities|volunteering)\b',
-    ]
-
-    # Normalize heading names
-    heading_map = {
-        'education': 'Education',
-        'experience': 'Experience',
-        'work experience': 'Experience',
-        'professional experience': 'Experience',
-        'projects': 'Projects',
-        'personal projects': 'Projects',
-        'academic projects': 'Projects',
-        'skills': 'Skills',
-        'technical skills': 'Skills',
-        'core competencies': 'Skills',
-        'certifications': 'Certifications',
-        'certificates': 'Certifications',
-        'certification': 'Certifications',
-        'certificate': 'Certifications',
-        'achievements': 'Achievements',
-        'awards': 'Achievements',
-        'honors': 'Achievements',
-        'achievement': 'Achievements',
-        'award': 'Achievements',
-        'honor': 'Achievements',
-        'summary': 'Summary',
-        'objective': 'Summary',
-        'profile': 'Summary',
-        'extracurricular': 'Activities',
-        'activities': 'Activities',
-        'volunteering': 'Activities',
-    }
-
     lines = text.split('\n')
     sections = {}
     current_section = "Header"
     current_content = []
 
     for line in lines:
-        matched = False
-        for pattern in heading_patterns:
-            match = re.search(pattern, line.strip())
-            if match and len(line.strip().split()) <= 5:
-                # Save previous section
-                if current_content:
-                    sections[current_section] = '\n'.join(current_content).strip()
-                # Start new section
-                raw_heading = match.group(1).lower().strip()
-                current_section = heading_map.get(raw_heading, raw_heading.title())
-                current_content = []
-                matched = True
-                break
-
-        if not matched:
+        heading = _match_heading(line)
+        if heading is None:
             current_content.append(line)
+            continue
+
+        # Save previous section
+        if current_content:
+            sections[current_section] = '\n'.join(current_content).strip()
+        # Start new section
+        current_section = heading
+        current_content = []
 
     # Save last section
     if current_content:
@@ -121,6 +199,238 @@ def _extract_sections(text: str) -> dict:
     return sections
 
 
+def _match_heading(line: str) -> Optional[str]:
+    """Return the normalized section name if line is a heading, else None."""
+    stripped = line.strip()
+    # Fast path: blank and long lines never reach a regex
+    # (maxsplit keeps the word count O(1) for long body lines)
+    if not stripped or len(stripped.split(None, _MAX_HEADING_WORDS)) > _MAX_HEADING_WORDS:
+        return None
+    if not _ANY_HEADING_RE.search(stripped):
+        return None
+
+    for pattern in _HEADING_PATTERNS:
+        match = pattern.search(stripped)
+        if match:
+            raw_heading = match.group(1).lower().strip()
+            return _HEADING_MAP.get(raw_heading, raw_heading.title())
+    return None
+
+
+# ── Layout mode ──
+
+# A span is emphasized when bold, all caps, or this much larger than the body text
+_EMPHASIS_SIZE_RATIO = 1.15
+
+# A typographic heading that is not a known section name must be this much larger
+_UNKNOWN_HEADING_SIZE_RATIO = 1.25
+_MAX_UNKNOWN_HEADING_WORDS = 4
+
+# Each column needs this share of a page's characters, and the right column
+# this many lines starting at the same x, before the page is read as two
+# columns (a few right-aligned dates do not make a column)
+_MIN_COLUMN_SHARE = 0.1
+_MIN_COLUMN_LINES = 3
+
+
+class _LayoutSections:
+    """Resume lines and sections, built one page at a time from span layout."""
+
+    def __init__(self):
+        self._lines: list[str] = []
+        self._sections: dict[str, list[str]] = {}
+        self._current = "Header"
+
+    def add_page(self, page: "fitz.Page") -> None:
+        import fitz
+
+        # Text only: skipping images keeps "dict" extraction from decoding them
+        flags = fitz.TEXTFLAGS_DICT & ~fitz.TEXT_PRESERVE_IMAGES
+        blocks = [
+            block for block in page.get_text("dict", flags=flags)["blocks"]
+            if block.get("type") == 0 and block["lines"]
+        ]
+        body_size = _body_font_size(blocks)
+        lines = [line for block in blocks for line in block["lines"]]
+        for line in _reading_order(lines, page.rect.width):
+            spans = [span for span in line["spans"] if span["text"].strip()]
+            if not spans:
+                continue
+            text = _join_spans(spans)
+            self._lines.append(text)
+
+            heading, rest = self._heading(spans, text, body_size)
+            if heading is None:
+                self._sections.setdefault(self._current, []).append(text)
+                continue
+            self._current = heading
+            content = self._sections.setdefault(heading, [])
+            if rest:
+                content.append(rest)
+
+    def raw_text(self) -> str:
+        return "\n".join(self._lines)
+
+    def sections(self) -> dict:
+        """Heading -> content; empty when no heading was found, so the caller can fall back."""
+        if set(self._sections) <= {"Header"}:
+            return {}
+        return {
+            heading: "\n".join(content).strip()
+            for heading, content in self._sections.items()
+            if content
+        }
+
+    def _heading(self, spans: list[dict], text: str, body_size: float) -> tuple[Optional[str], str]:
+        """
+        (section name, body text after the heading on the same line) if the
+        line opens a section, else (None, "").
+        """
+        lead = []
+        for span in spans:
+            if not _emphasized(span, body_size):
+                break
+            lead.append(span)
+
+        if not lead:
+            # Plain-styled headings are recognised the same way as in text mode
+            return _match_heading(text), ""
+
+        lead_text = _join_spans(lead).rstrip(":").strip()
+        rest = _join_spans(spans[len(lead):]).lstrip(":").strip()
+        heading = _match_heading(lead_text)
+        if heading is not None:
+            return heading, rest
+
+        # An unknown heading ("Publications"): whole line, short, clearly larger,
+        # and past the header so the candidate's name is not mistaken for one
+        if (
+            not rest
+            and self._current != "Header"
+            and len(lead_text.split()) <= _MAX_UNKNOWN_HEADING_WORDS
+            and max(span["size"] for span in lead) >= body_size * _UNKNOWN_HEADING_SIZE_RATIO
+        ):
+            return lead_text.title(), ""
+        return None, ""
+
+
+def _body_font_size(blocks: list[dict]) -> float:
+    """The font size carrying the most characters on the page."""
+    sizes: Counter = Counter()
+    for block in blocks:
+        for line in block["lines"]:
+            for span in line["spans"]:
+                sizes[round(span["size"] * 2) / 2] += len(span["text"].strip())
+    return sizes.most_common(1)[0][0] if sizes else 10.0
+
+
+def _emphasized(span: dict, body_size: float) -> bool:
+    text = span["text"].strip()
+    return (
+        span["size"] >= body_size * _EMPHASIS_SIZE_RATIO
+        or bool(span["flags"] & _FONT_BOLD)
+        or "bold" in span["font"].lower()
+        or (len(text) >= 4 and text.isupper())
+    )
+
+
+def _join_spans(spans: list[dict]) -> str:
+    """Span texts joined into one line, with a space where spans are visibly apart."""
+    parts = []
+    prev = None
+    for span in spans:
+        text = span["text"]
+        if (
+            prev is not None
+            and not parts[-1].endswith(" ")
+            and not text.startswith(" ")
+            and span["bbox"][0] - prev["bbox"][2] > span["size"] * 0.15
+        ):
+            parts.append(" ")
+        parts.append(text)
+        prev = span
+    return "".join(parts).strip()
+
+
+def _reading_order(lines: list[dict], page_width: float) -> list[dict]:
+    """
+    Lines in reading order. Lines rather than blocks, because PyMuPDF merges
+    side-by-side columns into one block (and sometimes one line) when a
+    resume builder draws them row by row. Two-column pages are read as bands
+    separated by full-width lines (the header, a page-wide section): within
+    a band, the left column top to bottom, then the right. Single-column
+    pages keep the document's order.
+    """
+    slack = page_width * 0.02
+    gutter = _find_gutter(lines, page_width, slack)
+    if gutter is None:
+        return lines
+
+    lines = [piece for line in lines for piece in _split_at_gutter(line, gutter, slack)]
+    ordered: list[dict] = []
+    band: tuple[list, list] = ([], [])
+    for line in sorted(lines, key=lambda line: line["bbox"][1]):
+        side = _side(line, gutter, slack)
+        if side == 2:
+            ordered.extend(band[0] + band[1])
+            band = ([], [])
+            ordered.append(line)
+        else:
+            band[side].append(line)
+    ordered.extend(band[0] + band[1])
+    return ordered
+
+
+def _find_gutter(lines: list[dict], page_width: float, slack: float) -> Optional[float]:
+    """
+    Where the right column starts, or None for a single-column page.
+    Candidates are the most common line start positions in the middle of
+    the page; the one that splits the text most evenly wins.
+    """
+    starts = Counter(
+        round(line["bbox"][0]) for line in lines
+        if 0.2 * page_width < line["bbox"][0] < 0.8 * page_width
+    )
+    best, best_share = None, _MIN_COLUMN_SHARE
+    for gutter, count in starts.most_common(3):
+        if count < _MIN_COLUMN_LINES:
+            break
+        chars = [0, 0, 0]
+        for line in lines:
+            chars[_side(line, gutter, slack)] += sum(len(span["text"]) for span in line["spans"])
+        total = sum(chars)
+        share = min(chars[0], chars[1]) / total if total else 0.0
+        if share >= best_share:
+            best, best_share = gutter, share
+    return best
+
+
+def _side(line: dict, gutter: float, slack: float) -> int:
+    """0 = left column, 1 = right column, 2 = spans the gutter."""
+    x0, _, x1, _ = line["bbox"]
+    return 0 if x1 <= gutter + slack else 1 if x0 >= gutter - slack else 2
+
+
+def _split_at_gutter(line: dict, gutter: float, slack: float) -> list[dict]:
+    """A line whose spans sit on both sides of the gutter, as one line per column."""
+    spans = line["spans"]
+    for k in range(1, len(spans)):
+        if spans[k]["bbox"][0] >= gutter - slack and all(span["bbox"][2] <= gutter + slack for span in spans[:k]):
+            return [_line_of(spans[:k]), _line_of(spans[k:])]
+    return [line]
+
+
+def _line_of(spans: list[dict]) -> dict:
+    boxes = [span["bbox"] for span in spans]
+    return {
+        "spans": spans,
+        "bbox": (
+            min(b[0] for b in boxes), min(b[1] for b in boxes),
+            max(b[2] for b in boxes), max(b[3] for b in boxes),
+        ),
+    }
+
+
 def _extract_contact_info(text: str) -> dict:
     """Extract email, phone, and LinkedIn from resume text."""
     info: dict = {}
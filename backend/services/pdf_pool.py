@@ -0,0 +1,149 @@
+"""
+PDF Pool Service
+Runs PyMuPDF extraction in a bounded pool of warm worker processes so a
+large or slow PDF never stalls the event loop (or holds the GIL) for other
+requests on the same worker.
+"""
+
+import asyncio
+import hashlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from time import perf_counter
+
+from config import (
+    PDF_PARSE_WORKERS,
+    PDF_PARSE_MAX_PENDING,
+    PDF_PARSE_TIMEOUT_SECONDS,
+    PDF_MAX_PAGES,
+    PDF_EXTRACTION_MODE,
+    RESUME_CACHE_ENABLED,
+    SINGLE_FLIGHT_ENABLED,
+)
+from services.metrics import (
+    PDF_PAGES,
+    PDF_PARSE_PAGE_SECONDS,
+    PDF_PARSE_SECONDS,
+    PDF_QUEUE_SECONDS,
+    record_span,
+)
+from services.pdf_parser import extract_text_from_pdf
+from services.resume_cache import get_parsed, set_parsed
+from services.single_flight import get_flight
+
+_executor = None
+_pending = None
+
+
+def _warm_worker() -> None:
+    """Import PyMuPDF once per worker instead of on the first request."""
+    import fitz  # noqa: F401
+
+
+def _timed_extract(file_bytes: bytes, **kwargs) -> tuple[dict, float]:
+    """Worker entry point: parse and report the time spent parsing."""
+    started = perf_counter()
+    parsed = extract_text_from_pdf(file_bytes, **kwargs)
+    return parsed, perf_counter() - started
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    """Lazy-initialize the worker pool."""
+    global _executor
+    if _executor is None:
+        # spawn, not fork: forking a process that already runs an event loop
+        # and thread pools is unsafe
+        _executor = ProcessPoolExecutor(
+            max_workers=PDF_PARSE_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_warm_worker,
+        )
+    return _executor
+
+
+def _get_pending() -> asyncio.Semaphore:
+    """Lazy-initialize the semaphore bounding queued + running documents."""
+    global _pending
+    if _pending is None:
+        _pending = asyncio.Semaphore(PDF_PARSE_MAX_PENDING)
+    return _pending
+
+
+async def parse_pdf(file_bytes: bytes) -> dict:
+    """
+    Parse a PDF in the worker pool. A file parsed before (same bytes) comes
+    from the resume cache; concurrent uploads of the same file share one parse.
+
+    Raises:
+        TimeoutError: extraction took longer than PDF_PARSE_TIMEOUT_SECONDS
+        ValueError: the PDF has more than PDF_MAX_PAGES pages
+    """
+    key = hashlib.sha256(file_bytes).hexdigest()
+    if RESUME_CACHE_ENABLED:
+        cached = await get_parsed(key)
+        if cached is not None:
+            return cached
+    if SINGLE_FLIGHT_ENABLED:
+        return await get_flight("pdf").do(key, lambda: _parse(file_bytes, key))
+    return await _parse(file_bytes, key)
+
+
+async def _parse(file_bytes: bytes, key: str) -> dict:
+    global _executor
+    job = partial(
+        _timed_extract,
+        file_bytes,
+        max_pages=PDF_MAX_PAGES,
+        mode=PDF_EXTRACTION_MODE,
+        # The worker stops at the next page boundary; the await below gives
+        # up slightly later in case a single page hangs
+        timeout_seconds=PDF_PARSE_TIMEOUT_SECONDS,
+    )
+    async with _get_pending():
+        loop = asyncio.get_running_loop()
+        started = perf_counter()
+        try:
+            parsed, parse_seconds = await asyncio.wait_for(
+                loop.run_in_executor(_get_executor(), job),
+                timeout=PDF_PARSE_TIMEOUT_SECONDS + 1,
+            )
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"PDF parsing exceeded {PDF_PARSE_TIMEOUT_SECONDS:g}s.")
+        except BrokenProcessPool:
+            # A worker died (e.g. a malformed PDF crashed PyMuPDF) —
+            # start a fresh pool for the next request
+            _executor = None
+            raise
+
+    _observe_parse(parsed, parse_seconds, perf_counter() - started)
+    if RESUME_CACHE_ENABLED:
+        await set_parsed(key, parsed)
+    return parsed
+
+
+def _observe_parse(parsed: dict, parse_seconds: float, total_seconds: float) -> None:
+    pages = parsed.get("page_count", 0)
+    PDF_PARSE_SECONDS.observe(parse_seconds)
+    PDF_QUEUE_SECONDS.observe(max(total_seconds - parse_seconds, 0.0))
+    if pages:
+        PDF_PAGES.inc(pages)
+        per_page = parse_seconds / pages
+        for _ in range(pages):
+            PDF_PARSE_PAGE_SECONDS.observe(per_page)
+    record_span("pdf_parse", parse_seconds)
+
+
+def shutdown_pool() -> None:
+    """Stop the worker processes (called on app shutdown)."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+async def warm_pool() -> None:
+    """Start the worker processes ahead of the first upload."""
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(_get_executor(), _warm_worker)
@@ -0,0 +1,350 @@
+"""
+Rate Limiter Service — Client-side Groq RPM/TPM limiting with a priority queue
+Completions wait here until both the requests-per-minute and the
+tokens-per-minute buckets can cover them, so a burst queues instead of
+turning into 429s. Interactive engines are served before background ones,
+and waiting callers can be told their queue position and an ETA.
+
+Token costs are reserved up front (prompt estimate + max_tokens) and settled
+against the real usage once the response arrives. Groq's x-ratelimit-*
+headers and Retry-After on 429s adjust the buckets as responses come in.
+Limits are per worker process.
+"""
+
+import asyncio
+import heapq
+import itertools
+import re
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+from config import (
+    LLM_RATE_LIMIT_ENABLED,
+    LLM_RPM_LIMIT,
+    LLM_TPM_LIMIT,
+    LLM_QUEUE_MAX_WAIT_SECONDS,
+)
+from services.metrics import LLM_QUEUE_WAIT_SECONDS, LLM_RATE_LIMITED
+
+# Lower is served first
+INTERACTIVE = 0
+STANDARD = 1
+BACKGROUND = 2
+
+PRIORITY_NAMES = {INTERACTIVE: "interactive", STANDARD: "standard", BACKGROUND: "background"}
+
+ENGINE_PRIORITY = {
+    "rewrite": INTERACTIVE,
+    "rewrite_batch": INTERACTIVE,
+    "bullets": INTERACTIVE,
+    "interview": STANDARD,
+    "roadmap": BACKGROUND,
+    "assessment": BACKGROUND,
+}
+
+# Rough chars-per-token ratio used to estimate prompt size before sending
+CHARS_PER_TOKEN = 4
+
+# Called with {"position", "eta_seconds", "priority"} while a request waits.
+# Routes set it per request; see routes.resume._event_stream.
+queue_listener: ContextVar[Optional[Callable[[dict], None]]] = ContextVar(
+    "queue_listener", default=None
+)
+
+
+class LLMBusyError(Exception):
+    """The queue is too long to serve this request within LLM_QUEUE_MAX_WAIT_SECONDS."""
+
+    def __init__(self, eta_seconds: float, position: int):
+        self.eta_seconds = eta_seconds
+        self.position = position
+        super().__init__(
+            f"LLM is at capacity; estimated wait {eta_seconds:.0f}s (queue position {position})"
+        )
+
+
+class TokenBucket:
+    """Per-minute budget refilling continuously; may go negative after a correction."""
+
+    def __init__(self, per_minute: float):
+        self.set_limit(per_minute)
+        self.level = self.capacity
+        self.updated = time.monotonic()
+
+    def set_limit(self, per_minute: float) -> None:
+        self.capacity = float(per_minute)
+        self.rate = self.capacity / 60.0
+
+    def refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """Seconds until amount is available (a request larger than the bucket waits for a full one)."""
+        self.refill(now)
+        deficit = min(amount, self.capacity) - self.level
+        return max(deficit / self.rate, 0.0) if self.rate else 0.0
+
+    def take(self, amount: float, now: float) -> None:
+        self.refill(now)
+        self.level -= amount
+
+    def give(self, amount: float, now: float) -> None:
+        self.refill(now)
+        self.level = min(self.capacity, self.level + amount)
+
+    def cap(self, remaining: float, now: float) -> None:
+        """Trust the server if it reports less budget than we think is left."""
+        self.refill(now)
+        self.level = min(self.level, remaining)
+
+
+@dataclass
+class Reservation:
+    tokens: int
+    priority: int
+
+
+@dataclass(order=True)
+class _Waiter:
+    priority: int
+    seq: int
+    tokens: int = field(compare=False)
+    future: asyncio.Future = field(compare=False)
+    listener: Optional[Callable[[dict], None]] = field(compare=False, default=None)
+    position: int = field(compare=False, default=0)
+
+
+class RateLimiter:
+    def __init__(self, rpm: float, tpm: float, max_wait_seconds: float):
+        self.requests = TokenBucket(rpm)
+        self.tokens = TokenBucket(tpm)
+        self.max_wait_seconds = max_wait_seconds
+        self._queue: list[_Waiter] = []
+        self._seq = itertools.count()
+        self._paused_until = 0.0
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    async def acquire(self, tokens: int, priority: int = STANDARD) -> Reservation:
+        """
+        Wait for budget to send one request costing about tokens.
+
+        Raises:
+            LLMBusyError: the estimated wait exceeds max_wait_seconds
+        """
+        now = time.monotonic()
+        if not self._queue and self._wait_time(tokens, now) == 0:
+            self._take(tokens, now)
+            return Reservation(tokens, priority)
+
+        waiter = _Waiter(
+            priority,
+            next(self._seq),
+            tokens,
+            asyncio.get_running_loop().create_future(),
+            queue_listener.get(),
+        )
+        position, eta = self._estimate(waiter, now)
+        if eta > self.max_wait_seconds:
+            raise LLMBusyError(eta, position)
+
+        heapq.heappush(self._queue, waiter)
+        self._notify(now)
+        self._schedule(now)
+        try:
+            reservation = await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # Granted just as the caller went away; hand the budget back
+                self.settle(waiter.future.result(), 0)
+            else:
+                self._discard(waiter)
+            raise
+        LLM_QUEUE_WAIT_SECONDS.labels(PRIORITY_NAMES[priority]).observe(time.monotonic() - now)
+        return reservation
+
+    def settle(self, reservation: Reservation, actual_tokens: Optional[int]) -> None:
+        """Correct the reserved estimate with the tokens the API actually counted."""
+        if actual_tokens is None:
+            return
+        now = time.monotonic()
+        self.tokens.give(reservation.tokens - actual_tokens, now)
+        reservation.tokens = actual_tokens
+        self._schedule(now)
+
+    def pause(self, seconds: float) -> None:
+        """Hold every request for seconds (after a 429)."""
+        now = time.monotonic()
+        self._paused_until = max(self._paused_until, now + seconds)
+        LLM_RATE_LIMITED.inc()
+        self._schedule(now)
+
+    def observe_headers(self, headers) -> None:
+        """Adapt to Groq's x-ratelimit-* response headers."""
+        now = time.monotonic()
+        # Groq: *-tokens is the per-minute token limit, *-requests the per-day request limit
+        limit_tokens = _to_float(headers.get("x-ratelimit-limit-tokens"))
+        if limit_tokens:
+            self.tokens.set_limit(limit_tokens)
+        remaining_tokens = _to_float(headers.get("x-ratelimit-remaining-tokens"))
+        if remaining_tokens is not None:
+            self.tokens.cap(remaining_tokens, now)
+        remaining_requests = _to_float(headers.get("x-ratelimit-remaining-requests"))
+        if remaining_requests is not None and remaining_requests <= 0:
+            reset = parse_duration(headers.get("x-ratelimit-reset-requests"))
+            if reset:
+                self._paused_until = max(self._paused_until, now + reset)
+        self._schedule(now)
+
+    def status(self) -> dict:
+        now = time.monotonic()
+        self.requests.refill(now)
+        self.tokens.refill(now)
+        return {
+            "queued": sum(1 for w in self._queue if not w.future.done()),
+            "requests_available": round(self.requests.level, 1),
+            "tokens_available": round(self.tokens.level),
+            "rpm_limit": self.requests.capacity,
+            "tpm_limit": self.tokens.capacity,
+            "paused_for_seconds": round(max(self._paused_until - now, 0.0), 2),
+        }
+
+    def _wait_time(self, tokens: int, now: float) -> float:
+        return max(
+            self._paused_until - now,
+            self.requests.wait_time(1, now),
+            self.tokens.wait_time(tokens, now),
+            0.0,
+        )
+
+    def _take(self, tokens: int, now: float) -> None:
+        self.requests.take(1, now)
+        self.tokens.take(tokens, now)
+
+    def _dispatch(self) -> None:
+        """Grant budget to waiters in priority order while it lasts."""
+        self._timer = None
+        now = time.monotonic()
+        granted = False
+        while self._queue:
+            head = self._queue[0]
+            if head.future.done():
+                heapq.heappop(self._queue)
+                continue
+            wait = self._wait_time(head.tokens, now)
+            if wait > 0:
+                self._timer = asyncio.get_running_loop().call_later(wait, self._dispatch)
+                break
+            heapq.heappop(self._queue)
+            self._take(head.tokens, now)
+            head.future.set_result(Reservation(head.tokens, head.priority))
+            granted = True
+        if granted:
+            self._notify(now)
+
+    def _schedule(self, now: float) -> None:
+        """(Re)arm the dispatch timer for the current head of the queue."""
+        if not self._queue:
+            return
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = asyncio.get_running_loop().call_soon(self._dispatch)
+
+    def _discard(self, waiter: _Waiter) -> None:
+        if waiter in self._queue:
+            self._queue.remove(waiter)
+            heapq.heapify(self._queue)
+        self._notify(time.monotonic())
+
+    def _etas(self, waiters: list[_Waiter], now: float) -> list[float]:
+        """ETA for each waiter (in service order) if budget refills at the current rates."""
+        self.requests.refill(now)
+        self.tokens.refill(now)
+        pause = max(self._paused_until - now, 0.0)
+        etas = []
+        requests_needed = 0.0
+        tokens_needed = 0.0
+        for waiter in waiters:
+            requests_needed += 1
+            tokens_needed += min(waiter.tokens, self.tokens.capacity)
+            etas.append(max(
+                pause,
+                _deficit_seconds(requests_needed, self.requests),
+                _deficit_seconds(tokens_needed, self.tokens),
+            ))
+        return etas
+
+    def _estimate(self, waiter: _Waiter, now: float) -> tuple[int, float]:
+        ahead = sorted(w for w in self._queue if not w.future.done() and w < waiter)
+        return len(ahead) + 1, self._etas(ahead + [waiter], now)[-1]
+
+    def _notify(self, now: float) -> None:
+        """Tell waiters whose queue position changed where they stand."""
+        waiters = sorted(w for w in self._queue if not w.future.done())
+        if not any(w.listener for w in waiters):
+            return
+        for position, (waiter, eta) in enumerate(zip(waiters, self._etas(waiters, now)), start=1):
+            if waiter.listener is None or waiter.position == position:
+                continue
+            waiter.position = position
+            try:
+                waiter.listener({
+                    "position": position,
+                    "eta_seconds": round(eta, 1),
+                    "priority": PRIORITY_NAMES[waiter.priority],
+                })
+            except Exception as e:
+                print(f"[RateLimiter] WARNING: queue listener failed: {e}")
+
+
+def estimate_tokens(messages: list[dict], max_tokens: int) -> int:
+    """What Groq will count against TPM before generating: prompt + max_tokens."""
+    prompt_chars = sum(len(m.get("content", "")) for m in messages)
+    return prompt_chars // CHARS_PER_TOKEN + max_tokens
+
+
+def engine_priority(engine: str) -> int:
+    return ENGINE_PRIORITY.get(engine, STANDARD)
+
+
+_DURATION_RE = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_UNIT_SECONDS = {"h": 3600.0, "m": 60.0, "s": 1.0, "ms": 0.001}
+
+
+def parse_duration(value: Optional[str]) -> Optional[float]:
+    """Seconds from a header like "7.66s", "2m59.56s", "120ms" or a bare number."""
+    if not value:
+        return None
+    number = _to_float(value)
+    if number is not None:
+        return number
+    parts = _DURATION_RE.findall(value)
+    if not parts:
+        return None
+    return sum(float(amount) * _UNIT_SECONDS[unit] for amount, unit in parts)
+
+
+def _to_float(value) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _deficit_seconds(needed: float, bucket: TokenBucket) -> float:
+    if not bucket.rate:
+        return 0.0
+    return max((needed - bucket.level) / bucket.rate, 0.0)
+
+
+_limiter = None
+
+
+def get_limiter() -> Optional[RateLimiter]:
+    """Lazy-initialize the process-wide limiter (None when disabled)."""
+    global _limiter
+    if _limiter is None and LLM_RATE_LIMIT_ENABLED:
+        _limiter = RateLimiter(LLM_RPM_LIMIT, LLM_TPM_LIMIT, LLM_QUEUE_MAX_WAIT_SECONDS)
+    return _limiter
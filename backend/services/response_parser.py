@@ -0,0 +1,252 @@
+"""
+Response Parser Service — Repair, salvage and validate engine JSON
+Engines used to fall back to an empty result whenever json.loads failed, so
+a completion cut off by max_tokens lost every finished bullet and the user
+retried the whole request. Responses now go through one shared path:
+
+1. repair_json fixes the usual breakage (markdown fences, chatter around the
+   object, trailing commas, unclosed arrays and objects) and, if that is not
+   enough, cuts back to the last complete value, dropping a string that was
+   cut off mid-way.
+2. The result is validated against the engine's schema (engine_schemas);
+   list items (bullets, gaps, questions) are validated one by one and
+   broken ones dropped.
+3. Only when a required field is still missing is the model asked for a
+   continuation, and only for the missing fields.
+
+Outcomes are counted per engine in syrus_llm_responses.
+"""
+
+import json
+import typing
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from pydantic import BaseModel, ValidationError
+
+from config import LLM_CONTINUATION_ENABLED
+from services.engine_schemas import ENGINE_SCHEMAS
+from services.llm_client import chat_completion
+from services.metrics import LLM_RESPONSES
+
+# Cut points tried (newest first) before giving up on a broken completion
+_MAX_CUT_ATTEMPTS = 64
+
+_OPENERS = {"{": "}", "[": "]"}
+
+
+@dataclass
+class ParsedResponse:
+    data: Optional[dict]                # validated fields (possibly partial); None if nothing usable
+    repaired: bool                      # the raw text was not valid JSON as-is
+    missing: list[str] = field(default_factory=list)  # required fields absent or invalid
+
+
+def repair_json(text: str) -> tuple[Any, bool]:
+    """
+    Parse text as the JSON object it was meant to be.
+
+    Returns:
+        (value, repaired) — value is None when nothing could be recovered
+    """
+    try:
+        return json.loads(text), False
+    except (json.JSONDecodeError, TypeError):
+        pass
+
+    start = text.find("{") if text else -1
+    if start < 0:
+        return None, True
+
+    out: list[str] = []
+    stack: list[str] = []
+    # (length of out, closers) at every point where the text can be cut cleanly
+    cuts: list[tuple[int, str]] = []
+    in_string = escape = False
+
+    for c in text[start:]:
+        if in_string:
+            out.append(c)
+            if escape:
+                escape = False
+            elif c == "\\":
+                escape = True
+            elif c == '"':
+                in_string = False
+            continue
+        if c == '"':
+            in_string = True
+        elif c in _OPENERS:
+            stack.append(_OPENERS[c])
+        elif c in "}]":
+            _drop_trailing_comma(out)
+            out.append(c)
+            if stack:
+                stack.pop()
+            if not stack:
+                break  # end of the object; anything after is chatter
+            cuts.append((len(out), "".join(reversed(stack))))
+            continue
+        elif c == ",":
+            cuts.append((len(out), "".join(reversed(stack))))
+        out.append(c)
+
+    # First try: close whatever is open at the very end. A string cut off
+    # mid-way is never kept: half a bullet is worse than no bullet.
+    if not in_string:
+        body = "".join(out).rstrip()
+        if body.endswith(","):
+            body = body[:-1]
+        elif body.endswith(":"):
+            body += " null"
+        value = _loads(body + "".join(reversed(stack)))
+        if value is not None:
+            return value, True
+
+    # Then cut back to the last complete value
+    for length, closers in reversed(cuts[-_MAX_CUT_ATTEMPTS:]):
+        value = _loads("".join(out[:length]).rstrip().rstrip(",") + closers)
+        if value is not None:
+            return value, True
+    return None, True
+
+
+def parse_response(text: str, engine: str) -> ParsedResponse:
+    """Repair and validate one completion against the engine's schema."""
+    value, repaired = repair_json(text)
+    schema = ENGINE_SCHEMAS[engine]
+    if not isinstance(value, dict):
+        return ParsedResponse(None, repaired, _required_fields(schema))
+    data, missing = _validate(value, schema)
+    return ParsedResponse(data, repaired, missing)
+
+
+async def parse_engine_response(
+    text: str,
+    engine: str,
+    system_prompt: str,
+    user_prompt: str,
+    temperature: float,
+    max_tokens: int,
+) -> Optional[dict]:
+    """
+    Validated engine result from a completion, asking the model once for any
+    required fields the completion lacks.
+
+    Args:
+        text: the completion text
+        engine: engine name (selects the schema)
+        system_prompt, user_prompt, temperature, max_tokens: the original
+            request, reused for the continuation
+
+    Returns:
+        the validated result, or None if it could not be completed
+    """
+    parsed = parse_response(text, engine)
+    if not parsed.missing:
+        LLM_RESPONSES.labels(engine, "repaired" if parsed.repaired else "valid").inc()
+        return parsed.data
+
+    if not LLM_CONTINUATION_ENABLED:
+        LLM_RESPONSES.labels(engine, "failed").inc()
+        return None
+
+    print(f"[Parser] {engine} response missing {', '.join(parsed.missing)}; requesting continuation")
+    try:
+        continuation = await chat_completion(
+            system_prompt=system_prompt,
+            user_prompt=_continuation_prompt(user_prompt, parsed),
+            temperature=temperature,
+            max_tokens=max_tokens,
+            engine=engine,
+        )
+    except Exception as e:
+        print(f"[Parser] WARNING: {engine} continuation failed: {e}")
+        LLM_RESPONSES.labels(engine, "failed").inc()
+        return None
+
+    extra, _ = repair_json(continuation)
+    merged = dict(parsed.data or {})
+    if isinstance(extra, dict):
+        merged.update({k: v for k, v in extra.items() if k in parsed.missing})
+    data, missing = _validate(merged, ENGINE_SCHEMAS[engine])
+    if missing:
+        LLM_RESPONSES.labels(engine, "failed").inc()
+        return None
+    LLM_RESPONSES.labels(engine, "continued").inc()
+    return data
+
+
+def _validate(value: dict, schema: type[BaseModel]) -> tuple[dict, list[str]]:
+    """
+    Validate list items one at a time (dropping broken ones), then the
+    object as a whole. Returns the usable fields and the required ones missing.
+    """
+    cleaned = dict(value)
+    for name, info in schema.model_fields.items():
+        item_model = _list_item_model(info.annotation)
+        if item_model is None or not isinstance(cleaned.get(name), list):
+            continue
+        items = []
+        for item in cleaned[name]:
+            try:
+                items.append(item_model.model_validate(item).model_dump())
+            except ValidationError:
+                continue
+        cleaned[name] = items
+
+    try:
+        return schema.model_validate(cleaned).model_dump(), []
+    except ValidationError as e:
+        bad = {str(err["loc"][0]) for err in e.errors() if err["loc"]}
+
+    # Drop the broken fields; optional ones fall back to their defaults
+    for name in bad:
+        cleaned.pop(name, None)
+    missing = [name for name in _required_fields(schema) if name not in cleaned]
+    if not missing:
+        return schema.model_validate(cleaned).model_dump(), []
+    return cleaned, missing
+
+
+def _list_item_model(annotation) -> Optional[type[BaseModel]]:
+    if typing.get_origin(annotation) is not list:
+        return None
+    args = typing.get_args(annotation)
+    if args and isinstance(args[0], type) and issubclass(args[0], BaseModel):
+        return args[0]
+    return None
+
+
+def _required_fields(schema: type[BaseModel]) -> list[str]:
+    return [name for name, info in schema.model_fields.items() if info.is_required()]
+
+
+def _continuation_prompt(user_prompt: str, parsed: ParsedResponse) -> str:
+    missing = ", ".join(parsed.missing)
+    if not parsed.data:
+        return f"""{user_prompt}
+
+Your previous answer was not valid JSON. Return the complete JSON object, including {missing}."""
+    return f"""{user_prompt}
+
+## PARTIAL ANSWER (your previous answer was cut off; these fields are already done):
+{json.dumps(parsed.data, ensure_ascii=False)}
+
+Return ONLY a JSON object containing the missing fields: {missing}. Do not repeat the fields above."""
+
+
+def _drop_trailing_comma(out: list[str]) -> None:
+    i = len(out) - 1
+    while i >= 0 and out[i].isspace():
+        i -= 1
+    if i >= 0 and out[i] == ",":
+        del out[i:]
+
+
+def _loads(text: str) -> Any:
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        return None
+
@@ -0,0 +1,79 @@
+"""
+Resume Cache Service — Parsed resumes keyed by PDF content hash
+Students re-upload the same master resume on every visit. The parse is
+keyed by a hash of the PDF bytes and the extraction mode, and kept in an
+in-process LRU, optionally backed by a SQLite file shared by the workers on
+a host (the llm_cache tiers, in their own table).
+
+Every entry carries the pdf_parser.PARSER_VERSION it was made with. An
+entry from another version is a miss and is overwritten by the fresh
+parse, so a parser upgrade never serves stale sections.
+"""
+
+import json
+from typing import Optional
+
+from config import (
+    PDF_EXTRACTION_MODE,
+    RESUME_CACHE_DB_MAX_ENTRIES,
+    RESUME_CACHE_DB_PATH,
+    RESUME_CACHE_MAX_ENTRIES,
+    RESUME_CACHE_TTL_SECONDS,
+)
+from services.llm_cache import LLMCache, MemoryTier, SQLiteTier
+from services.pdf_parser import PARSER_VERSION
+
+_cache = None
+
+
+def get_cache() -> LLMCache:
+    """Lazy-initialize the process-wide parsed-resume cache."""
+    global _cache
+    if _cache is None:
+        disk = None
+        if RESUME_CACHE_DB_PATH:
+            disk = SQLiteTier(
+                RESUME_CACHE_DB_PATH,
+                RESUME_CACHE_DB_MAX_ENTRIES,
+                RESUME_CACHE_TTL_SECONDS,
+                table="parsed_resumes",
+            )
+        _cache = LLMCache(MemoryTier(RESUME_CACHE_MAX_ENTRIES, RESUME_CACHE_TTL_SECONDS), disk)
+    return _cache
+
+
+def _key(file_hash: str) -> str:
+    return f"{PDF_EXTRACTION_MODE}:{file_hash}"
+
+
+async def get_parsed(file_hash: str) -> Optional[dict]:
+    """
+    The cached parse of a PDF, or None.
+
+    Args:
+        file_hash: sha256 hex digest of the PDF bytes
+
+    Returns:
+        a fresh copy of the parsed resume (callers may modify it)
+    """
+    value = await get_cache().aget(_key(file_hash))
+    if value is None:
+        return None
+    entry = json.loads(value)
+    if entry.get("parser_version") != PARSER_VERSION:
+        return None
+    return entry["parsed"]
+
+
+async def set_parsed(file_hash: str, parsed: dict) -> None:
+    """Store a parse, tagged with the current parser version."""
+    value = json.dumps({"parser_version": PARSER_VERSION, "parsed": parsed}, ensure_ascii=False)
+    try:
+        await get_cache().aset(_key(file_hash), value)
+    except Exception as e:
+        # The upload already succeeded; a cache that cannot write only costs the next re-parse
+        print(f"[ResumeCache] WARNING: could not store {file_hash[:12]}: {e}")
+
+
+def stats() -> dict:
+    return get_cache().stats()
@@ -4,34 +4,70 @@ Uses the Groq LLM to rewrite a specific resume experience for a target JD,
 with strict zero-hallucination constraints.
 """
 
-import json
-from openai import OpenAI
-from config import GROQ_API_KEY, GROQ_BASE_URL, GROQ_MODEL
+from typing import Any, AsyncIterator, Optional
 
+from services.llm_client import chat_completion, stream_chat_completion
+from services.json_stream import iter_json_events
+from services.metrics import LLM_RESPONSES
+from services.response_parser import parse_engine_response, parse_response
+from services.honesty_verifier import describe_failure, get_resume_index, verify_bullet
 
-REWRITE_SYSTEM_PROMPT = """You are the Syrus "Honesty-First" Rewrite Engine. Your goal is to optimize a student's resume bullet point for a specific Job Description (JD) without ever inventing new information.
 
-### STRICT CONSTRAINTS:
+_CONSTRAINTS = """### STRICT CONSTRAINTS:
 - Use keywords from the TARGET_JOB_DESCRIPTION only if they accurately describe the MASTER_RESUME_TEXT.
 - DO NOT invent technologies, tools, or metrics not present in the original text.
 - If a JD requires "SQL" and the resume only mentions "Excel," you MAY NOT add "SQL."
 - You MUST base your rewrite ONLY on information found in the MASTER_RESUME_TEXT.
 - The optimized bullet should follow the XYZ formula: "Accomplished [X] by doing [Y], resulting in [Z]"
-- Keep it concise, ATS-friendly, and under 30 words.
+- Keep it concise, ATS-friendly, and under 30 words."""
+
+REWRITE_SYSTEM_PROMPT = f"""You are the Syrus "Honesty-First" Rewrite Engine. Your goal is to optimize a student's resume bullet point for a specific Job Description (JD) without ever inventing new information.
+
+{_CONSTRAINTS}
 
 ### OUTPUT FORMAT (JSON):
 Return a JSON object with this EXACT structure:
-{
+{{
   "optimized_bullet": "The new, ATS-friendly bullet point.",
   "original_source_snippet": "The exact sentence or phrase from the Master Resume used as the foundation.",
   "mapping_logic": "A brief explanation of why this rewrite is honest (e.g., 'Translated \"built a website\" to \"developed a responsive web application\" using the same tech stack mentioned').",
-  "honesty_check": "Pass or Fail based on zero-hallucination policy."
-}
+  "honesty_check": "Pass or Fail based on zero-hallucination policy.",
+  "alternative_bullets": ["Two more conservative rewrites, each using only wording and facts from the MASTER_RESUME_TEXT."]
+}}
+
+Only return valid JSON. No markdown fences, no extra text."""
+
+MULTI_REWRITE_SYSTEM_PROMPT = f"""You are the Syrus "Honesty-First" Rewrite Engine. Your goal is to optimize several of a student's resume bullet points for a specific Job Description (JD) without ever inventing new information. Rewrite each TARGET_EXPERIENCE independently.
+
+{_CONSTRAINTS}
+
+### OUTPUT FORMAT (JSON):
+Return a JSON object with this EXACT structure, one entry per TARGET_EXPERIENCE in the given order:
+{{
+  "rewrites": [
+    {{
+      "index": "The number of the TARGET_EXPERIENCE this entry rewrites.",
+      "optimized_bullet": "The new, ATS-friendly bullet point.",
+      "original_source_snippet": "The exact sentence or phrase from the Master Resume used as the foundation.",
+      "mapping_logic": "A brief explanation of why this rewrite is honest.",
+      "honesty_check": "Pass or Fail based on zero-hallucination policy.",
+      "alternative_bullets": ["Two more conservative rewrites, each using only wording and facts from the MASTER_RESUME_TEXT."]
+    }}
+  ]
+}}
 
 Only return valid JSON. No markdown fences, no extra text."""
 
+# Completion budget per experience in a multi-rewrite (bullet, snippet, logic, two alternatives)
+_TOKENS_PER_REWRITE = 350
 
-def rewrite_bullet(master_resume_text: str, target_jd: str, target_experience: str) -> dict:
+
+async def rewrite_bullet(
+    master_resume_text: str,
+    target_jd: str,
+    target_experience: str,
+    resume_context: Optional[str] = None,
+) -> dict:
     """
     Rewrite a specific experience bullet for a target JD using the Honesty-First engine.
 
@@ -39,16 +75,122 @@ def rewrite_bullet(master_resume_text: str, target_jd: str, target_experience: s
         master_resume_text: The FULL text of the student's master resume (for context/verification).
         target_jd: The job description requirements.
         target_experience: The specific project or work experience to be rewritten.
+        resume_context: the relevant part of the resume to send instead of all
+            of it (see context_selector); verification still uses the full text.
 
     Returns:
-        dict with optimized_bullet, original_source_snippet, mapping_logic, honesty_check
+        dict with optimized_bullet, original_source_snippet, mapping_logic,
+        honesty_check and verification (the local check of the final bullet)
     """
-    client = OpenAI(
-        api_key=GROQ_API_KEY,
-        base_url=GROQ_BASE_URL,
+    user_prompt = _build_user_prompt(resume_context or master_resume_text, target_jd, target_experience)
+    result_text = await chat_completion(
+        system_prompt=REWRITE_SYSTEM_PROMPT,
+        user_prompt=user_prompt,
+        temperature=0.3,
+        max_tokens=800,
+        engine="rewrite",
     )
+    return _verify_result(await _parse_result(result_text, user_prompt), master_resume_text, target_experience)
+
+
+async def stream_rewrite(
+    master_resume_text: str,
+    target_jd: str,
+    target_experience: str,
+    resume_context: Optional[str] = None,
+) -> AsyncIterator[tuple[str, Any]]:
+    """
+    Streaming variant of rewrite_bullet.
+
+    Yields ("field", {name: value}) as each output field finishes, then
+    ("result", dict) with the same shape rewrite_bullet returns. Only
+    verified text is streamed: optimized_bullet is sent early if it passes
+    the honesty check on its own, and the model's honesty_check and
+    alternative_bullets are never sent, since the result may replace them.
+    """
+    user_prompt = _build_user_prompt(resume_context or master_resume_text, target_jd, target_experience)
+    deltas = stream_chat_completion(
+        system_prompt=REWRITE_SYSTEM_PROMPT,
+        user_prompt=user_prompt,
+        temperature=0.3,
+        max_tokens=800,
+        engine="rewrite",
+    )
+    async for kind, key, value in iter_json_events(deltas):
+        if kind == "field":
+            if key in ("honesty_check", "alternative_bullets"):
+                continue
+            if key == "optimized_bullet" and not _passes(value, master_resume_text, target_experience):
+                # Held back; the result carries whatever replaces it
+                continue
+            yield "field", {key: value}
+        elif kind == "complete":
+            result = await _parse_result(value, user_prompt)
+            yield "result", _verify_result(result, master_resume_text, target_experience)
+
+
+async def rewrite_bullets(
+    master_resume_text: str,
+    target_jd: str,
+    target_experiences: list[str],
+    resume_context: Optional[str] = None,
+) -> tuple[list[dict], int]:
+    """
+    Rewrite several experiences for one JD in a single completion.
+
+    The resume and JD are sent once instead of once per bullet. Entries that
+    come back missing or unparseable are retried once, together, in a second
+    completion; anything still missing gets a Fail result.
+
+    Args:
+        master_resume_text: The FULL text of the student's master resume (for verification).
+        target_jd: The job description requirements.
+        target_experiences: The experiences to rewrite, in display order.
+        resume_context: the relevant part of the resume to send instead of all of it.
+
+    Returns:
+        (results, llm_calls): one rewrite_bullet-shaped dict per experience, in
+        input order, and the number of completions used
+    """
+    context = resume_context or master_resume_text
+    results: list[Optional[dict]] = [None] * len(target_experiences)
+    pending = list(range(len(target_experiences)))
+    llm_calls = 0
+
+    for _ in range(2):
+        try:
+            result_text = await chat_completion(
+                system_prompt=MULTI_REWRITE_SYSTEM_PROMPT,
+                user_prompt=_build_multi_user_prompt(
+                    context, target_jd, [target_experiences[i] for i in pending]
+                ),
+                temperature=0.3,
+                max_tokens=_TOKENS_PER_REWRITE * len(pending) + 200,
+                engine="rewrite_batch",
+            )
+        except Exception as e:
+            if not llm_calls:
+                raise
+            # Keep what the first completion produced
+            print(f"[Rewrite] WARNING: retry of {len(pending)} rewrites failed: {e}")
+            break
+        llm_calls += 1
+        for position, item in _parse_multi_result(result_text, len(pending)).items():
+            results[pending[position]] = item
+        pending = [i for i in pending if results[i] is None]
+        if not pending:
+            break
+        print(f"[Rewrite] Retrying {len(pending)} of {len(target_experiences)} rewrites that failed to parse")
+
+    return [
+        _verify_result(item, master_resume_text, experience)
+        if item is not None else _failed_result("")
+        for item, experience in zip(results, target_experiences)
+    ], llm_calls
 
-    user_prompt = f"""## MASTER_RESUME_TEXT (full student resume for context):
+
+def _build_user_prompt(master_resume_text: str, target_jd: str, target_experience: str) -> str:
+    return f"""## MASTER_RESUME_TEXT (the student's resume, or its sections relevant to this JD):
 {master_resume_text}
 
 ## TARGET_JOB_DESCRIPTION:
@@ -57,28 +199,111 @@ def rewrite_bullet(master_resume_text: str, target_jd: str, target_experience: s
 ## TARGET_EXPERIENCE (the specific bullet/experience to rewrite):
 {target_experience}
 
-Rewrite the TARGET_EXPERIENCE for this JD. Use the full MASTER_RESUME_TEXT as context to verify honesty. Return valid JSON only."""
+Rewrite the TARGET_EXPERIENCE for this JD. Use the MASTER_RESUME_TEXT as context to verify honesty. Return valid JSON only."""
 
-    response = client.chat.completions.create(
-        model=GROQ_MODEL,
-        messages=[
-            {"role": "system", "content": REWRITE_SYSTEM_PROMPT},
-            {"role": "user", "content": user_prompt},
-        ],
-        temperature=0.3,
-        max_tokens=800,
-        response_format={"type": "json_object"},
-    )
 
-    result_text = response.choices[0].message.content
+def _build_multi_user_prompt(resume_context: str, target_jd: str, target_experiences: list[str]) -> str:
+    # Resume and JD first, experiences last: the shared prefix stays identical across calls
+    experiences = "\n".join(f"[{i}] {text}" for i, text in enumerate(target_experiences))
+    return f"""## MASTER_RESUME_TEXT (the student's resume, or its sections relevant to this JD):
+{resume_context}
+
+## TARGET_JOB_DESCRIPTION:
+{target_jd}
+
+## TARGET_EXPERIENCES (rewrite each one; the number in brackets is its index):
+{experiences}
+
+Rewrite every TARGET_EXPERIENCE for this JD. Use the MASTER_RESUME_TEXT as context to verify honesty. Return valid JSON only."""
+
+
+def _parse_multi_result(result_text: str, count: int) -> dict[int, dict]:
+    """
+    Usable entries of a multi-rewrite completion by position (0..count-1).
+
+    A completion that is not valid JSON as a whole (e.g. cut off by
+    max_tokens) still yields every entry that finished before the damage;
+    the caller retries the rest, so no continuation is requested here.
+    """
+    response = parse_response(result_text, "rewrite_batch")
+    items = (response.data or {}).get("rewrites", [])
+    outcome = "failed" if not items else "repaired" if response.repaired else "valid"
+    LLM_RESPONSES.labels("rewrite_batch", outcome).inc()
+
+    parsed = {}
+    for order, item in enumerate(items):
+        position = _to_index(item.pop("index", None), order)
+        if 0 <= position < count and position not in parsed:
+            parsed[position] = item
+    return parsed
+
+
+def _to_index(value, default: int) -> int:
     try:
-        return json.loads(result_text)
-    except json.JSONDecodeError:
-        return {
-            "optimized_bullet": "",
-            "original_source_snippet": "",
-            "mapping_logic": "",
-            "honesty_check": "Fail",
-            "error": "Failed to parse LLM response",
-            "raw_response": result_text,
-        }
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+async def _parse_result(result_text: str, user_prompt: str) -> dict:
+    result = await parse_engine_response(
+        result_text, "rewrite", REWRITE_SYSTEM_PROMPT, user_prompt, temperature=0.3, max_tokens=800
+    )
+    if result is not None:
+        return result
+    return _failed_result(result_text)
+
+
+def _failed_result(result_text: str) -> dict:
+    return {
+        "optimized_bullet": "",
+        "original_source_snippet": "",
+        "mapping_logic": "",
+        "honesty_check": "Fail",
+        "error": "Failed to parse LLM response",
+        "raw_response": result_text,
+    }
+
+
+def _passes(bullet: Any, master_resume_text: str, target_experience: str) -> bool:
+    """Whether _verify_result would keep this bullet as the optimized_bullet."""
+    if not isinstance(bullet, str) or not bullet:
+        return False
+    return verify_bullet(bullet, get_resume_index(master_resume_text), target_experience)["passed"]
+
+
+def _verify_result(result: dict, master_resume_text: str, target_experience: str) -> dict:
+    """
+    Check the rewrite against the resume locally instead of trusting the
+    model's own honesty_check. If optimized_bullet introduces a term or figure
+    the resume never mentions, fall back to the first alternative that passes;
+    if none does, keep the original experience and mark the result Fail.
+    """
+    if not result.get("optimized_bullet"):
+        return result
+
+    index = get_resume_index(master_resume_text)
+    candidates = [result["optimized_bullet"]] + [
+        alt for alt in result.pop("alternative_bullets", None) or [] if isinstance(alt, str) and alt
+    ]
+    first_check = None
+    for i, candidate in enumerate(candidates):
+        check = verify_bullet(candidate, index, target_experience)
+        first_check = first_check or check
+        if check["passed"]:
+            result["optimized_bullet"] = candidate
+            # The local check decides, whatever the model said about its own draft
+            result["honesty_check"] = "Pass"
+            result["verification"] = {**check, "replaced": i > 0}
+            if i > 0:
+                result["mapping_logic"] = (
+                    f"First draft {describe_failure(first_check)}; used a stricter rewrite. "
+                    + result.get("mapping_logic", "")
+                ).strip()
+            return result
+
+    result["optimized_bullet"] = target_experience
+    result["honesty_check"] = "Fail"
+    result["mapping_logic"] = f"Rewrite rejected: it {describe_failure(first_check)}. Kept your original wording."
+    result["verification"] = {**first_check, "replaced": True}
+    return result
@@ -4,9 +4,11 @@ Uses the Groq LLM to identify critical skill gaps and suggest
 high-quality, free learning resources (prioritizing Indian platforms).
 """
 
-import json
-from openai import OpenAI
-from config import GROQ_API_KEY, GROQ_BASE_URL, GROQ_MODEL
+from typing import Any, AsyncIterator, Optional
+
+from services.llm_client import chat_completion, stream_chat_completion
+from services.json_stream import iter_json_events
+from services.response_parser import parse_engine_response
 
 
 ROADMAP_SYSTEM_PROMPT = """You are the Syrus Career Roadmap Architect. Your task is to identify critical skill gaps between a student's Master Resume and a set of Target Job Descriptions.
@@ -39,23 +41,62 @@ ROADMAP_SYSTEM_PROMPT = """You are the Syrus Career Roadmap Architect. Your task
 Only return valid JSON. No markdown fences, no extra text."""
 
 
-def generate_career_roadmap(master_resume_text: str, target_jds: str) -> dict:
+async def generate_career_roadmap(
+    master_resume_text: str,
+    target_jds: str,
+    resume_context: Optional[str] = None,
+) -> dict:
     """
     Generate a career roadmap indicating skill gaps and learning resources.
 
     Args:
         master_resume_text: The full parsed text of the student's resume
         target_jds: The target job description(s)
+        resume_context: the relevant part of the resume to send instead of all
+            of it (see context_selector)
 
     Returns:
         dict containing identified_gaps and overall_readiness_summary
     """
-    client = OpenAI(
-        api_key=GROQ_API_KEY,
-        base_url=GROQ_BASE_URL,
+    user_prompt = _build_user_prompt(resume_context or master_resume_text, target_jds)
+    result_text = await chat_completion(
+        system_prompt=ROADMAP_SYSTEM_PROMPT,
+        user_prompt=user_prompt,
+        temperature=0.4,
+        max_tokens=2000,
+        engine="roadmap",
+    )
+    return await _parse_result(result_text, user_prompt)
+
+
+async def stream_career_roadmap(
+    master_resume_text: str,
+    target_jds: str,
+    resume_context: Optional[str] = None,
+) -> AsyncIterator[tuple[str, Any]]:
+    """
+    Streaming variant of generate_career_roadmap.
+
+    Yields ("gap", dict) as each identified gap finishes, then ("result", dict)
+    with the same shape generate_career_roadmap returns.
+    """
+    user_prompt = _build_user_prompt(resume_context or master_resume_text, target_jds)
+    deltas = stream_chat_completion(
+        system_prompt=ROADMAP_SYSTEM_PROMPT,
+        user_prompt=user_prompt,
+        temperature=0.4,
+        max_tokens=2000,
+        engine="roadmap",
     )
+    async for kind, key, value in iter_json_events(deltas):
+        if kind == "item" and key == "identified_gaps":
+            yield "gap", value
+        elif kind == "complete":
+            yield "result", await _parse_result(value, user_prompt)
+
 
-    user_prompt = f"""## INPUT DATA:
+def _build_user_prompt(master_resume_text: str, target_jds: str) -> str:
+    return f"""## INPUT DATA:
 1. MASTER_RESUME_TEXT:
 {master_resume_text}
 
@@ -64,24 +105,16 @@ def generate_career_roadmap(master_resume_text: str, target_jds: str) -> dict:
 
 Generate the career roadmap and skill gap analysis. Return valid JSON only."""
 
-    response = client.chat.completions.create(
-        model=GROQ_MODEL,
-        messages=[
-            {"role": "system", "content": ROADMAP_SYSTEM_PROMPT},
-            {"role": "user", "content": user_prompt},
-        ],
-        temperature=0.4,
-        max_tokens=2000,
-        response_format={"type": "json_object"},
-    )
 
-    result_text = response.choices[0].message.content
-    try:
-        return json.loads(result_text)
-    except json.JSONDecodeError:
-        return {
-            "identified_gaps": [],
-            "overall_readiness_summary": "Failed to parse analysis results.",
-            "error": "Failed to parse LLM response",
-            "raw_response": result_text,
-        }
+async def _parse_result(result_text: str, user_prompt: str) -> dict:
+    result = await parse_engine_response(
+        result_text, "roadmap", ROADMAP_SYSTEM_PROMPT, user_prompt, temperature=0.4, max_tokens=2000
+    )
+    if result is not None:
+        return result
+    return {
+        "identified_gaps": [],
+        "overall_readiness_summary": "Failed to parse analysis results.",
+        "error": "Failed to parse LLM response",
+        "raw_response": result_text,
+    }
@@ -0,0 +1,395 @@
+"""
+Session Store Service — Async persistence layer for user sessions
+Routes await these functions instead of calling the blocking Firestore client
+on the event loop. Blocking backend calls run in worker threads; with
+WRITE_BEHIND_ENABLED, save_session returns as soon as the write is spooled
+to local disk and a background flusher groups writes into Firestore batches.
+"""
+
+import asyncio
+import glob
+import json
+import os
+import time
+from time import perf_counter
+from typing import Optional
+
+from config import (
+    SESSION_STORE_BACKEND,
+    WRITE_BEHIND_ENABLED,
+    WRITE_BEHIND_MAX_BATCH,
+    WRITE_BEHIND_FLUSH_SECONDS,
+    WRITE_BEHIND_MAX_ATTEMPTS,
+    WRITE_BEHIND_SPOOL_DIR,
+)
+from services import firestore
+from services.memory_store import MemoryBackend, new_document_id
+from services.metrics import STORE_CALL_SECONDS, record_span
+
+_backend = None
+_queue = None
+
+
+def get_backend():
+    """The sync backend: the services.firestore module or an in-memory fake."""
+    global _backend
+    if _backend is None:
+        if SESSION_STORE_BACKEND == "memory":
+            _backend = MemoryBackend()
+        else:
+            _backend = firestore
+    return _backend
+
+
+async def call_backend(op: str, *args):
+    """Run a blocking backend call in a worker thread, timing it."""
+    started = perf_counter()
+    try:
+        return await asyncio.to_thread(getattr(get_backend(), op), *args)
+    finally:
+        elapsed = perf_counter() - started
+        STORE_CALL_SECONDS.labels(SESSION_STORE_BACKEND, op).observe(elapsed)
+        record_span("store", elapsed)
+
+
+class WriteBehindQueue:
+    """
+    Buffers session writes and flushes them as Firestore batches, on size
+    (WRITE_BEHIND_MAX_BATCH writes) or every WRITE_BEHIND_FLUSH_SECONDS.
+
+    Durability: every write is appended to spool.jsonl before save_session
+    returns. A flush renames the spool to a segment file and only deletes it
+    once the batch commits, so writes survive a crash and are replayed on the
+    next start. A segment larger than one batch is committed in chunks, and
+    the number of items committed so far is recorded next to it (in
+    segment-*.committed), so a retry, in this run or after a restart, resumes
+    after the last committed chunk instead of repeating its aggregate
+    increments. Session writes are idempotent (fixed IDs); a crash between a
+    commit and recording it can still double-count the skill-gap aggregate,
+    which GET /api/skill-gaps?rebuild=true repairs.
+
+    A segment that has failed max_attempts flushes is retried once more
+    after the segment behind it. If that one commits, the store is up and
+    the failing segment is the problem: it is renamed to failed-*.jsonl
+    (not replayed on start) so it stops blocking everything after it.
+    """
+
+    def __init__(
+        self,
+        backend,
+        spool_dir: str,
+        max_batch: int,
+        flush_seconds: float,
+        max_attempts: int = WRITE_BEHIND_MAX_ATTEMPTS,
+    ):
+        self.backend = backend
+        self.spool_dir = spool_dir
+        self.max_batch = max_batch
+        self.flush_seconds = flush_seconds
+        self.max_attempts = max_attempts
+        self._buffer: list[tuple[str, str, dict]] = []
+        self._users: set[str] = set()
+        # Segments awaiting commit: (segment path, items)
+        self._segments: list[tuple[str, list]] = []
+        # Per segment path: items already committed, and failed flushes
+        self._committed: dict[str, int] = {}
+        self._attempts: dict[str, int] = {}
+        # _lock guards the buffer and live spool; _flush_lock serializes
+        # commits so savers never wait on a Firestore round trip
+        self._lock = asyncio.Lock()
+        self._flush_lock = asyncio.Lock()
+        # Set by put() when a batch fills, to wake the flusher early
+        self._full = asyncio.Event()
+        self._stopping = False
+        self._flusher: Optional[asyncio.Task] = None
+        os.makedirs(spool_dir, exist_ok=True)
+        self._spool_path = os.path.join(spool_dir, "spool.jsonl")
+        self._spool = None
+
+    async def start(self) -> None:
+        """Replay anything left over from a previous run, then start flushing."""
+        self._recover()
+        self._spool = open(self._spool_path, "a", encoding="utf-8")
+        self._flusher = asyncio.create_task(self._flush_periodically())
+
+    async def stop(self) -> None:
+        """Flush everything still buffered (called on app shutdown)."""
+        if self._flusher is not None:
+            # Let the flusher finish rather than cancel it: a cancelled commit
+            # keeps running in its thread, and flushing again would repeat it
+            self._stopping = True
+            self._full.set()
+            await self._flusher
+            self._flusher = None
+        await self.flush()
+        if self._spool is not None:
+            self._spool.close()
+            self._spool = None
+
+    async def put(self, user_id: str, session_id: str, session_data: dict) -> None:
+        line = json.dumps([user_id, session_id, session_data], ensure_ascii=False)
+        async with self._lock:
+            await asyncio.to_thread(self._append, line)
+            self._buffer.append((user_id, session_id, session_data))
+            self._users.add(user_id)
+            # Each batch holds one write per session plus one aggregate write per user
+            full = len(self._buffer) + len(self._users) >= self.max_batch
+        if full:
+            self._full.set()
+
+    def pending(self, user_id: str) -> list[tuple[str, dict]]:
+        """Buffered (session_id, session_data) for a user, not yet in Firestore."""
+        items = list(self._buffer)
+        for _, segment_items in self._segments:
+            items.extend(segment_items)
+        return [(sid, data) for uid, sid, data in items if uid == user_id]
+
+    async def flush(self) -> None:
+        async with self._flush_lock:
+            async with self._lock:
+                self._rotate()
+            while self._segments:
+                path, items = self._segments[0]
+                if await self._try_commit(path, items):
+                    self._discard(0)
+                    continue
+                # Leave the segment in place; the next flush retries it
+                self._attempts[path] = self._attempts.get(path, 0) + 1
+                if self._attempts[path] < self.max_attempts or len(self._segments) < 2:
+                    return
+                # If the next segment fails too the store is likely down; keep both
+                if not await self._try_commit(*self._segments[1]):
+                    return
+                self._discard(1)
+                self._quarantine(path)
+
+    async def _try_commit(self, path: str, items: list) -> bool:
+        try:
+            await asyncio.to_thread(self._commit, path, items)
+        except Exception as e:
+            print(f"[SessionStore] WARNING: flush of {len(items)} sessions from {path} failed: {e}")
+            return False
+        return True
+
+    def _discard(self, i: int) -> None:
+        """Delete a committed segment."""
+        path, _ = self._segments.pop(i)
+        os.remove(path)
+        if os.path.exists(_offset_path(path)):
+            os.remove(_offset_path(path))
+        self._committed.pop(path, None)
+        self._attempts.pop(path, None)
+
+    def _quarantine(self, path: str) -> None:
+        """Move a segment that keeps failing aside for manual replay."""
+        self._segments.pop(0)
+        failed_path = os.path.join(self.spool_dir, os.path.basename(path).replace("segment-", "failed-", 1))
+        os.replace(path, failed_path)
+        if os.path.exists(_offset_path(path)):
+            os.replace(_offset_path(path), _offset_path(failed_path))
+        print(
+            f"[SessionStore] ERROR: {path} failed {self._attempts.pop(path)} flushes while later writes "
+            f"committed; moved to {failed_path} (items after the first {self._committed.pop(path, 0)} "
+            f"are not in the store)"
+        )
+
+    def _append(self, line: str) -> None:
+        self._spool.write(line + "\n")
+        self._spool.flush()
+        os.fsync(self._spool.fileno())
+
+    def _commit(self, path: str, items: list) -> None:
+        # A recovered segment may exceed the batch limit; split it, skipping
+        # chunks an earlier attempt already committed
+        done = self._committed.get(path, 0)
+        chunk, users = [], set()
+        for item in items[done:]:
+            # Writes with this item: sessions so far, this one, one aggregate per user
+            if chunk and len(chunk) + 1 + len(users | {item[0]}) > self.max_batch:
+                self._commit_batch(chunk)
+                done += len(chunk)
+                self._record_committed(path, done)
+                chunk, users = [], set()
+            chunk.append(item)
+            users.add(item[0])
+        if chunk:
+            self._commit_batch(chunk)
+
+    def _record_committed(self, path: str, count: int) -> None:
+        self._committed[path] = count
+        tmp_path = _offset_path(path) + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(str(count))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, _offset_path(path))
+
+    def _commit_batch(self, chunk: list) -> None:
+        started = perf_counter()
+        try:
+            self.backend.save_sessions_batch(chunk)
+        finally:
+            STORE_CALL_SECONDS.labels(SESSION_STORE_BACKEND, "save_sessions_batch").observe(
+                perf_counter() - started
+            )
+
+    def _rotate(self) -> None:
+        """Move the live spool and buffer into a segment awaiting commit."""
+        if not self._buffer:
+            return
+        self._spool.close()
+        segment_path = os.path.join(self.spool_dir, f"segment-{time.time_ns()}.jsonl")
+        os.replace(self._spool_path, segment_path)
+        self._spool = open(self._spool_path, "a", encoding="utf-8")
+        self._segments.append((segment_path, self._buffer))
+        self._buffer = []
+        self._users = set()
+
+    def _recover(self) -> None:
+        if os.path.exists(self._spool_path) and os.path.getsize(self._spool_path):
+            os.replace(
+                self._spool_path,
+                os.path.join(self.spool_dir, f"segment-{time.time_ns()}.jsonl"),
+            )
+        for path in sorted(glob.glob(os.path.join(self.spool_dir, "segment-*.jsonl"))):
+            items = []
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        items.append(tuple(json.loads(line)))
+                    except json.JSONDecodeError:
+                        # Torn final line from a crash mid-write
+                        continue
+            if os.path.exists(_offset_path(path)):
+                with open(_offset_path(path), encoding="utf-8") as f:
+                    self._committed[path] = int(f.read() or 0)
+            if items:
+                print(f"[SessionStore] Replaying {len(items)} spooled sessions from {path}")
+            self._segments.append((path, items))
+        for path in sorted(glob.glob(os.path.join(self.spool_dir, "failed-*.jsonl"))):
+            print(f"[SessionStore] WARNING: {path} was set aside after repeated failures and is not replayed")
+
+    async def _flush_periodically(self) -> None:
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._full.wait(), self.flush_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._full.clear()
+            await self.flush()
+
+
+def _offset_path(segment_path: str) -> str:
+    """Where the count of a segment's committed items is recorded."""
+    return segment_path[: -len(".jsonl")] + ".committed"
+
+
+async def start_store() -> None:
+    """Start the write-behind queue when enabled (called on app startup)."""
+    global _queue
+    if WRITE_BEHIND_ENABLED and _queue is None:
+        _queue = WriteBehindQueue(
+            get_backend(),
+            WRITE_BEHIND_SPOOL_DIR,
+            WRITE_BEHIND_MAX_BATCH,
+            WRITE_BEHIND_FLUSH_SECONDS,
+        )
+        await _queue.start()
+
+
+async def warm_store() -> None:
+    """Connect to Firestore ahead of the first request (nothing to do for the memory backend)."""
+    if get_backend() is firestore:
+        await call_backend("connect")
+
+
+async def stop_store() -> None:
+    """Flush buffered writes (called on app shutdown)."""
+    global _queue
+    if _queue is not None:
+        await _queue.stop()
+        _queue = None
+
+
+async def save_session(user_id: str, data: dict) -> str:
+    """Save a session; buffered when write-behind is enabled."""
+    if _queue is None:
+        return await call_backend("save_session", user_id, data)
+
+    session_id = new_document_id()
+    await _queue.put(user_id, session_id, firestore.build_session_data(user_id, data))
+    return session_id
+
+
+async def get_sessions(
+    user_id: str,
+    limit: int = 20,
+    cursor: Optional[str] = None,
+    summary: bool = False,
+) -> list:
+    """
+    A page of sessions for a user, newest first (including unflushed writes).
+    Pass the previous page's last created_at as cursor for the next page.
+    """
+    sessions = await call_backend("get_sessions", user_id, limit, cursor, summary)
+    if _queue is None:
+        return sessions
+
+    seen = {s["id"] for s in sessions}
+    pending = [
+        {**data, "id": sid}
+        for sid, data in _queue.pending(user_id)
+        if sid not in seen and (not cursor or data["created_at"] < cursor)
+    ]
+    if not pending:
+        return sessions
+    if summary:
+        pending = [firestore.summarize_session(s) for s in pending]
+    merged = sorted(sessions + pending, key=lambda s: s["created_at"], reverse=True)
+    return merged[:limit]
+
+
+async def get_session_by_id(user_id: str, session_id: str) -> dict | None:
+    """A single session, served from the write-behind buffer if not yet flushed."""
+    if _queue is not None:
+        for sid, data in _queue.pending(user_id):
+            if sid == session_id:
+                return {**data, "id": sid}
+    return await call_backend("get_session_by_id", user_id, session_id)
+
+
+async def get_skill_gaps(user_id: str) -> dict | None:
+    aggregate = await call_backend("get_skill_gaps", user_id)
+    if aggregate is None:
+        return None
+    return _with_pending(user_id, aggregate)
+
+
+async def rebuild_skill_gaps(user_id: str) -> dict:
+    aggregate = await call_backend("rebuild_skill_gaps", user_id)
+    return _with_pending(user_id, aggregate)
+
+
+def _with_pending(user_id: str, aggregate: dict) -> dict:
+    """
+    Fold unflushed sessions into a skill-gap aggregate for display. The
+    stored aggregate picks them up through its increments when they flush.
+    """
+    if _queue is None:
+        return aggregate
+    pending = _queue.pending(user_id)
+    if not pending:
+        return aggregate
+
+    merged = {
+        **aggregate,
+        "missing": dict(aggregate.get("missing", {})),
+        "matched": dict(aggregate.get("matched", {})),
+        "session_count": aggregate.get("session_count", 0) + len(pending),
+    }
+    for _, data in pending:
+        scores = data.get("ats_scores", {})
+        for target, field in (("missing", "missing_keywords"), ("matched", "matched_keywords")):
+            for kw in scores.get(field, []):
+                merged[target][kw] = merged[target].get(kw, 0) + 1
+    return merged
@@ -0,0 +1,82 @@
+"""
+Single Flight Service — Coalesce identical in-flight work
+When a TPO shares a JD with a cohort, dozens of identical requests arrive
+within seconds, all before the first one could fill a cache. A flight lets
+the first caller for a key (the leader) do the work while every concurrent
+caller with the same key (followers) awaits the same result. It is one
+upstream call instead of one per request.
+
+The work runs in its own task, so a leader whose client disconnects does not
+cancel it for the followers. Every caller, leader included, gets its own deep
+copy of the result, since callers annotate results in place; the task keeps
+the untouched original to copy from. Flights with copy_results=False hand
+everyone the same object, which callers must treat as read-only. Flights are
+per worker process.
+"""
+
+import asyncio
+import copy
+from typing import Any, Awaitable, Callable
+
+from services.metrics import SINGLE_FLIGHT_CALLS
+
+
+class SingleFlight:
+    def __init__(self, name: str, copy_results: bool = True):
+        """
+        Args:
+            name: label for stats and metrics
+            copy_results: give each caller a deep copy (off for shared, read-only results)
+        """
+        self.name = name
+        self.copy_results = copy_results
+        self._inflight: dict[str, asyncio.Task] = {}
+        self.leaders = 0
+        self.followers = 0
+
+    async def do(self, key: str, work: Callable[[], Awaitable[Any]]) -> Any:
+        """Run work() for key, or join the run already in flight for it."""
+        task = self._inflight.get(key)
+        if task is not None:
+            self.followers += 1
+            SINGLE_FLIGHT_CALLS.labels(self.name, "follower").inc()
+        else:
+            self.leaders += 1
+            SINGLE_FLIGHT_CALLS.labels(self.name, "leader").inc()
+            task = asyncio.ensure_future(work())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._forget(key, task))
+        result = await asyncio.shield(task)
+        return copy.deepcopy(result) if self.copy_results else result
+
+    def stats(self) -> dict:
+        calls = self.leaders + self.followers
+        return {
+            "leaders": self.leaders,
+            "followers": self.followers,
+            "coalesced_ratio": round(self.followers / calls, 4) if calls else 0.0,
+            "in_flight": len(self._inflight),
+        }
+
+    def _forget(self, key: str, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Nobody may be left to await a failed run; retrieve the error so it is not logged as unhandled
+        if not task.cancelled():
+            task.exception()
+
+
+_flights: dict[str, SingleFlight] = {}
+
+
+def get_flight(name: str, copy_results: bool = True) -> SingleFlight:
+    """The process-wide flight for name, created on first use."""
+    flight = _flights.get(name)
+    if flight is None:
+        flight = _flights[name] = SingleFlight(name, copy_results)
+    return flight
+
+
+def stats() -> dict:
+    """Coalescing stats for every flight."""
+    return {name: flight.stats() for name, flight in _flights.items()}
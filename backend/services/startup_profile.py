@@ -0,0 +1,68 @@
+"""
+Startup Profile Service — Import-time breakdown of app startup
+Runs `python -X importtime -c "import main"` in a fresh interpreter and
+reports where the time goes, so a heavy import that creeps back into the
+startup path shows up before it reaches a cold start.
+
+Time is reported as self time summed per top-level package (first-party
+modules under routes/ and services/ are listed individually), so the rows
+add up to the total without double counting nested imports.
+
+Usage (from backend/):
+    python main.py --profile-imports [--top 20]
+"""
+
+import os
+import re
+import subprocess
+import sys
+from collections import Counter
+
+# "import time:       412 |        925 |   services.llm_client"
+_LINE_RE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+_FIRST_PARTY = ("routes", "services")
+
+
+def profile_imports(module: str = "main") -> tuple[float, Counter]:
+    """
+    Import module in a fresh interpreter and time its imports.
+
+    Args:
+        module: module to import
+
+    Returns:
+        (total seconds, Counter of seconds per package)
+    """
+    backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=backend_dir,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{proc.stderr[-2000:]}")
+
+    by_package: Counter = Counter()
+    total_us = 0
+    for line in proc.stderr.splitlines():
+        match = _LINE_RE.match(line)
+        if match is None:
+            continue
+        self_us, cumulative_us, indent, name = match.groups()
+        root = name.split(".")[0]
+        by_package[name if root in _FIRST_PARTY else root] += int(self_us) / 1e6
+        # Top-level imports are the ones indented by a single space
+        if len(indent) == 1:
+            total_us += int(cumulative_us)
+    return total_us / 1e6, by_package
+
+
+def print_import_profile(top: int = 20, module: str = "main") -> None:
+    """Print the slowest packages to import and the total."""
+    total, by_package = profile_imports(module)
+    print(f"{'package':<40}{'seconds':>10}{'share':>8}")
+    for name, seconds in by_package.most_common(top):
+        print(f"{name:<40}{seconds:>10.3f}{seconds / total:>8.1%}")
+    print(f"{'total (import ' + module + ')':<40}{total:>10.3f}")
@@ -0,0 +1,208 @@
+"""
+Tech Terms — Shared dictionary of technical skills and their aliases
+Used wherever the backend needs to know that a token is a technology
+(languages, frameworks, databases, cloud and tooling) rather than an ordinary
+word, and that "k8s" and "Kubernetes" are the same skill.
+"""
+
+from typing import Optional
+
+from services.ats_scorer import tokenize
+
+TECH_TERMS = {
+    # Languages
+    "python", "java", "javascript", "typescript", "c", "c++", "c#", "go", "rust",
+    "kotlin", "swift", "scala", "ruby", "php", "perl", "r", "matlab", "dart",
+    "sql", "pl/sql", "bash", "shell", "html", "css", "sass", "solidity", "verilog",
+    # Web / app frameworks
+    "react", "react native", "angular", "vue", "next.js", "nuxt", "svelte",
+    "node.js", "express", "django", "flask", "fastapi", "spring", "spring boot",
+    "hibernate", "laravel", "rails", "asp.net", ".net", "flutter", "android",
+    "ios", "jquery", "bootstrap", "tailwind", "redux", "graphql", "rest",
+    "rest apis", "grpc", "websockets", "microservices",
+    # Data / ML
+    "pandas", "numpy", "scipy", "scikit-learn", "tensorflow", "pytorch", "keras",
+    "opencv", "nltk", "spacy", "hugging face", "transformers", "llm", "langchain",
+    "machine learning", "deep learning", "computer vision",
+    "natural language processing", "nlp", "data science", "data analysis",
+    "data structures", "algorithms", "statistics", "power bi", "tableau", "excel",
+    "spark", "hadoop", "hive", "kafka", "airflow", "dbt", "etl", "matplotlib",
+    "seaborn",
+    # Databases
+    "mysql", "postgresql", "sqlite", "mongodb", "redis", "cassandra", "dynamodb",
+    "firebase", "firestore", "oracle", "sql server", "elasticsearch", "neo4j",
+    "supabase",
+    # Cloud / DevOps / tooling
+    "aws", "azure", "google cloud", "docker", "kubernetes", "terraform", "ansible",
+    "jenkins", "github actions", "ci/cd", "linux", "git", "github", "gitlab",
+    "nginx", "apache", "heroku", "vercel", "netlify", "lambda", "ec2", "s3",
+    "jira", "postman", "figma", "selenium", "jest", "pytest", "junit", "cypress",
+    "webpack", "vite", "unity", "arduino", "raspberry pi", "iot", "blockchain",
+}
+
+# Alias -> canonical term in TECH_TERMS
+ALIASES = {
+    "py": "python",
+    "js": "javascript",
+    "ts": "typescript",
+    "golang": "go",
+    "cpp": "c++",
+    "csharp": "c#",
+    "nodejs": "node.js",
+    "reactjs": "react",
+    "react.js": "react",
+    "vuejs": "vue",
+    "vue.js": "vue",
+    "angularjs": "angular",
+    "nextjs": "next.js",
+    "expressjs": "express",
+    "express.js": "express",
+    "springboot": "spring boot",
+    "postgres": "postgresql",
+    "mongo": "mongodb",
+    "k8s": "kubernetes",
+    "gcp": "google cloud",
+    "sklearn": "scikit-learn",
+    "tf": "tensorflow",
+    "ml": "machine learning",
+    "rest api": "rest apis",
+    "restful": "rest",
+    "restful apis": "rest apis",
+    "ci cd": "ci/cd",
+    "cicd": "ci/cd",
+    "amazon web services": "aws",
+    "ms excel": "excel",
+    "microsoft excel": "excel",
+    "powerbi": "power bi",
+}
+
+# Terms that are also everyday English words; only treated as technology
+# when written with a capital letter mid-sentence ("built in Go")
+AMBIGUOUS_TERMS = {
+    "go", "r", "c", "swift", "rust", "express", "spark", "shell", "rest",
+    "lambda", "unity", "spring", "excel", ".net",
+}
+
+
+def _phrase_key(text: str) -> tuple[str, ...]:
+    return tuple(tok for tok, _ in tokenize(text))
+
+
+# Token sequence -> canonical term, for every term and alias
+PHRASES: dict[tuple[str, ...], str] = {}
+for _term in TECH_TERMS:
+    PHRASES[_phrase_key(_term)] = _term
+for _alias, _term in ALIASES.items():
+    PHRASES[_phrase_key(_alias)] = _term
+
+# The same table as a token trie; a node's "" entry is the term ending there
+_END = ""
+_TRIE: dict = {}
+for _key, _term in PHRASES.items():
+    _node = _TRIE
+    for _tok in _key:
+        _node = _node.setdefault(_tok, {})
+    _node[_END] = _term
+
+# First token of every term; a token outside this set starts no term
+TERM_STARTS = frozenset(_TRIE)
+
+# Canonical term -> every spelling of it (the term itself first)
+_SPELLINGS: dict[str, list[str]] = {term: [term] for term in TECH_TERMS}
+for _alias, _term in ALIASES.items():
+    _SPELLINGS[_term].append(_alias)
+
+
+def canonical(term: str) -> str:
+    """Canonical name for a term or alias (lowercased input returned as-is if unknown)."""
+    return PHRASES.get(_phrase_key(term), term.lower())
+
+
+def variants(term: str) -> list[str]:
+    """Every spelling of a term: itself and its aliases ([term] if unknown)."""
+    return _SPELLINGS.get(term, [term])
+
+
+def longest_match(words: list[str], start: int) -> Optional[tuple[str, int]]:
+    """
+    The longest term starting at words[start], as (canonical term, end index),
+    or None. One trie step per token, so misses cost a single dict lookup.
+    """
+    node = _TRIE
+    match = None
+    for end in range(start, len(words)):
+        node = node.get(words[end])
+        if node is None:
+            break
+        if _END in node:
+            match = (node[_END], end + 1)
+    return match
+
+
+def find_terms(text: str, lenient: bool = False) -> list[tuple[str, int]]:
+    """
+    Every tech term in text as (canonical term, char offset), longest match
+    first at each position. Ambiguous everyday words only count when written
+    capitalized and not at the start of a sentence, unless lenient.
+    """
+    tokens = tokenize(text)
+    words = [tok for tok, _ in tokens]
+    found = []
+    i = 0
+    while i < len(words):
+        match = longest_match(words, i)
+        if match is None:
+            i += 1
+            continue
+        term, end = match
+        offset = tokens[i][1]
+        if (
+            end - i == 1
+            and term in AMBIGUOUS_TERMS
+            # Even lenient lookups skip letters split out of "R&D" or "I/O"
+            and (not lenient or _split_letter(text, offset))
+            and not looks_technical(text, offset)
+        ):
+            i += 1
+            continue
+        found.append((term, offset))
+        i = end
+    return found
+
+
+def looks_technical(text: str, offset: int) -> bool:
+    """Whether the capitalized word at offset reads as a name ("built in Go") rather than English."""
+    if not text[offset].isupper():
+        return False
+    if _split_letter(text, offset):
+        # "R&D", "A/B": a letter of an abbreviation, unless listed with
+        # another technology as in "C/C++" or "R/Python"
+        return _joined_to_term(text, offset)
+    before = text[:offset].rstrip()
+    # Sentence start (or bullet start): capitalization proves nothing
+    return bool(before) and before[-1] not in ".!?•-*:\n"
+
+
+# Characters that join letters into abbreviations ("R&D", "I/O", "A/B")
+_JOINERS = ("&", "/")
+
+
+def _split_letter(text: str, offset: int) -> bool:
+    """Whether the token at offset is a single letter joined to a neighbour by & or /."""
+    if text[offset + 1:offset + 2].isalnum():
+        return False
+    return text[offset + 1:offset + 2] in _JOINERS or text[offset - 1:offset] in _JOINERS
+
+
+def _joined_to_term(text: str, offset: int) -> bool:
+    """Whether a tech term sits directly across the & or / from the letter at offset."""
+    if text[offset + 1:offset + 2] in _JOINERS:
+        after = tokenize(text[offset + 2:offset + 40])
+        if after and after[0][1] == 0 and longest_match([after[0][0]], 0):
+            return True
+    if text[offset - 1:offset] in _JOINERS:
+        start = max(0, offset - 40)
+        before = tokenize(text[start:offset - 1])
+        if before and start + before[-1][1] + len(before[-1][0]) == offset - 1 and longest_match([before[-1][0]], 0):
+            return True
+    return False
@@ -0,0 +1,57 @@
+"""
+Warm-up Service — Pre-initialize heavy dependencies in the background
+openai, firebase_admin (with gRPC) and PyMuPDF are imported on first use, so
+a cold instance answers its health check and first requests without paying
+for them. With WARMUP_ON_STARTUP on, the app pays for them shortly after
+startup instead, off the event loop: the shared LLM client, the Firestore
+connection and the PDF worker pool are each set up in parallel. A step that
+fails is logged and left to happen on first use.
+"""
+
+import asyncio
+import importlib
+from time import perf_counter
+from typing import Awaitable, Callable
+
+from config import WARMUP_DELAY_SECONDS
+from services.llm_client import get_client
+from services.pdf_pool import warm_pool
+from services.session_store import warm_store
+
+
+async def _warm_llm_client() -> None:
+    # The import is the slow part; run it in a thread, then build the
+    # client on the loop so get_client() is never raced from two threads
+    await asyncio.to_thread(importlib.import_module, "openai")
+    get_client()
+
+
+async def _step(name: str, warm: Callable[[], Awaitable[None]]) -> bool:
+    started = perf_counter()
+    try:
+        await warm()
+    except Exception as e:
+        print(f"[Warmup] {name} failed, will initialize on first use: {e}")
+        return False
+    print(f"[Warmup] {name} ready in {perf_counter() - started:.2f}s")
+    return True
+
+
+async def warm_up(delay: float = WARMUP_DELAY_SECONDS) -> dict[str, bool]:
+    """
+    Initialize the LLM client, the session store and the PDF pool.
+
+    Args:
+        delay: seconds to wait first, so the app is serving before imports compete for the GIL
+
+    Returns:
+        {step: succeeded}
+    """
+    await asyncio.sleep(delay)
+    steps = {
+        "llm_client": _warm_llm_client,
+        "session_store": warm_store,
+        "pdf_pool": warm_pool,
+    }
+    results = await asyncio.gather(*(_step(name, warm) for name, warm in steps.items()))
+    return dict(zip(steps, results))
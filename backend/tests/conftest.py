@@ -0,0 +1,12 @@
+"""
+Shared test setup. Config is read from the environment at import time, so
+the in-memory backends are selected here, before any app module is imported.
+"""
+
+import os
+
+os.environ.setdefault("SESSION_STORE_BACKEND", "memory")
+os.environ.setdefault("WRITE_BEHIND_ENABLED", "false")
+os.environ.setdefault("LLM_CACHE_DB_PATH", "")
+os.environ.setdefault("RESUME_CACHE_DB_PATH", "")
+os.environ.setdefault("WARMUP_ON_STARTUP", "false")
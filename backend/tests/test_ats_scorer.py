@@ -0,0 +1,42 @@
+from services.ats_scorer import KeywordMatcher, calculate_ats_score, calculate_ats_scores_batch, tokenize
+
+
+def test_tokenize_keeps_tech_punctuation():
+    assert [tok for tok, _ in tokenize("C++, C#, Node.js and CI-CD.")] == ["c++", "c#", "node.js", "and", "ci-cd"]
+
+
+def test_tokenize_reports_offsets():
+    assert tokenize("Go  Rust") == [("go", 0), ("rust", 4)]
+
+
+def test_matches_whole_tokens_only():
+    hits = KeywordMatcher(["java", "go", "r"]).scan("JavaScript at Google and React")
+    assert hits == {}
+
+
+def test_matches_phrases():
+    hits = KeywordMatcher(["machine learning", "learning"]).scan("Machine learning models; learning fast")
+    assert hits == {"machine learning": [0], "learning": [8, 25]}
+
+
+def test_score_counts_matches_in_bullets():
+    result = calculate_ats_score("Python", ["python", "sql"], suggested_bullets=["Wrote SQL reports"])
+    assert result["before_score"] == 50
+    assert result["after_score"] == 100
+
+
+def test_batch_matches_single_scoring():
+    resume = "Python, Docker and PostgreSQL"
+    keyword_lists = [["python", "kafka"], ["docker", "postgresql", "go"]]
+    batch = calculate_ats_scores_batch(resume, keyword_lists)
+    assert batch == [calculate_ats_score(resume, keywords) for keywords in keyword_lists]
+
+
+def test_matches_aliases():
+    hits = KeywordMatcher(["machine learning", "node.js"]).scan("Built nodejs APIs; machine learning models")
+    assert set(hits) == {"machine learning", "node.js"}
+
+
+def test_weighted_score():
+    result = calculate_ats_score("Python and SQL", ["python", "kafka"], keyword_weights=[1.0, 0.25])
+    assert result["before_score"] == 80
@@ -0,0 +1,64 @@
+import json
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+
+import fitz
+import pytest
+
+from services import bulk_ingest
+
+
+def _pdf(text: str) -> bytes:
+    doc = fitz.open()
+    doc.new_page().insert_text((72, 72), text)
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+@pytest.fixture
+def pool():
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        yield pool
+
+
+def test_directory_ingest_writes_one_record_per_pdf(tmp_path, pool):
+    cohort = tmp_path / "cohort"
+    (cohort / "b").mkdir(parents=True)
+    (cohort / "alice.pdf").write_bytes(_pdf("Alice\nSkills\nPython"))
+    (cohort / "b" / "bob.PDF").write_bytes(_pdf("Bob\nEducation\nB.Sc"))
+    (cohort / "broken.pdf").write_bytes(b"not a pdf")
+    (cohort / "notes.txt").write_text("ignored")
+    output = tmp_path / "out.jsonl"
+    progress = []
+
+    report = bulk_ingest.ingest(
+        str(cohort), str(output), workers=2, executor=pool, on_progress=lambda done, total: progress.append(done)
+    )
+
+    assert (report["total"], report["succeeded"], report["failed"]) == (3, 2, 1)
+    assert report["failures"][0]["file"] == "broken.pdf"
+    assert sorted(progress) == [1, 2, 3]
+    records = {r["file"]: r for r in map(json.loads, output.read_text().splitlines())}
+    assert set(records) == {"alice.pdf", "b/bob.PDF", "broken.pdf"}
+    assert "Alice" in records["alice.pdf"]["parsed_resume"]["raw_text"]
+    assert len(records["alice.pdf"]["sha256"]) == 64
+
+
+def test_oversized_archive_members_are_not_inflated(tmp_path, pool, monkeypatch):
+    monkeypatch.setattr(bulk_ingest, "MAX_FILE_SIZE_MB", 0)
+    archive = tmp_path / "cohort.zip"
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr("alice.pdf", _pdf("Alice"))
+        zf.writestr("docs/", "")
+
+    report = bulk_ingest.ingest(str(archive), str(tmp_path / "out.jsonl"), workers=1, executor=pool)
+    assert report["total"] == 1
+    assert "size exceeds" in report["failures"][0]["error"]
+
+
+def test_sources_must_be_a_zip_or_directory(tmp_path):
+    path = tmp_path / "resume.pdf"
+    path.write_bytes(_pdf("Alice"))
+    with pytest.raises(ValueError):
+        bulk_ingest.list_sources(str(path))
@@ -0,0 +1,58 @@
+import io
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+
+import fitz
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from routes import bulk
+
+
+def _pdf(text: str) -> bytes:
+    doc = fitz.open()
+    doc.new_page().insert_text((72, 72), text)
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    pool = ThreadPoolExecutor(max_workers=2)
+    monkeypatch.setattr(bulk, "BULK_INGEST_DIR", str(tmp_path))
+    monkeypatch.setattr(bulk, "get_job_pool", lambda: pool)
+    app = FastAPI()
+    app.include_router(bulk.router, prefix="/api")
+    with TestClient(app) as client:
+        yield client
+    pool.shutdown()
+
+
+def _wait(client, job_id):
+    for _ in range(100):
+        job = client.get(f"/api/bulk/ingest/{job_id}").json()["job"]
+        if job["status"] in ("completed", "failed"):
+            return job
+        time.sleep(0.05)
+    raise AssertionError(f"job still {job['status']}")
+
+
+def test_job_report_hides_server_paths(client, tmp_path):
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr("alice.pdf", _pdf("Alice\nSkills: Python"))
+        zf.writestr("broken.pdf", b"not a pdf")
+    response = client.post("/api/bulk/ingest", files={"file": ("cohort.zip", archive.getvalue())})
+    job_id = response.json()["job_id"]
+
+    job = _wait(client, job_id)
+    assert job["status"] == "completed"
+    assert (job["report"]["succeeded"], job["report"]["failed"]) == (1, 1)
+    assert str(tmp_path) not in str(job)
+
+    results = client.get(f"/api/bulk/ingest/{job_id}/results")
+    assert results.status_code == 200
+    assert len(results.text.splitlines()) == 2
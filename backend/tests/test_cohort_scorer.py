@@ -0,0 +1,46 @@
+import numpy as np
+
+from services.ats_scorer import calculate_ats_score
+from services.cohort_scorer import CohortScores, score_cohort
+from services.keyword_extractor import extract_weighted_keywords
+
+RESUMES = [
+    ("s1", "Python, Django and PostgreSQL. Built REST APIs."),
+    ("s2", "React, TypeScript and Node.js front ends."),
+    ("s3", "Excel and PowerPoint."),
+]
+JDS = [
+    ("backend", "Requirements\n- Python\n- Django\n- PostgreSQL\n\nNice to have\n- Docker"),
+    ("frontend", "Requirements\n- React\n- TypeScript\n- Node.js"),
+]
+
+
+def test_matches_single_scoring():
+    cohort = score_cohort(RESUMES, JDS)
+    for i, (_, resume) in enumerate(RESUMES):
+        for j, (_, jd) in enumerate(JDS):
+            weighted = extract_weighted_keywords(jd)
+            expected = calculate_ats_score(
+                resume, [kw for kw, _ in weighted], keyword_weights=[w for _, w in weighted]
+            )["before_score"]
+            assert cohort.scores[i, j] == expected
+
+
+def test_top_k_and_readiness():
+    cohort = CohortScores(["a", "b"], ["x", "y", "z"], np.array([[10, 90, 50], [70, 20, 70]], dtype=np.int16))
+    assert cohort.top_k(2) == {
+        "a": [{"jd_id": "y", "score": 90}, {"jd_id": "z", "score": 50}],
+        "b": [{"jd_id": "x", "score": 70}, {"jd_id": "z", "score": 70}],
+    }
+    assert cohort.top_k(0) == {"a": [], "b": []}
+    assert cohort.jd_readiness(60) == [
+        {"jd_id": "x", "mean_score": 40.0, "ready_share": 0.5},
+        {"jd_id": "y", "mean_score": 55.0, "ready_share": 0.5},
+        {"jd_id": "z", "mean_score": 60.0, "ready_share": 0.5},
+    ]
+
+
+def test_empty_cohort():
+    cohort = score_cohort([], JDS)
+    assert cohort.scores.shape == (0, 2)
+    assert cohort.jd_readiness(60)[0]["mean_score"] == 0.0
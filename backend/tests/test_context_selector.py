@@ -0,0 +1,46 @@
+from services.context_selector import ContextSelector, count_tokens
+
+SECTIONS = {
+    "Skills": "Python, Django, PostgreSQL\nPhotoshop, Illustrator",
+    "Experience": (
+        "• Built Django REST APIs backed by PostgreSQL\n"
+        "• Designed posters and brand assets\n"
+        "  for the college fest\n"
+        "• Organised a charity marathon"
+    ),
+    "Hobbies": "Chess, hiking, cooking",
+}
+BASELINE = "\n".join(f"{h}\n{c}" for h, c in SECTIONS.items())
+
+
+def test_count_tokens():
+    assert count_tokens("") == 0
+    assert count_tokens("Built APIs.") == 3
+    assert count_tokens("internationalization") == 4
+
+
+def test_small_resume_is_sent_whole():
+    context, stats = ContextSelector(SECTIONS, BASELINE).select(["django"], budget=10_000)
+    assert context == BASELINE
+    assert not stats["compacted"]
+
+
+def test_budget_keeps_the_most_relevant_lines_in_order():
+    context, stats = ContextSelector(SECTIONS, BASELINE).select(["django", "postgresql", "rest"], budget=30)
+    assert "Built Django REST APIs backed by PostgreSQL" in context
+    assert "Chess" not in context
+    assert "marathon" not in context
+    assert context.index("### Skills") < context.index("### Experience")
+    assert stats["compacted"]
+    assert stats["context_tokens"] <= 30
+    assert stats["saved_tokens"] == stats["original_tokens"] - stats["context_tokens"]
+
+
+def test_wrapped_lines_stay_with_their_bullet():
+    context, _ = ContextSelector(SECTIONS, BASELINE).select(["posters"], budget=25)
+    assert "Designed posters and brand assets for the college fest" in context
+
+
+def test_zero_budget_turns_compaction_off():
+    context, _ = ContextSelector(SECTIONS, BASELINE).select(["django"], budget=0)
+    assert context == BASELINE
@@ -0,0 +1,122 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from firebase_admin import firestore as fs
+
+from routes import history
+from services import jd_store
+from services.firestore import _skill_gap_increments
+from services.session_store import get_backend
+
+
+@pytest.fixture
+def client():
+    jd_store.clear_cache()
+    app = FastAPI()
+    app.include_router(history.router, prefix="/api")
+    return TestClient(app)
+
+
+def _save(client, user_id, jd_text):
+    response = client.post("/api/history", json={
+        "user_id": user_id,
+        "jd_text": jd_text,
+        "bullets": [],
+        "jd_keywords": ["python", "sql"],
+    })
+    assert response.status_code == 200
+    session_id = response.json()["session_id"]
+    return get_backend().get_session_by_id(user_id, session_id)
+
+
+def test_session_references_stored_jd(client):
+    jd_text = "Data analyst: Python and SQL reporting"
+    session = _save(client, "history-stored", jd_text)
+    assert session["jd_hash"] == jd_store.jd_hash(jd_text)
+    assert "jd_text" not in session
+    assert session["jd_keywords"] == ["python", "sql"]
+    assert get_backend().get_jd(session["jd_hash"])["text"] == jd_text
+
+
+def test_session_keeps_text_when_jd_write_fails(client, monkeypatch):
+    def save_jd(jd_hash, record):
+        raise RuntimeError("store down")
+
+    monkeypatch.setattr(get_backend(), "save_jd", save_jd)
+    jd_text = "Backend engineer: Python services and SQL tuning"
+    session = _save(client, "history-unstored", jd_text)
+    assert "jd_hash" not in session
+    assert session["jd_text"] == jd_text
+    assert session["jd_keywords"] == ["python", "sql"]
+
+
+def _save_scores(client, user_id, missing, matched):
+    response = client.post("/api/history", json={
+        "user_id": user_id,
+        "jd_text": "",
+        "bullets": [],
+        "ats_scores": {"missing_keywords": missing, "matched_keywords": matched},
+    })
+    assert response.status_code == 200
+
+
+def test_skill_gaps_count_across_sessions(client):
+    _save_scores(client, "gaps", ["docker", "kafka"], ["python"])
+    _save_scores(client, "gaps", ["docker"], ["kafka"])
+    _save_scores(client, "gaps", ["docker", "aws"], [])
+
+    body = client.get("/api/skill-gaps/gaps").json()
+    assert body["session_count"] == 3
+    assert body["skill_gaps"][0] == {
+        "keyword": "docker", "missing_count": 3, "matched_count": 0, "missing_share": 1.0,
+    }
+    kafka = next(gap for gap in body["skill_gaps"] if gap["keyword"] == "kafka")
+    assert (kafka["missing_count"], kafka["matched_count"]) == (1, 1)
+    # The incremental aggregate agrees with a rebuild from history
+    rebuilt = client.get("/api/skill-gaps/gaps", params={"rebuild": "true"}).json()
+    assert sorted(rebuilt["skill_gaps"], key=str) == sorted(body["skill_gaps"], key=str)
+
+
+def test_skill_gap_increments_skip_empty_maps():
+    payload = _skill_gap_increments([{"missing_keywords": ["docker"]}, {"missing_keywords": ["docker"]}])
+    assert isinstance(payload["missing"]["docker"], fs.Increment)
+    assert isinstance(payload["session_count"], fs.Increment)
+    # An empty map would overwrite the stored matched counters under merge=True
+    assert "matched" not in payload
+
+
+def test_history_pages_follow_the_cursor(client):
+    for i in range(5):
+        _save_scores(client, "pages", [f"kw{i}"], [])
+
+    seen, cursor = [], None
+    for _ in range(3):
+        params = {"user_id": "pages", "limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        body = client.get("/api/history", params=params).json()
+        seen.extend(body["sessions"])
+        cursor = body["next_cursor"]
+    assert cursor is None
+    assert len({s["id"] for s in seen}) == 5
+    created = [s["created_at"] for s in seen]
+    assert created == sorted(created, reverse=True)
+
+
+def test_summary_listing_drops_heavy_fields(client):
+    response = client.post("/api/history", json={
+        "user_id": "summary",
+        "jd_text": "",
+        "bullets": [{"original": "a", "rewritten": "b"}],
+        "ats_scores": {"before_score": 40, "after_score": 70, "missing_keywords": ["docker"]},
+    })
+    session_id = response.json()["session_id"]
+    body = client.get("/api/history", params={"user_id": "summary", "summary": "true"}).json()
+    assert body["sessions"] == [{
+        "id": session_id,
+        "jd_snippet": "",
+        "created_at": body["sessions"][0]["created_at"],
+        "ats_scores": {"before_score": 40, "after_score": 70},
+        "bullet_count": 1,
+        "keyword_count": 0,
+    }]
@@ -0,0 +1,44 @@
+from services.honesty_verifier import ResumeIndex, check_bullets, describe_failure, verify_bullet
+
+RESUME = "Built REST APIs in Python and Flask serving 300 users. Cut load time by 40%. Data analysis in Excel."
+
+
+def test_supported_bullet_passes():
+    check = verify_bullet("Built Flask REST APIs in Python for 300 users", ResumeIndex(RESUME))
+    assert check["passed"]
+
+
+def test_invented_term_and_metric_fail():
+    check = verify_bullet("Built Django APIs for 5000 users", ResumeIndex(RESUME))
+    assert not check["passed"]
+    assert check["unsupported_terms"] == ["django"]
+    assert check["unsupported_metrics"] == ["5000"]
+    assert describe_failure(check) == "mentions django and claims figures 5000 not found in your resume"
+
+
+def test_terms_whose_words_all_appear_are_supported():
+    assert verify_bullet("Performed data analysis", ResumeIndex(RESUME))["passed"]
+
+
+def test_source_text_counts_as_evidence():
+    index = ResumeIndex(RESUME)
+    assert not verify_bullet("Deployed with Docker", index)["passed"]
+    assert verify_bullet("Deployed with Docker", index, "Deployed the app using Docker")["passed"]
+
+
+def test_check_bullets_annotates_and_returns_passing_text():
+    bullets = [
+        {"original": "Built APIs", "rewritten": "Built Python REST APIs"},
+        {"original": "Built APIs", "rewritten": "Built Kubernetes operators"},
+    ]
+    assert check_bullets(bullets, RESUME) == ["Built Python REST APIs"]
+    assert bullets[0]["honesty"]["passed"]
+    assert not bullets[1]["honesty"]["passed"]
+
+
+def test_letters_of_abbreviations_are_not_terms():
+    index = ResumeIndex("Led a team of engineers running A/B tests")
+    check = verify_bullet("Led a team of R&D engineers running A/B tests", index)
+    assert check["passed"], check
+    # Listed with another language, R is still the language
+    assert verify_bullet("Wrote R/Python scripts", index)["unsupported_terms"] == ["r", "python"]
@@ -0,0 +1,105 @@
+import asyncio
+
+import pytest
+
+from services import jd_store
+from services.session_store import get_backend
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    jd_store.clear_cache()
+
+
+def test_hash_ignores_whitespace():
+    assert jd_store.jd_hash("Python  developer\n\nSQL") == jd_store.jd_hash(" Python developer SQL ")
+    assert jd_store.jd_hash("Python developer") != jd_store.jd_hash("Java developer")
+
+
+def test_concurrent_lookups_share_one_extraction(monkeypatch):
+    calls = []
+
+    def extract(jd_text):
+        calls.append(jd_text)
+        return [("python", 1.0), ("sql", 0.5)]
+
+    monkeypatch.setattr(jd_store, "extract_weighted_keywords", extract)
+
+    async def run():
+        records = await asyncio.gather(*(jd_store.get_jd("Concurrent JD: Python, SQL") for _ in range(5)))
+        await jd_store.wait_persisted(records[0]["hash"])
+        return records
+
+    records = asyncio.run(run())
+    assert len(calls) == 1
+    assert all(r is records[0] for r in records)
+    assert records[0]["keywords"] == ["python", "sql"]
+    assert records[0]["keyword_weights"] == [1.0, 0.5]
+    assert get_backend().get_jd(records[0]["hash"])["keywords"] == ["python", "sql"]
+
+
+def test_wait_persisted_retries_a_failed_write(monkeypatch):
+    backend = get_backend()
+    save_jd = backend.save_jd
+    failures = []
+
+    def flaky_save_jd(jd_hash, record):
+        if len(failures) < 1:
+            failures.append(jd_hash)
+            raise RuntimeError("store down")
+        save_jd(jd_hash, record)
+
+    monkeypatch.setattr(backend, "save_jd", flaky_save_jd)
+
+    async def run():
+        record = await jd_store.get_jd("Retry JD: Go and Kubernetes")
+        # Let the background write fail first
+        await asyncio.gather(jd_store._pending[record["hash"]], return_exceptions=True)
+        await jd_store.wait_persisted(record["hash"])
+        return record
+
+    record = asyncio.run(run())
+    assert failures == [record["hash"]]
+    assert backend.get_jd(record["hash"])["text"] == "Retry JD: Go and Kubernetes"
+
+
+def test_wait_persisted_raises_when_the_write_keeps_failing(monkeypatch):
+    def save_jd(jd_hash, record):
+        raise RuntimeError("store down")
+
+    monkeypatch.setattr(get_backend(), "save_jd", save_jd)
+
+    async def run():
+        record = await jd_store.get_jd("Failing JD: Rust and WebAssembly")
+        await jd_store.wait_persisted(record["hash"])
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(run())
+
+
+def test_stale_keywords_are_recomputed_keeping_the_stored_text():
+    text = "Stale JD: Python and Docker"
+    key = jd_store.jd_hash(text)
+    get_backend().save_jd(key, {"text": "original text", "keywords": ["old"], "keywords_version": 0})
+
+    async def run():
+        await jd_store.get_jd(text)
+        await jd_store.wait_persisted(key)
+
+    asyncio.run(run())
+    stored = get_backend().get_jd(key)
+    assert stored["text"] == "original text"
+    assert stored["keywords_version"] == jd_store.KEYWORDS_VERSION
+    assert "docker" in stored["keywords"]
+
+
+def test_hydrate_session_fills_in_the_jd_text():
+    text = "Hydrate JD: Java and Spring"
+    key = jd_store.jd_hash(text)
+    get_backend().save_jd(key, {"text": text, "keywords": ["java", "spring"]})
+
+    session = asyncio.run(jd_store.hydrate_session({"jd_hash": key, "jd_snippet": text[:5]}))
+    assert (session["jd_text"], session["jd_keywords"]) == (text, ["java", "spring"])
+    # Sessions keep the keywords they were scored against
+    session = asyncio.run(jd_store.hydrate_session({"jd_hash": key, "jd_keywords": ["java"]}))
+    assert session["jd_keywords"] == ["java"]
@@ -0,0 +1,40 @@
+import json
+
+from services.json_stream import IncrementalJSONParser
+
+
+def _feed_all(text: str, chunk_size: int) -> list:
+    parser = IncrementalJSONParser()
+    events = []
+    for i in range(0, len(text), chunk_size):
+        events.extend(parser.feed(text[i:i + chunk_size]))
+    return events
+
+
+def test_incremental_parser_emits_items_and_fields():
+    doc = {"bullets": [{"a": 1}, {"a": "x}y"}], "score": 7, "note": "ok", "flag": True}
+    text = "```json\n" + json.dumps(doc) + "\n```"
+    expected = [
+        ("item", "bullets", {"a": 1}),
+        ("item", "bullets", {"a": "x}y"}),
+        ("field", "bullets", doc["bullets"]),
+        ("field", "score", 7),
+        ("field", "note", "ok"),
+        ("field", "flag", True),
+    ]
+    # Same events whatever the chunking
+    for size in (1, 3, len(text)):
+        assert _feed_all(text, size) == expected
+
+
+def test_incremental_parser_item_arrives_before_the_rest():
+    parser = IncrementalJSONParser()
+    assert parser.feed('{"bullets": [{"a": 1}') == [("item", "bullets", {"a": 1})]
+    assert parser.feed(', {"a": 2') == []
+    assert parser.feed("}]}") == [("item", "bullets", {"a": 2}), ("field", "bullets", [{"a": 1}, {"a": 2}])]
+    assert parser.done
+
+
+def test_incremental_parser_handles_escaped_quotes():
+    events = _feed_all('{"text": "say \\"hi\\" {not a brace}"}', 2)
+    assert events == [("field", "text", 'say "hi" {not a brace}')]
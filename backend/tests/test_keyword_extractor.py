@@ -0,0 +1,71 @@
+import pytest
+
+from services.keyword_extractor import _heading, extract_jd_keywords, extract_weighted_keywords
+
+
+@pytest.mark.parametrize("line, weight", [
+    ("Requirements", 3.0),
+    ("## Requirements:", 3.0),
+    ("Must have: Python, SQL", 3.0),
+    ("Key Responsibilities", 2.0),
+    ("What you'll do", 2.0),
+    ("Nice to have", 1.5),
+    ("Bonus points:", 1.5),
+    ("About Us", 0.25),
+    ("Benefits", 0.25),
+])
+def test_headings(line, weight):
+    assert _heading(line)[0] == weight
+
+
+@pytest.mark.parametrize("line", [
+    "About 5 years of Python",
+    "Benefits of working with Kafka",
+    "Life at scale with Kubernetes",
+    "Plus experience with Docker",
+    "Bonus points for Rust",
+    "Required to travel occasionally",
+    "Skills in Java and Go",
+])
+def test_body_lines_starting_with_a_section_word_are_not_headings(line):
+    assert _heading(line) == (None, line)
+
+
+def test_text_after_a_heading_colon_belongs_to_the_section():
+    assert _heading("Must have: Python, SQL")[1] == " Python, SQL"
+
+
+def test_multi_word_skills_are_kept_whole_and_aliases_folded():
+    keywords = extract_jd_keywords(
+        "Requirements\n- Machine learning with Python\n- Node.js or nodejs services\n- Spring Boot"
+    )
+    assert "machine learning" in keywords
+    assert "spring boot" in keywords
+    assert keywords.count("node.js") == 1
+    assert "machine" not in keywords
+
+
+def test_numeric_tokens_are_not_keywords():
+    keywords = extract_jd_keywords("Requirements\n- 2+ years of Python serving 10k users")
+    assert "2+" not in keywords
+    assert "10k" not in keywords
+    assert "python" in keywords
+
+
+def test_section_weights_order_keywords():
+    weighted = dict(extract_weighted_keywords(
+        "About us\nWe love Kafka.\n\nRequirements\n- Python\n\nNice to have\n- Docker"
+    ))
+    assert weighted["python"] == 1.0
+    assert weighted["python"] > weighted["docker"] > weighted["kafka"]
+
+
+def test_body_line_does_not_down_weight_what_follows():
+    weighted = dict(extract_weighted_keywords(
+        "Requirements\nAbout 5 years of backend work\n- Python\n- Kubernetes"
+    ))
+    assert weighted["python"] == weighted["kubernetes"] == 1.0
+
+
+def test_empty_jd():
+    assert extract_weighted_keywords("") == []
@@ -0,0 +1,55 @@
+import asyncio
+import time
+
+from services import llm_client
+from services.llm_cache import LLMCache, MemoryTier, SQLiteTier, make_key
+
+
+def test_key_covers_every_input():
+    base = make_key("system", "user", "model", 0.2, 100)
+    assert base == make_key("system", "user", "model", 0.2, 100)
+    assert len({base, make_key("system", "user", "model", 0.3, 100), make_key("system", "user", "model", 0.2, 200)}) == 3
+
+
+def test_memory_tier_evicts_least_recently_used():
+    tier = MemoryTier(max_entries=2, ttl_seconds=60)
+    tier.set("a", "1")
+    tier.set("b", "2")
+    tier.get("a")
+    tier.set("c", "3")
+    assert (tier.get("a"), tier.get("b"), tier.get("c")) == ("1", None, "3")
+
+
+def test_memory_tier_expires_entries(monkeypatch):
+    tier = MemoryTier(max_entries=2, ttl_seconds=60)
+    tier.set("a", "1")
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 61)
+    assert tier.get("a") is None
+    assert len(tier) == 0
+
+
+def test_disk_hits_are_promoted_to_memory(tmp_path):
+    path = str(tmp_path / "cache.db")
+    SQLiteTier(path, max_entries=10, ttl_seconds=60).set("k", "value")
+
+    # A fresh process: empty memory, same disk
+    cache = LLMCache(MemoryTier(10, 60), SQLiteTier(path, max_entries=10, ttl_seconds=60))
+    assert asyncio.run(cache.aget("k")) == "value"
+    assert cache.memory.get("k") == "value"
+    assert asyncio.run(cache.aget("missing")) is None
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+
+def test_disk_tier_prunes_to_its_cap(tmp_path):
+    tier = SQLiteTier(str(tmp_path / "cache.db"), max_entries=5, ttl_seconds=60)
+    tier.PRUNE_EVERY = 10
+    for i in range(10):
+        tier.set(str(i), "v")
+    assert [tier.get(str(i)) for i in range(10)].count(None) == 5
+
+
+def test_only_valid_json_is_cached():
+    assert llm_client._is_storable('{"a": 1}', json_mode=True)
+    assert not llm_client._is_storable('{"a": ', json_mode=True)
+    assert not llm_client._is_storable("", json_mode=False)
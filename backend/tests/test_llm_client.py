@@ -0,0 +1,75 @@
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from openai import APIConnectionError, BadRequestError
+
+from config import LLM_MAX_RETRIES, LLM_RETRY_BASE_DELAY
+from services import llm_client
+
+REQUEST = httpx.Request("POST", "https://api.groq.test/v1/chat/completions")
+
+
+class FakeCompletions:
+    """Replays outcomes in order: an exception is raised, a string is returned as content."""
+
+    def __init__(self, outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+        self.with_raw_response = self
+
+    async def create(self, **kwargs):
+        self.calls += 1
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        response = SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=outcome))],
+            usage=SimpleNamespace(prompt_tokens=10, completion_tokens=5),
+        )
+        return SimpleNamespace(headers={}, parse=lambda: response)
+
+
+@pytest.fixture
+def completions(monkeypatch):
+    def install(outcomes):
+        fake = FakeCompletions(outcomes)
+        monkeypatch.setattr(llm_client, "_client", SimpleNamespace(chat=SimpleNamespace(completions=fake)))
+        return fake
+
+    monkeypatch.setattr(llm_client, "get_limiter", lambda: None)
+    monkeypatch.setattr(llm_client, "_backoff_delay", lambda attempt: 0)
+    return install
+
+
+def _complete():
+    return asyncio.run(llm_client.chat_completion("system", "user", 0.2, 100, use_cache=False))
+
+
+def test_transient_errors_are_retried(completions):
+    fake = completions([APIConnectionError(request=REQUEST), APIConnectionError(request=REQUEST), '{"ok": 1}'])
+    assert _complete() == '{"ok": 1}'
+    assert fake.calls == 3
+
+
+def test_retries_are_capped(completions):
+    fake = completions([APIConnectionError(request=REQUEST)] * (LLM_MAX_RETRIES + 1))
+    with pytest.raises(APIConnectionError):
+        _complete()
+    assert fake.calls == LLM_MAX_RETRIES + 1
+
+
+def test_bad_requests_fail_fast(completions):
+    error = BadRequestError("bad", response=httpx.Response(400, request=REQUEST), body=None)
+    fake = completions([error, '{"ok": 1}'])
+    with pytest.raises(BadRequestError):
+        _complete()
+    assert fake.calls == 1
+
+
+def test_backoff_grows_with_full_jitter():
+    for attempt in range(4):
+        delays = [llm_client._backoff_delay(attempt) for _ in range(50)]
+        assert all(0 <= d <= LLM_RETRY_BASE_DELAY * 2 ** attempt for d in delays)
+
@@ -0,0 +1,53 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+
+from services.metrics import MetricsMiddleware, record_span, render, span
+
+
+def _client():
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get("/items/{item_id}")
+    async def item(item_id: str):
+        with span("lookup"):
+            pass
+        record_span("score", 0.002)
+        record_span("score", 0.003)
+        return {"id": item_id}
+
+    @app.get("/plain")
+    async def plain():
+        return {}
+
+    return TestClient(app)
+
+
+def _count(route):
+    labels = {"method": "GET", "route": route, "status": "200"}
+    return REGISTRY.get_sample_value("syrus_http_request_seconds_count", labels) or 0
+
+
+def test_spans_are_reported_in_server_timing():
+    response = _client().get("/items/42")
+    parts = dict(part.split(";dur=") for part in response.headers["server-timing"].split(", "))
+    assert set(parts) == {"lookup", "score"}
+    # Repeated stages are summed
+    assert float(parts["score"]) == 5.0
+
+
+def test_requests_are_timed_by_route_template():
+    before = _count("/items/{item_id}")
+    client = _client()
+    client.get("/items/1")
+    client.get("/items/2")
+    assert _count("/items/{item_id}") == before + 2
+    assert "server-timing" not in client.get("/plain").headers
+
+
+def test_spans_outside_a_request_are_ignored():
+    record_span("background", 1.0)
+    body, content_type = render()
+    assert b"syrus_http_request_seconds" in body
+    assert content_type.startswith("text/plain")
@@ -0,0 +1,91 @@
+import fitz
+import pytest
+
+from services.pdf_parser import _extract_sections, _match_heading, extract_text_from_pdf
+
+RESUME_TEXT = """Jane Doe
+jane@example.com
+
+EDUCATION
+B.Tech Computer Science, 2024
+
+Work Experience
+Built an experience tracking dashboard for the skills team
+
+Technical Skills
+Python, SQL"""
+
+
+def test_sections_are_split_on_headings():
+    assert _extract_sections(RESUME_TEXT) == {
+        "Header": "Jane Doe\njane@example.com",
+        "Education": "B.Tech Computer Science, 2024",
+        "Experience": "Built an experience tracking dashboard for the skills team",
+        "Skills": "Python, SQL",
+    }
+
+
+def test_heading_names_are_normalized():
+    assert _match_heading("  PROFESSIONAL EXPERIENCE ") == "Experience"
+    assert _match_heading("Certificates") == "Certifications"
+    assert _match_heading("Honors & Awards") == "Achievements"
+    # Earlier headings in the priority list win
+    assert _match_heading("Projects and Experience") == "Experience"
+
+
+def test_body_lines_are_not_headings():
+    assert _match_heading("") is None
+    assert _match_heading("Python, SQL") is None
+    assert _match_heading("Led education outreach for five local schools") is None
+
+
+def _pdf(lines) -> bytes:
+    """One page; lines are (x, y, text, font size, font name)."""
+    doc = fitz.open()
+    page = doc.new_page()
+    for x, y, text, size, font in lines:
+        page.insert_text((x, y), text, fontsize=size, fontname=font)
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+def test_layout_mode_finds_headings_by_typography():
+    pdf = _pdf([
+        (50, 60, "Jane Doe", 18, "hebo"),
+        (50, 90, "jane@example.com", 10, "helv"),
+        # Bold heading with the body on the same line
+        (50, 120, "Skills:", 10, "hebo"),
+        (90, 120, "Python, SQL", 10, "helv"),
+        # Not a known section name, but clearly larger
+        (50, 150, "Publications", 14, "helv"),
+        (50, 170, "A paper on parsing resumes", 10, "helv"),
+    ])
+    parsed = extract_text_from_pdf(pdf, mode="layout")
+    assert parsed["extraction_mode"] == "layout"
+    assert parsed["sections"] == {
+        "Header": "Jane Doe\njane@example.com",
+        "Skills": "Python, SQL",
+        "Publications": "A paper on parsing resumes",
+    }
+
+
+def test_layout_mode_reads_two_columns_one_at_a_time():
+    rows = [
+        ("EDUCATION", "SKILLS"),
+        ("B.Tech Computer Science", "Python and SQL"),
+        ("IIT Madras, 2024", "Docker and Kubernetes"),
+        ("GPA 9.1 out of 10", "React and Node.js"),
+    ]
+    lines = [(50, 60, "Jane Doe, Software Engineer, Bengaluru, India", 10, "helv")]
+    for i, (left, right) in enumerate(rows):
+        lines += [(50, 100 + 20 * i, left, 10, "helv"), (320, 100 + 20 * i, right, 10, "helv")]
+
+    sections = extract_text_from_pdf(_pdf(lines), mode="layout")["sections"]
+    assert sections["Education"] == "B.Tech Computer Science\nIIT Madras, 2024\nGPA 9.1 out of 10"
+    assert sections["Skills"] == "Python and SQL\nDocker and Kubernetes\nReact and Node.js"
+
+
+def test_unknown_mode_is_rejected():
+    with pytest.raises(ValueError):
+        extract_text_from_pdf(_pdf([]), mode="ocr")
@@ -0,0 +1,58 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+
+from services import pdf_parser, pdf_pool
+
+
+class FakeDoc:
+    """Each page takes a second of the fake clock to load."""
+
+    page_count = 3
+
+    def __init__(self):
+        self.now = 0.0
+
+    def load_page(self, index):
+        self.now += 1
+        return index
+
+
+def test_extraction_stops_at_the_deadline(monkeypatch):
+    doc = FakeDoc()
+    monkeypatch.setattr(pdf_parser, "time", SimpleNamespace(monotonic=lambda: doc.now))
+    pages = []
+    with pytest.raises(TimeoutError):
+        for page in pdf_parser._iter_pages(doc, timeout_seconds=1.5):
+            pages.append(page)
+    assert pages == [0, 1]
+
+
+def test_pool_gives_up_on_a_hung_worker(monkeypatch):
+    release = threading.Event()
+    pool = ThreadPoolExecutor(max_workers=1)
+
+    def hang(file_bytes, **kwargs):
+        release.wait(5)
+        return {}, 0.0
+
+    monkeypatch.setattr(pdf_pool, "_timed_extract", hang)
+    monkeypatch.setattr(pdf_pool, "_get_executor", lambda: pool)
+    monkeypatch.setattr(pdf_pool, "RESUME_CACHE_ENABLED", False)
+    monkeypatch.setattr(pdf_pool, "SINGLE_FLIGHT_ENABLED", False)
+    monkeypatch.setattr(pdf_pool, "PDF_PARSE_TIMEOUT_SECONDS", 0.05)
+    monkeypatch.setattr(pdf_pool, "_pending", None)
+
+    started = time.monotonic()
+    try:
+        with pytest.raises(TimeoutError):
+            asyncio.run(pdf_pool.parse_pdf(b"%PDF-hung"))
+        # PDF_PARSE_TIMEOUT_SECONDS plus the one second of slack
+        assert time.monotonic() - started < 2
+    finally:
+        release.set()
+        pool.shutdown()
@@ -0,0 +1,93 @@
+import asyncio
+
+import pytest
+
+from services.rate_limiter import (
+    BACKGROUND,
+    INTERACTIVE,
+    LLMBusyError,
+    RateLimiter,
+    TokenBucket,
+    parse_duration,
+)
+
+
+def test_bucket_refills_up_to_capacity():
+    bucket = TokenBucket(60)
+    now = bucket.updated
+    bucket.take(60, now)
+    assert bucket.wait_time(1, now) == pytest.approx(1.0)
+    bucket.refill(now + 30)
+    assert bucket.level == pytest.approx(30)
+    bucket.refill(now + 600)
+    assert bucket.level == 60
+
+
+def test_oversized_request_waits_for_a_full_bucket():
+    bucket = TokenBucket(60)
+    now = bucket.updated
+    bucket.take(30, now)
+    assert bucket.wait_time(1000, now) == pytest.approx(30.0)
+
+
+def test_settle_returns_unused_tokens():
+    async def run():
+        limiter = RateLimiter(rpm=60, tpm=1000, max_wait_seconds=10)
+        reservation = await limiter.acquire(400)
+        limiter.settle(reservation, 100)
+        return limiter.tokens.level
+
+    assert asyncio.run(run()) == pytest.approx(900, abs=1)
+
+
+def test_interactive_is_served_before_background():
+    async def run():
+        limiter = RateLimiter(rpm=600, tpm=1_000_000, max_wait_seconds=10)
+        limiter.requests.level = 0
+        order = []
+
+        async def call(name, priority):
+            await limiter.acquire(10, priority)
+            order.append(name)
+
+        background = [asyncio.create_task(call(f"bg{i}", BACKGROUND)) for i in range(3)]
+        await asyncio.sleep(0)
+        interactive = asyncio.create_task(call("ia", INTERACTIVE))
+        await asyncio.gather(*background, interactive)
+        return order
+
+    assert asyncio.run(run()) == ["ia", "bg0", "bg1", "bg2"]
+
+
+def test_too_long_a_wait_is_refused():
+    async def run():
+        limiter = RateLimiter(rpm=60, tpm=1_000_000, max_wait_seconds=0.5)
+        limiter.requests.level = 0
+        await limiter.acquire(10)
+
+    with pytest.raises(LLMBusyError) as excinfo:
+        asyncio.run(run())
+    assert excinfo.value.position == 1
+    assert excinfo.value.eta_seconds == pytest.approx(1.0, abs=0.05)
+
+
+def test_cancelled_waiter_leaves_the_queue():
+    async def run():
+        limiter = RateLimiter(rpm=600, tpm=1_000_000, max_wait_seconds=10)
+        limiter.requests.level = 0
+        first = asyncio.create_task(limiter.acquire(10))
+        second = asyncio.create_task(limiter.acquire(10))
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.wait_for(second, 1)
+        return limiter.status()["queued"]
+
+    assert asyncio.run(run()) == 0
+
+
+def test_parse_duration():
+    assert parse_duration("7.66s") == pytest.approx(7.66)
+    assert parse_duration("2m59.56s") == pytest.approx(179.56)
+    assert parse_duration("120ms") == pytest.approx(0.12)
+    assert parse_duration("3") == 3.0
+    assert parse_duration(None) is None
@@ -0,0 +1,39 @@
+from services.response_parser import parse_response, repair_json
+
+
+def test_valid_json_is_not_repaired():
+    assert repair_json('{"a": 1}') == ({"a": 1}, False)
+
+
+def test_strips_fences_and_chatter():
+    value, repaired = repair_json('Sure!\n```json\n{"a": [1, 2]}\n```\nHope that helps.')
+    assert value == {"a": [1, 2]}
+    assert repaired
+
+
+def test_trailing_commas():
+    assert repair_json('{"a": [1, 2,], "b": 3,}')[0] == {"a": [1, 2], "b": 3}
+
+
+def test_closes_truncated_containers():
+    assert repair_json('{"bullets": [{"x": 1}, {"x": 2}')[0] == {"bullets": [{"x": 1}, {"x": 2}]}
+
+
+def test_drops_string_cut_off_mid_way():
+    value, _ = repair_json('{"bullets": [{"x": "done"}, {"x": "half a bul')
+    assert value == {"bullets": [{"x": "done"}]}
+
+
+def test_dangling_key_becomes_null():
+    assert repair_json('{"a": 1, "b":')[0] == {"a": 1, "b": None}
+
+
+def test_nothing_recoverable():
+    assert repair_json("no json here") == (None, True)
+    assert repair_json("") == (None, True)
+
+
+def test_parse_response_reports_missing_required_fields():
+    parsed = parse_response('{"match_analysis": {}}', "bullets")
+    assert parsed.data is not None
+    assert "bullets" in parsed.missing
@@ -0,0 +1,62 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from services import pdf_pool, resume_cache
+
+PARSED = {"raw_text": "Jane Doe\nSkills\nPython", "sections": {"Skills": "Python"}, "page_count": 1}
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch):
+    monkeypatch.setattr(resume_cache, "_cache", None)
+
+
+def test_cached_parse_is_a_fresh_copy():
+    async def run():
+        await resume_cache.set_parsed("abc", PARSED)
+        first = await resume_cache.get_parsed("abc")
+        first["sections"]["Skills"] = "edited"
+        return await resume_cache.get_parsed("abc")
+
+    assert asyncio.run(run()) == PARSED
+
+
+def test_parser_version_bump_invalidates_entries(monkeypatch):
+    asyncio.run(resume_cache.set_parsed("abc", PARSED))
+    monkeypatch.setattr(resume_cache, "PARSER_VERSION", resume_cache.PARSER_VERSION + 1)
+    assert asyncio.run(resume_cache.get_parsed("abc")) is None
+    # The fresh parse replaces the stale entry
+    asyncio.run(resume_cache.set_parsed("abc", PARSED))
+    assert asyncio.run(resume_cache.get_parsed("abc")) == PARSED
+
+
+def test_extraction_mode_is_part_of_the_key(monkeypatch):
+    asyncio.run(resume_cache.set_parsed("abc", PARSED))
+    monkeypatch.setattr(resume_cache, "PDF_EXTRACTION_MODE", "layout")
+    assert asyncio.run(resume_cache.get_parsed("abc")) is None
+
+
+def test_reupload_skips_the_parser(monkeypatch):
+    extracted = []
+
+    def extract(file_bytes, **kwargs):
+        extracted.append(file_bytes)
+        return dict(PARSED), 0.01
+
+    pool = ThreadPoolExecutor(max_workers=1)
+    monkeypatch.setattr(pdf_pool, "_timed_extract", extract)
+    monkeypatch.setattr(pdf_pool, "_get_executor", lambda: pool)
+    monkeypatch.setattr(pdf_pool, "RESUME_CACHE_ENABLED", True)
+    monkeypatch.setattr(pdf_pool, "_pending", None)
+
+    async def run():
+        await pdf_pool.parse_pdf(b"%PDF-same")
+        return await pdf_pool.parse_pdf(b"%PDF-same")
+
+    try:
+        assert asyncio.run(run()) == PARSED
+    finally:
+        pool.shutdown()
+    assert extracted == [b"%PDF-same"]
@@ -0,0 +1,176 @@
+import asyncio
+import io
+import json
+
+import pytest
+from fastapi import FastAPI, UploadFile
+from fastapi.testclient import TestClient
+
+from routes import resume
+
+RESUME_TEXT = "Skills\nPython, React, SQL\n\nExperience\n- Built dashboards in React\n- Wrote Python ETL jobs"
+PARSED = {"raw_text": RESUME_TEXT, "sections": {"Skills": "Python, React, SQL"}}
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.include_router(resume.router, prefix="/api")
+    return TestClient(app)
+
+
+@pytest.fixture
+def fake_bullets(monkeypatch):
+    async def generate_bullets(parsed_resume, jd_text, resume_context=None):
+        if "fail" in jd_text:
+            raise RuntimeError("engine down")
+        return {
+            "bullets": [{"original": "Built dashboards", "rewritten": f"Built dashboards for {jd_text}"}],
+            "match_analysis": {"jd": jd_text},
+        }
+
+    monkeypatch.setattr(resume, "generate_bullets", generate_bullets)
+
+
+@pytest.fixture
+def fake_rewrites(monkeypatch):
+    seen = []
+
+    async def rewrite_bullets(master_resume_text, target_jd, target_experiences, resume_context=None):
+        seen.append(list(target_experiences))
+        return [{"optimized_bullet": f"new {e}", "honesty_check": "Pass"} for e in target_experiences], 1
+
+    monkeypatch.setattr(resume, "rewrite_bullets", rewrite_bullets)
+    return seen
+
+
+def test_batch_results_point_back_at_their_jd(client, fake_bullets):
+    jd_texts = ["Python data engineer", "fail: React developer", "SQL analyst"]
+    response = client.post("/api/generate-bullets/batch", json={"parsed_resume": PARSED, "jd_texts": jd_texts})
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert sorted(r["jd_index"] for r in results) == [0, 1, 2]
+    for result in results:
+        jd = jd_texts[result["jd_index"]]
+        assert result["jd_snippet"] == jd[:120]
+        if "fail" in jd:
+            assert "error" in result
+        else:
+            assert result["match_analysis"] == {"jd": jd}
+
+
+def test_batch_rejects_blank_jds(client, fake_bullets):
+    response = client.post(
+        "/api/generate-bullets/batch", json={"parsed_resume": PARSED, "jd_texts": ["", "Python developer", "  "]}
+    )
+    assert response.status_code == 400
+    assert "0, 2" in response.json()["detail"]
+
+
+def test_rewrite_results_keep_input_positions(client, fake_rewrites):
+    response = client.post("/api/rewrite-bullets", json={
+        "master_resume_text": RESUME_TEXT,
+        "target_jd": "React developer",
+        "target_experiences": ["Built dashboards in React", "  ", "Wrote Python ETL jobs"],
+    })
+    assert response.status_code == 200
+    body = response.json()
+    assert fake_rewrites == [["Built dashboards in React", "Wrote Python ETL jobs"]]
+    assert body["count"] == 3
+    first, blank, last = body["results"]
+    assert first["optimized_bullet"] == "new Built dashboards in React"
+    assert blank["skipped"] and "error" in blank
+    assert last["optimized_bullet"] == "new Wrote Python ETL jobs"
+
+
+def test_rewrite_needs_one_experience(client, fake_rewrites):
+    response = client.post("/api/rewrite-bullets", json={
+        "master_resume_text": RESUME_TEXT,
+        "target_jd": "React developer",
+        "target_experiences": ["", " "],
+    })
+    assert response.status_code == 400
+    assert fake_rewrites == []
+
+
+def test_failed_assessment_prep_is_not_cached(client, monkeypatch):
+    results = [{"error": "Failed to parse LLM response", "raw_response": "oops"}, {"rounds": ["aptitude"]}]
+    calls = []
+
+    async def generate_assessment_prep(target_jd):
+        calls.append(target_jd)
+        return results[len(calls) - 1]
+
+    monkeypatch.setattr(resume, "generate_assessment_prep", generate_assessment_prep)
+    jd = "Graduate engineer at Acme, online assessment then two interviews"
+
+    assert "error" in client.post("/api/assessment-prep", json={"target_jd": jd}).json()
+    assert client.post("/api/assessment-prep", json={"target_jd": jd}).json()["rounds"] == ["aptitude"]
+    # The good result is kept
+    assert client.post("/api/assessment-prep", json={"target_jd": jd}).json()["rounds"] == ["aptitude"]
+    assert len(calls) == 2
+
+
+def _events(response):
+    events = []
+    for block in response.text.strip().split("\n\n"):
+        name, data = block.split("\n")
+        events.append((name.removeprefix("event: "), json.loads(data.removeprefix("data: "))))
+    return events
+
+
+def _fake_stream(monkeypatch, fail=False):
+    bullet = {"original": "Built dashboards in React", "rewritten": "Built React dashboards"}
+
+    async def stream_bullets(parsed_resume, jd_text, resume_context=None):
+        yield "bullet", dict(bullet)
+        if fail:
+            raise RuntimeError("stream broke")
+        yield "result", {"bullets": [dict(bullet)], "match_analysis": {"fit": "good"}}
+
+    monkeypatch.setattr(resume, "stream_bullets", stream_bullets)
+
+
+def test_bullet_stream_event_order(client, monkeypatch):
+    _fake_stream(monkeypatch)
+    response = client.post("/api/generate-bullets/stream", json={"parsed_resume": PARSED, "jd_text": "React developer"})
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = _events(response)
+    assert [name for name, _ in events] == [
+        "keywords", "ats_baseline", "bullet", "match_analysis", "ats_scores", "done",
+    ]
+    assert "react" in events[0][1]["jd_keywords"]
+    assert events[2][1]["rewritten"] == "Built React dashboards"
+    assert events[-1][1]["status"] == "success"
+
+
+def test_bullet_stream_failure_becomes_an_error_event(client, monkeypatch):
+    _fake_stream(monkeypatch, fail=True)
+    response = client.post("/api/generate-bullets/stream", json={"parsed_resume": PARSED, "jd_text": "React developer"})
+    assert response.status_code == 200
+    name, data = _events(response)[-1]
+    assert name == "error"
+    assert "stream broke" in data["detail"]
+
+
+def test_oversized_upload_is_rejected_before_parsing(client, monkeypatch):
+    parsed = []
+
+    async def parse_pdf(contents):
+        parsed.append(contents)
+        return {}
+
+    monkeypatch.setattr(resume, "parse_pdf", parse_pdf)
+    monkeypatch.setattr(resume, "MAX_FILE_SIZE_MB", 1)
+    too_big = b"%PDF" + b"0" * (1024 * 1024)
+    response = client.post("/api/upload-resume", files={"file": ("cv.pdf", too_big, "application/pdf")})
+    assert response.status_code == 400
+    assert parsed == []
+
+
+def test_streamed_upload_stops_reading_past_the_cap():
+    # No declared size, so the cap is enforced while reading chunks
+    upload = UploadFile(io.BytesIO(b"x" * 100), size=None)
+    assert asyncio.run(resume._read_upload(upload, 99)) is None
+    upload = UploadFile(io.BytesIO(b"x" * 100), size=None)
+    assert asyncio.run(resume._read_upload(upload, 100)) == b"x" * 100
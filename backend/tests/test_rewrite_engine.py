@@ -0,0 +1,43 @@
+import asyncio
+import json
+
+from services import rewrite_engine
+
+RESUME = "Built REST APIs in Python and Flask serving 300 users. Cut load time by 40%."
+EXPERIENCE = "Built REST APIs in Python"
+
+
+def _stream(monkeypatch, doc):
+    text = json.dumps(doc)
+
+    async def stream_chat_completion(**kwargs):
+        for i in range(0, len(text), 7):
+            yield text[i:i + 7]
+
+    monkeypatch.setattr(rewrite_engine, "stream_chat_completion", stream_chat_completion)
+
+    async def collect():
+        return [event async for event in rewrite_engine.stream_rewrite(RESUME, "Backend JD", EXPERIENCE)]
+
+    return asyncio.run(collect())
+
+
+def test_stream_holds_back_unverified_bullets(monkeypatch):
+    events = _stream(monkeypatch, {
+        "optimized_bullet": "Built Django APIs for 5000 users",
+        "mapping_logic": "Reworded",
+        "honesty_check": "Pass",
+        "alternative_bullets": ["Built Flask REST APIs in Python for 300 users"],
+    })
+    fields = [value for kind, value in events if kind == "field"]
+    assert fields == [{"mapping_logic": "Reworded"}]
+    kind, result = events[-1]
+    assert kind == "result"
+    assert result["optimized_bullet"] == "Built Flask REST APIs in Python for 300 users"
+    assert result["honesty_check"] == "Pass"
+
+
+def test_stream_sends_a_passing_bullet_early(monkeypatch):
+    events = _stream(monkeypatch, {"optimized_bullet": "Built Python REST APIs for 300 users", "honesty_check": "Pass"})
+    assert events[0] == ("field", {"optimized_bullet": "Built Python REST APIs for 300 users"})
+    assert events[-1][1]["optimized_bullet"] == "Built Python REST APIs for 300 users"
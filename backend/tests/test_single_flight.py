@@ -0,0 +1,105 @@
+import asyncio
+
+import pytest
+
+from services.single_flight import SingleFlight
+
+
+def test_concurrent_callers_share_one_run():
+    async def run():
+        flight = SingleFlight("test")
+        calls = 0
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"value": 1}
+
+        results = await asyncio.gather(*(flight.do("k", work) for _ in range(5)))
+        return calls, results, flight.stats()
+
+    calls, results, stats = asyncio.run(run())
+    assert calls == 1
+    assert results == [{"value": 1}] * 5
+    assert stats["leaders"] == 1
+    assert stats["followers"] == 4
+    assert stats["in_flight"] == 0
+
+
+def test_every_caller_gets_its_own_copy():
+    async def run():
+        flight = SingleFlight("test")
+
+        async def work():
+            await asyncio.sleep(0.01)
+            return {"items": []}
+
+        async def leader():
+            result = await flight.do("k", work)
+            result["items"].append("leader")
+            return result
+
+        async def follower():
+            await asyncio.sleep(0)
+            return await flight.do("k", work)
+
+        return await asyncio.gather(leader(), follower())
+
+    leader, follower = asyncio.run(run())
+    assert leader == {"items": ["leader"]}
+    assert follower == {"items": []}
+
+
+def test_shared_results_when_copying_is_off():
+    async def run():
+        flight = SingleFlight("test", copy_results=False)
+
+        async def work():
+            await asyncio.sleep(0.01)
+            return {}
+
+        return await asyncio.gather(flight.do("k", work), flight.do("k", work))
+
+    first, second = asyncio.run(run())
+    assert first is second
+
+
+def test_errors_reach_every_caller_and_the_key_is_released():
+    async def run():
+        flight = SingleFlight("test")
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(flight.do("k", fail), flight.do("k", fail), return_exceptions=True)
+
+        async def ok():
+            return "fresh"
+
+        return results, await flight.do("k", ok)
+
+    results, after = asyncio.run(run())
+    assert all(isinstance(r, ValueError) for r in results)
+    assert after == "fresh"
+
+
+def test_leader_cancellation_does_not_cancel_followers():
+    async def run():
+        flight = SingleFlight("test")
+
+        async def work():
+            await asyncio.sleep(0.02)
+            return "done"
+
+        leader = asyncio.create_task(flight.do("k", work))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flight.do("k", work))
+        await asyncio.sleep(0)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await follower
+
+    assert asyncio.run(run()) == "done"
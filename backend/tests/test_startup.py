@@ -0,0 +1,39 @@
+import asyncio
+import os
+import subprocess
+import sys
+
+from services import warmup
+from services.startup_profile import profile_imports
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY_MODULES = ["openai", "firebase_admin", "fitz", "numpy", "scipy"]
+
+
+def test_importing_the_app_skips_heavy_dependencies():
+    code = f"import sys, main; print([m for m in {HEAVY_MODULES!r} if m in sys.modules])"
+    proc = subprocess.run([sys.executable, "-c", code], cwd=BACKEND_DIR, capture_output=True, text=True)
+    assert proc.returncode == 0, proc.stderr
+    assert proc.stdout.strip() == "[]"
+
+
+def test_import_profile_lists_first_party_modules():
+    total, by_package = profile_imports("main")
+    assert total > 0
+    assert "routes.resume" in by_package
+    assert "openai" not in by_package
+    assert sum(by_package.values()) <= total * 1.05
+
+
+def test_warm_up_reports_each_step(monkeypatch):
+    async def ok():
+        pass
+
+    async def broken():
+        raise RuntimeError("no credentials")
+
+    monkeypatch.setattr(warmup, "_warm_llm_client", ok)
+    monkeypatch.setattr(warmup, "warm_store", broken)
+    monkeypatch.setattr(warmup, "warm_pool", ok)
+    results = asyncio.run(warmup.warm_up(delay=0))
+    assert results == {"llm_client": True, "session_store": False, "pdf_pool": True}
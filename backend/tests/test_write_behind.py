@@ -0,0 +1,163 @@
+import asyncio
+import os
+
+from services.session_store import WriteBehindQueue
+
+
+class RecordingBackend:
+    def __init__(self):
+        self.batches = []
+
+    def save_sessions_batch(self, chunk):
+        self.batches.append([session_id for _, session_id, _ in chunk])
+
+    @property
+    def saved(self):
+        return [sid for batch in self.batches for sid in batch]
+
+
+def test_spool_is_replayed_after_a_crash(tmp_path):
+    async def crash():
+        queue = WriteBehindQueue(RecordingBackend(), str(tmp_path), max_batch=100, flush_seconds=60)
+        await queue.start()
+        for i in range(3):
+            await queue.put("u1", f"s{i}", {"i": i})
+        # Simulate dying mid-write: no stop(), and a torn final line
+        queue._flusher.cancel()
+        queue._spool.write('["u1", "s3", {"i"')
+        queue._spool.close()
+
+    async def restart():
+        backend = RecordingBackend()
+        queue = WriteBehindQueue(backend, str(tmp_path), max_batch=100, flush_seconds=60)
+        await queue.start()
+        assert [sid for sid, _ in queue.pending("u1")] == ["s0", "s1", "s2"]
+        await queue.stop()
+        return backend
+
+    asyncio.run(crash())
+    backend = asyncio.run(restart())
+    assert backend.saved == ["s0", "s1", "s2"]
+    assert not [name for name in os.listdir(tmp_path) if name.startswith("segment-")]
+
+
+def test_recovered_segment_is_split_to_the_batch_limit(tmp_path):
+    (tmp_path / "segment-1.jsonl").write_text(
+        "".join(f'["u{i % 2}", "s{i}", {{}}]\n' for i in range(7)), encoding="utf-8"
+    )
+
+    async def run():
+        backend = RecordingBackend()
+        queue = WriteBehindQueue(backend, str(tmp_path), max_batch=4, flush_seconds=60)
+        await queue.start()
+        await queue.stop()
+        return backend
+
+    backend = asyncio.run(run())
+    assert backend.saved == [f"s{i}" for i in range(7)]
+    # Each batch holds its sessions plus one aggregate write per user
+    assert all(len(batch) + len({int(sid[1:]) % 2 for sid in batch}) <= 4 for batch in backend.batches)
+
+
+def test_full_batch_is_flushed_in_the_background(tmp_path):
+    async def run():
+        backend = RecordingBackend()
+        queue = WriteBehindQueue(backend, str(tmp_path), max_batch=3, flush_seconds=60)
+        await queue.start()
+        for i in range(2):
+            await queue.put("u1", f"s{i}", {})
+        assert backend.saved == []
+        await asyncio.sleep(0.1)
+        saved = list(backend.saved)
+        await queue.stop()
+        return saved
+
+    assert asyncio.run(run()) == ["s0", "s1"]
+
+
+class FlakyBackend(RecordingBackend):
+    """Fails any batch containing a session in fail_on."""
+
+    def __init__(self, fail_on=()):
+        super().__init__()
+        self.fail_on = set(fail_on)
+
+    def save_sessions_batch(self, chunk):
+        if self.fail_on & {session_id for _, session_id, _ in chunk}:
+            raise RuntimeError("commit failed")
+        super().save_sessions_batch(chunk)
+
+
+def _write_segment(tmp_path, name, session_ids):
+    (tmp_path / f"segment-{name}.jsonl").write_text(
+        "".join(f'["u1", "{sid}", {{}}]\n' for sid in session_ids), encoding="utf-8"
+    )
+
+
+def test_retry_resumes_after_committed_chunks(tmp_path):
+    _write_segment(tmp_path, "1", [f"s{i}" for i in range(6)])
+
+    async def run():
+        backend = FlakyBackend(fail_on={"s4"})
+        queue = WriteBehindQueue(backend, str(tmp_path), max_batch=3, flush_seconds=60)
+        await queue.start()
+        await queue.flush()
+        backend.fail_on.clear()
+        await queue.stop()
+        return backend
+
+    backend = asyncio.run(run())
+    # Two sessions per batch (plus the aggregate write); the first two batches are not repeated
+    assert backend.batches == [["s0", "s1"], ["s2", "s3"], ["s4", "s5"]]
+    assert os.listdir(tmp_path) == ["spool.jsonl"]
+
+
+def test_committed_chunks_are_skipped_after_a_restart(tmp_path):
+    _write_segment(tmp_path, "1", [f"s{i}" for i in range(6)])
+
+    async def run(backend):
+        queue = WriteBehindQueue(backend, str(tmp_path), max_batch=3, flush_seconds=60)
+        await queue.start()
+        await queue.flush()
+        queue._flusher.cancel()
+
+    asyncio.run(run(FlakyBackend(fail_on={"s4"})))
+    backend = RecordingBackend()
+    asyncio.run(run(backend))
+    assert backend.batches == [["s4", "s5"]]
+
+
+def test_poison_segment_is_moved_aside(tmp_path):
+    _write_segment(tmp_path, "1", ["bad"])
+    _write_segment(tmp_path, "2", ["s1"])
+
+    async def run():
+        backend = FlakyBackend(fail_on={"bad"})
+        queue = WriteBehindQueue(backend, str(tmp_path), max_batch=10, flush_seconds=60, max_attempts=2)
+        await queue.start()
+        await queue.flush()
+        assert backend.saved == []
+        await queue.flush()
+        await queue.stop()
+        return backend
+
+    backend = asyncio.run(run())
+    assert backend.saved == ["s1"]
+    assert sorted(os.listdir(tmp_path)) == ["failed-1.jsonl", "spool.jsonl"]
+
+
+def test_segments_are_kept_while_the_store_is_down(tmp_path):
+    _write_segment(tmp_path, "1", ["s0"])
+    _write_segment(tmp_path, "2", ["s1"])
+
+    async def run():
+        backend = FlakyBackend(fail_on={"s0", "s1"})
+        queue = WriteBehindQueue(backend, str(tmp_path), max_batch=10, flush_seconds=60, max_attempts=2)
+        await queue.start()
+        for _ in range(3):
+            await queue.flush()
+        backend.fail_on.clear()
+        await queue.stop()
+        return backend
+
+    assert asyncio.run(run()).saved == ["s0", "s1"]
@@ -5,6 +5,7 @@ export default function ResultsPanel({ bullets, matchAnalysis, masterResumeText,
     const [copiedIndex, setCopiedIndex] = useState(null)
     const [rewriteResults, setRewriteResults] = useState({})
     const [rewriteLoading, setRewriteLoading] = useState({})
+    const [rewriteAllLoading, setRewriteAllLoading] = useState(false)
 
     const copyToClipboard = (text, index) => {
         navigator.clipboard.writeText(text).then(() => {
@@ -43,6 +44,42 @@ export default function ResultsPanel({ bullets, matchAnalysis, masterResumeText,
         }
     }
 
+    const handleRewriteAll = async () => {
+        if (rewriteAllLoading) return
+        setRewriteAllLoading(true)
+        const allLoading = Object.fromEntries(bullets.map((_, i) => [i, true]))
+        setRewriteLoading(allLoading)
+
+        try {
+            // One request (and one LLM call) for every bullet
+            const response = await fetch(`${API_BASE_URL}/api/rewrite-bullets`, {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json' },
+                body: JSON.stringify({
+                    master_resume_text: masterResumeText,
+                    target_jd: jdText,
+                    target_experiences: bullets.map(b => b.original || b.rewritten),
+                }),
+            })
+            if (!response.ok) {
+                const errData = await response.json().catch(() => ({}))
+                throw new Error(errData.detail || 'Rewrite failed')
+            }
+            const data = await response.json()
+            setRewriteResults(Object.fromEntries(
+                data.results.map((result, i) => [
+                    i,
+                    result.error ? { error: 'Rewrite failed for this bullet. Try it on its own.' } : result,
+                ])
+            ))
+        } catch (err) {
+            setRewriteResults(Object.fromEntries(bullets.map((_, i) => [i, { error: err.message }])))
+        } finally {
+            setRewriteLoading({})
+            setRewriteAllLoading(false)
+        }
+    }
+
     if (!bullets || bullets.length === 0) {
         return (
             <div className="results-empty">
@@ -57,6 +94,20 @@ export default function ResultsPanel({ bullets, matchAnalysis, masterResumeText,
             <p className="section-subtitle">
                 Each rewrite uses <strong>only</strong> your real experience — rephrased for this specific JD.
             </p>
+            {bullets.length > 1 && (
+                <button
+                    className="rewrite-btn rewrite-all-btn"
+                    onClick={handleRewriteAll}
+                    disabled={rewriteAllLoading}
+                    title="Deep rewrite of every bullet with honesty check"
+                >
+                    {rewriteAllLoading ? (
+                        <><span className="spinner-sm" /> Rewriting all...</>
+                    ) : (
+                        'Rewrite all'
+                    )}
+                </button>
+            )}
 
             <div className="bullets-list">
                 {bullets.map((bullet, index) => (
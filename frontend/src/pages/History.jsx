@@ -6,23 +6,40 @@ import ATSScore from '../components/ATSScore';
 import ResultsPanel from '../components/ResultsPanel';
 import './History.css';
 
+const PAGE_SIZE = 20;
+
 export default function History() {
     const { currentUser } = useAuth();
     const [sessions, setSessions] = useState([]);
     const [loading, setLoading] = useState(true);
     const [selectedSession, setSelectedSession] = useState(null);
+    const [nextCursor, setNextCursor] = useState(null);
+    const [loadingMore, setLoadingMore] = useState(false);
+    const [openingId, setOpeningId] = useState(null);
+
+    // List view only needs summary fields; full sessions load on click
+    async function fetchPage(cursor) {
+        const params = new URLSearchParams({
+            user_id: currentUser.uid,
+            summary: 'true',
+            limit: String(PAGE_SIZE),
+        });
+        if (cursor) params.set('cursor', cursor);
+
+        const res = await fetch(`${API_BASE_URL}/api/history?${params}`);
+        if (!res.ok) return null;
+        return res.json();
+    }
 
     useEffect(() => {
         if (!currentUser) return;
 
         async function fetchSessions() {
             try {
-                const res = await fetch(
-                    `${API_BASE_URL}/api/history?user_id=${currentUser.uid}`
-                );
-                if (res.ok) {
-                    const data = await res.json();
+                const data = await fetchPage(null);
+                if (data) {
                     setSessions(data.sessions || []);
+                    setNextCursor(data.next_cursor || null);
                 }
             } catch (err) {
                 console.error('Failed to fetch history:', err);
@@ -34,6 +51,38 @@ export default function History() {
         fetchSessions();
     }, [currentUser]);
 
+    async function loadMore() {
+        setLoadingMore(true);
+        try {
+            const data = await fetchPage(nextCursor);
+            if (data) {
+                setSessions((prev) => [...prev, ...(data.sessions || [])]);
+                setNextCursor(data.next_cursor || null);
+            }
+        } catch (err) {
+            console.error('Failed to fetch history:', err);
+        } finally {
+            setLoadingMore(false);
+        }
+    }
+
+    async function openSession(session) {
+        setOpeningId(session.id);
+        try {
+            const res = await fetch(
+                `${API_BASE_URL}/api/history/${session.id}?user_id=${currentUser.uid}`
+            );
+            if (res.ok) {
+                const data = await res.json();
+                setSelectedSession(data.session);
+            }
+        } catch (err) {
+            console.error('Failed to fetch session:', err);
+        } finally {
+            setOpeningId(null);
+        }
+    }
+
     function formatDate(isoStr) {
         try {
             const d = new Date(isoStr);
@@ -118,7 +167,8 @@ export default function History() {
                     </Link>
                     <h1 className="history-title">History</h1>
                     <span className="history-count">
-                        {sessions.length} session{sessions.length !== 1 ? 's' : ''}
+                        {sessions.length}{nextCursor ? '+' : ''} session
+                        {sessions.length !== 1 ? 's' : ''}
                     </span>
                 </div>
             </header>
@@ -152,8 +202,8 @@ export default function History() {
                         {sessions.map((session) => (
                             <div
                                 key={session.id}
-                                className="history-card"
-                                onClick={() => setSelectedSession(session)}
+                                className={`history-card${openingId === session.id ? ' opening' : ''}`}
+                                onClick={() => openSession(session)}
                             >
                                 <div className="history-card-header">
                                     <span className="history-card-date">
@@ -170,15 +220,24 @@ export default function History() {
                                 </p>
                                 <div className="history-card-meta">
                                     <span>
-                                        {session.bullets?.length || 0} bullet
-                                        {(session.bullets?.length || 0) !== 1 ? 's' : ''}
-                                    </span>
-                                    <span>
-                                        {session.jd_keywords?.length || 0} keywords matched
+                                        {session.bullet_count ?? 0} bullet
+                                        {(session.bullet_count ?? 0) !== 1 ? 's' : ''}
                                     </span>
+                                    {session.keyword_count != null && (
+                                        <span>{session.keyword_count} keywords matched</span>
+                                    )}
                                 </div>
                             </div>
                         ))}
+                        {nextCursor && (
+                            <button
+                                className="history-load-more"
+                                onClick={loadMore}
+                                disabled={loadingMore}
+                            >
+                                {loadingMore ? 'Loading...' : 'Load more'}
+                            </button>
+                        )}
                     </div>
                 )}
             </div>